@@ -0,0 +1,47 @@
+"""add trigram search indexes
+
+Revision ID: 9c2f4e7a1b3d
+Revises: 60fad123d259
+Create Date: 2026-10-17 10:15:42.118304
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "9c2f4e7a1b3d"
+down_revision: Union[str, None] = "60fad123d259"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+TRGM_INDEXES = (
+    ("ix_tasks_title_trgm", "tasks", "title"),
+    ("ix_tasks_description_trgm", "tasks", "description"),
+    ("ix_employees_fullname_trgm", "employees", "fullname"),
+    ("ix_employees_position_trgm", "employees", "position"),
+)
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    for name, table, column in TRGM_INDEXES:
+        op.create_index(
+            name,
+            table,
+            [column],
+            unique=False,
+            postgresql_using="gin",
+            postgresql_ops={column: "gin_trgm_ops"},
+        )
+    op.create_index(op.f("ix_tasks_label"), "tasks", ["label"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_tasks_label"), table_name="tasks")
+    for name, table, _ in reversed(TRGM_INDEXES):
+        op.drop_index(name, table_name=table)
@@ -0,0 +1,60 @@
+"""convert task dates to timestamptz
+
+Revision ID: 5e81b0d6c4a2
+Revises: 9c2f4e7a1b3d
+Create Date: 2026-10-17 11:40:07.530127
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5e81b0d6c4a2"
+down_revision: Union[str, None] = "9c2f4e7a1b3d"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SERVER_DEFAULTS = {
+    "created_at": sa.text("now()"),
+    "last_update": sa.text("now()"),
+    "completed_at": sa.text("now() + interval '7 days'"),
+}
+
+
+def upgrade() -> None:
+    # Строки вида "YYYY-MM-DD HH:MM[:SS]" приводятся в часовом поясе сессии
+    for column, server_default in SERVER_DEFAULTS.items():
+        op.alter_column(
+            "tasks",
+            column,
+            existing_type=sa.String(),
+            type_=sa.DateTime(timezone=True),
+            existing_nullable=False,
+            server_default=server_default,
+            postgresql_using=f"{column}::timestamptz",
+        )
+
+    op.create_index(op.f("ix_tasks_created_at"), "tasks", ["created_at"], unique=False)
+    op.create_index(
+        op.f("ix_tasks_completed_at"), "tasks", ["completed_at"], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_tasks_completed_at"), table_name="tasks")
+    op.drop_index(op.f("ix_tasks_created_at"), table_name="tasks")
+
+    for column in SERVER_DEFAULTS:
+        op.alter_column(
+            "tasks",
+            column,
+            existing_type=sa.DateTime(timezone=True),
+            type_=sa.String(),
+            existing_nullable=False,
+            server_default=None,
+            postgresql_using=f"to_char({column}, 'YYYY-MM-DD HH24:MI:SS')",
+        )
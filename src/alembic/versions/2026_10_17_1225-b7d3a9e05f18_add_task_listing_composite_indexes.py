@@ -0,0 +1,39 @@
+"""add task listing composite indexes
+
+Revision ID: b7d3a9e05f18
+Revises: 5e81b0d6c4a2
+Create Date: 2026-10-17 12:25:51.904416
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b7d3a9e05f18"
+down_revision: Union[str, None] = "5e81b0d6c4a2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_tasks_status_priority_id",
+        "tasks",
+        ["status", "priority", "id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_tasks_employee_id_status",
+        "tasks",
+        ["employee_id", "status"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_tasks_employee_id_status", table_name="tasks")
+    op.drop_index("ix_tasks_status_priority_id", table_name="tasks")
@@ -0,0 +1,110 @@
+"""add task change tracking
+
+Revision ID: 8d1e5b7a2c60
+Revises: 3f6a8c2d9e14
+Create Date: 2026-10-17 13:55:08.241967
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "8d1e5b7a2c60"
+down_revision: Union[str, None] = "3f6a8c2d9e14"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "tasks",
+        sa.Column(
+            "updated_seq",
+            sa.BigInteger(),
+            server_default=sa.text("pg_current_xact_id()::text::bigint"),
+            nullable=False,
+        ),
+    )
+    op.create_index(
+        "ix_tasks_updated_seq_id",
+        "tasks",
+        ["updated_seq", "id"],
+        unique=False,
+    )
+    op.create_table(
+        "task_tombstones",
+        sa.Column("id", sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column("deleted_seq", sa.BigInteger(), nullable=False),
+        sa.Column(
+            "deleted_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.text("now()"),
+            nullable=False,
+        ),
+        sa.PrimaryKeyConstraint("id", name=op.f("pk_task_tombstones")),
+    )
+    op.create_index(
+        "ix_task_tombstones_deleted_seq_id",
+        "task_tombstones",
+        ["deleted_seq", "id"],
+        unique=False,
+    )
+
+    # Номер транзакции изменения: по нему клиент получает изменения после
+    # своего токена синхронизации
+    op.execute(
+        """
+        CREATE FUNCTION tasks_set_updated_seq() RETURNS trigger AS $$
+        BEGIN
+            NEW.updated_seq := pg_current_xact_id()::text::bigint;
+            RETURN NEW;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER tasks_updated_seq
+        BEFORE INSERT OR UPDATE ON tasks
+        FOR EACH ROW EXECUTE FUNCTION tasks_set_updated_seq()
+        """
+    )
+    # Триггер уровня оператора: массовое удаление записывает отметки
+    # одним INSERT ... SELECT из переходной таблицы
+    op.execute(
+        """
+        CREATE FUNCTION tasks_record_tombstones() RETURNS trigger AS $$
+        BEGIN
+            INSERT INTO task_tombstones (id, deleted_seq)
+            SELECT id, pg_current_xact_id()::text::bigint FROM deleted_tasks
+            ON CONFLICT (id) DO UPDATE SET
+                deleted_seq = EXCLUDED.deleted_seq,
+                deleted_at = now();
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+        """
+    )
+    op.execute(
+        """
+        CREATE TRIGGER tasks_tombstones
+        AFTER DELETE ON tasks
+        REFERENCING OLD TABLE AS deleted_tasks
+        FOR EACH STATEMENT EXECUTE FUNCTION tasks_record_tombstones()
+        """
+    )
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER tasks_tombstones ON tasks")
+    op.execute("DROP FUNCTION tasks_record_tombstones()")
+    op.execute("DROP TRIGGER tasks_updated_seq ON tasks")
+    op.execute("DROP FUNCTION tasks_set_updated_seq()")
+    op.drop_index("ix_task_tombstones_deleted_seq_id", table_name="task_tombstones")
+    op.drop_table("task_tombstones")
+    op.drop_index("ix_tasks_updated_seq_id", table_name="tasks")
+    op.drop_column("tasks", "updated_seq")
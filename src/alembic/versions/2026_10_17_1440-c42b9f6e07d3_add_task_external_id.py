@@ -0,0 +1,36 @@
+"""add task external id
+
+Revision ID: c42b9f6e07d3
+Revises: 8d1e5b7a2c60
+Create Date: 2026-10-17 14:40:19.662841
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c42b9f6e07d3"
+down_revision: Union[str, None] = "8d1e5b7a2c60"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "tasks",
+        sa.Column("external_id", sa.String(length=100), nullable=True),
+    )
+    op.create_unique_constraint(
+        op.f("uq_tasks_external_id"),
+        "tasks",
+        ["external_id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint(op.f("uq_tasks_external_id"), "tasks", type_="unique")
+    op.drop_column("tasks", "external_id")
@@ -0,0 +1,31 @@
+"""add task tombstones deleted_at index
+
+Revision ID: 5b9e2d4a7f18
+Revises: c42b9f6e07d3
+Create Date: 2026-10-17 17:20:41.208317
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5b9e2d4a7f18"
+down_revision: Union[str, None] = "c42b9f6e07d3"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        op.f("ix_task_tombstones_deleted_at"),
+        "task_tombstones",
+        ["deleted_at"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index(op.f("ix_task_tombstones_deleted_at"), table_name="task_tombstones")
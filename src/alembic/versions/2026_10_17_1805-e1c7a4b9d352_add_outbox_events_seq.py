@@ -0,0 +1,44 @@
+"""add outbox events seq
+
+Revision ID: e1c7a4b9d352
+Revises: 5b9e2d4a7f18
+Create Date: 2026-10-17 18:05:13.774102
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e1c7a4b9d352"
+down_revision: Union[str, None] = "5b9e2d4a7f18"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Номер транзакции события: лента читается по (seq, id) только до
+    # pg_snapshot_xmin, поэтому ID откатившихся транзакций ее не задерживают
+    op.add_column(
+        "outbox_events",
+        sa.Column(
+            "seq",
+            sa.BigInteger(),
+            server_default=sa.text("pg_current_xact_id()::text::bigint"),
+            nullable=False,
+        ),
+    )
+    op.create_index(
+        "ix_outbox_events_seq_id",
+        "outbox_events",
+        ["seq", "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_outbox_events_seq_id", table_name="outbox_events")
+    op.drop_column("outbox_events", "seq")
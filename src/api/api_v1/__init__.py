@@ -1,6 +1,9 @@
 from fastapi import APIRouter
 from core.config import settings
 from .employees import router as employees_router
+from .events import router as events_router
+from .jobs import router as jobs_router
+from .service import router as service_router
 from .task import router as task_router
 
 router = APIRouter(
@@ -14,3 +17,15 @@ router.include_router(
     task_router,
     prefix=settings.api.v1.tasks,
 )
+router.include_router(
+    service_router,
+    prefix=settings.api.v1.service,
+)
+router.include_router(
+    events_router,
+    prefix=settings.api.v1.events,
+)
+router.include_router(
+    jobs_router,
+    prefix=settings.api.v1.jobs,
+)
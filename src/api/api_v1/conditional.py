@@ -0,0 +1,90 @@
+import hashlib
+
+from fastapi import Request, Response
+from sqlalchemy import Text, cast, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.cache import ReadCache, read_cache
+from core.models import replica_synced_at
+
+# Снимок транзакций источника чтения: меняется при завершении любой
+# пишущей транзакции, поэтому совпадение снимков означает, что данные
+# не изменились. Запрос не читает таблицы и работает на репликах
+current_snapshot = select(cast(func.pg_current_snapshot(), Text))
+
+
+async def make_etag(
+    request: Request,
+    *namespaces: str,
+    db: AsyncSession | None = None,
+    cache: ReadCache = read_cache,
+    extra: str = "",
+) -> str | None:
+    """
+    Построение слабого ETag по версии данных и параметрам запроса.
+
+    С общим хранилищем кэша (Redis) версия — номера версий пространств
+    имен, которые увеличиваются методами записи CRUD-классов, и ETag
+    вычисляется без обращения к базе данных. Хранилище в памяти процесса
+    не учитывает записи других воркеров и CLI, поэтому без общего хранилища
+    (и для реплики, еще не воспроизведшей последнюю запись) версией служит
+    снимок транзакций источника чтения: это один легкий запрос к базе.
+
+    :param request: входящий запрос
+    :param namespaces: пространства имен кэша, от которых зависит ответ
+    :param db: сессия, из которой читается ответ
+    :param cache: кэш чтения с версиями пространств имен
+    :param extra: прочие данные, от которых зависит ответ (например, момент расчета)
+    :return: значение заголовка ETag или None, если ETag не выдается
+    """
+    synced_at = None if db is None else replica_synced_at(db)
+    if cache.shared and await cache.is_fresh(synced_at, *namespaces):
+        versions = [str(await cache.version(namespace)) for namespace in namespaces]
+    elif db is not None:
+        snapshot = await db.scalar(current_snapshot)
+        versions = ["s" + hashlib.sha1(snapshot.encode()).hexdigest()[:16]]
+    else:
+        return None
+
+    digest = hashlib.sha1(
+        f"{request.url.path}?{request.url.query}#{extra}".encode()
+    ).hexdigest()[:16]
+    return f'W/"{"-".join(versions)}-{digest}"'
+
+
+def etag_headers(etag: str | None) -> dict[str, str]:
+    """
+    Заголовки ответа с ETag (пустые, если ETag не выдается).
+
+    :param etag: текущий ETag ресурса
+    :return: словарь заголовков
+    """
+    return {"ETag": etag} if etag else {}
+
+
+def is_not_modified(request: Request, etag: str | None) -> bool:
+    """
+    Проверка заголовка If-None-Match (слабое сравнение, RFC 9110).
+
+    :param request: входящий запрос
+    :param etag: текущий ETag ресурса
+    :return: True, если у клиента актуальная версия ответа
+    """
+    header = request.headers.get("if-none-match")
+    if not header or etag is None:
+        return False
+    if header.strip() == "*":
+        return True
+
+    current = etag.removeprefix("W/")
+    return any(tag.strip().removeprefix("W/") == current for tag in header.split(","))
+
+
+def not_modified_response(etag: str) -> Response:
+    """
+    Ответ 304 Not Modified без тела.
+
+    :param etag: текущий ETag ресурса
+    :return: экземпляр Response
+    """
+    return Response(status_code=304, headers={"ETag": etag})
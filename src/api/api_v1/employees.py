@@ -1,12 +1,30 @@
 import logging
-from typing import Annotated, List
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy import Sequence
+from typing import Annotated, List, Literal, Optional, Union
+from fastapi import APIRouter, Body, Depends, HTTPException, Query, Request, Response
+from pydantic import Field
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from core.config import settings
+from core.jobs import Job
 from core.models import db_helper
-from core.schemas import EmployeeRequest, EmployeeResponse
-from crud.employees import get_employee_manager
+from core.monitoring import TimedORJSONResponse
+from core.schemas import (
+    EmployeeRequest,
+    EmployeeResponse,
+    EmployeeSummary,
+    EmployeeWithTasks,
+    EmployeeWorkload,
+    Page,
+    TaskReassignment,
+)
+from crud.employees import get_employee_manager, workload_as_of
+from .conditional import (
+    etag_headers,
+    is_not_modified,
+    make_etag,
+    not_modified_response,
+)
+from .jobs import submit_job
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/manager/employees", tags=["Employees"])
@@ -44,21 +62,45 @@ async def create_employee(
     path="/all",
     summary="Get all employees",
     status_code=200,
-    response_model=List[EmployeeResponse],
+    response_model=Annotated[
+        Union[Page[EmployeeWithTasks], Page[EmployeeSummary]],
+        Field(union_mode="left_to_right"),
+    ],
 )
 async def get_all_employees(
-    db: Annotated[AsyncSession, Depends(db_helper.session_getter)]
-) -> Sequence[EmployeeResponse]:
+    request: Request,
+    db: Annotated[AsyncSession, Depends(db_helper.read_session_getter)],
+    limit: Annotated[
+        int, Query(ge=1, le=settings.pagination.max_limit)
+    ] = settings.pagination.default_limit,
+    cursor: Optional[str] = None,
+    include: Optional[Literal["tasks"]] = None,
+) -> Response:
     """
-    Получение всех сотрудников.
+    Получение сотрудников постранично, в порядке возрастания идентификатора.
 
+    :param request: входящий запрос (учитывается If-None-Match)
     :param db: сеанс базы данных
-    :return: список сотрудников (экземпляры EmployeeResponse)
+    :param limit: максимальное количество сотрудников на странице
+    :param cursor: курсор следующей страницы из предыдущего ответа
+    :param include: "tasks" — добавить к сотрудникам списки их задач
+    :return: страница сотрудников (экземпляры EmployeeSummary или EmployeeWithTasks)
+        и курсор следующей страницы
     """
     try:
+        etag = await make_etag(request, "employees", db=db)
+        if is_not_modified(request, etag):
+            return not_modified_response(etag)
+
         manager = await get_employee_manager(db=db)
-        all_employees = await manager.crud.get_all()
-        return all_employees
+        all_employees = await manager.crud.get_all(
+            limit=limit, cursor=cursor, include_tasks=include == "tasks"
+        )
+        return TimedORJSONResponse(content=all_employees, headers=etag_headers(etag))
+
+    except ValueError as ve:
+        logger.error(f"Invalid cursor for employees page: {ve}")
+        raise HTTPException(status_code=422, detail=str(ve))
 
     except Exception as exc:
         logger.error(f"Error retrieving employees: {exc}")
@@ -69,23 +111,43 @@ async def get_all_employees(
     path="/query",
     summary="Get employees by query",
     status_code=200,
-    response_model=List[EmployeeResponse],
+    response_model=Annotated[
+        Union[List[EmployeeWithTasks], List[EmployeeSummary]],
+        Field(union_mode="left_to_right"),
+    ],
 )
 async def get_employees_by_query(
-    query: str, db: Annotated[AsyncSession, Depends(db_helper.session_getter)]
-) -> Sequence[EmployeeResponse]:
+    query: str,
+    request: Request,
+    db: Annotated[AsyncSession, Depends(db_helper.read_session_getter)],
+    limit: Annotated[
+        int, Query(ge=1, le=settings.pagination.max_limit)
+    ] = settings.pagination.default_limit,
+    include: Optional[Literal["tasks"]] = None,
+) -> Response:
     """
-    Получение сотрудников на основе запроса.
+    Получение сотрудников на основе запроса, наиболее релевантные первыми.
 
     :param query: поисковый запрос
+    :param request: входящий запрос (учитывается If-None-Match)
     :param db: сеанс базы данных
-    :return: список сотрудников (экземпляры EmployeeResponse)
+    :param limit: максимальное количество сотрудников в ответе
+    :param include: "tasks" — добавить к сотрудникам списки их задач
+    :return: список сотрудников (экземпляры EmployeeSummary или EmployeeWithTasks)
     """
     try:
+        etag = await make_etag(request, "employees", db=db)
+        if is_not_modified(request, etag):
+            return not_modified_response(etag)
+
         manager = await get_employee_manager(db=db)
-        employees_by_query = await manager.crud.get_by_query(query=query)
+        employees_by_query = await manager.crud.get_by_query(
+            query=query, limit=limit, include_tasks=include == "tasks"
+        )
 
-        return employees_by_query
+        return TimedORJSONResponse(
+            content=employees_by_query, headers=etag_headers(etag)
+        )
 
     except Exception as exc:
         logger.error(f"Error retrieving employees by query: {exc}")
@@ -94,6 +156,48 @@ async def get_employees_by_query(
         )
 
 
+@router.get(
+    path="/workload",
+    summary="Get task counts per employee",
+    status_code=200,
+    response_model=List[EmployeeWorkload],
+)
+async def get_employees_workload(
+    request: Request,
+    db: Annotated[AsyncSession, Depends(db_helper.read_session_getter)],
+) -> Response:
+    """
+    Получение нагрузки сотрудников: количество задач по статусам и приоритетам,
+    открытые и просроченные задачи. Просроченные задачи считаются на начало
+    текущего интервала (settings.cache.workload_interval), от которого
+    зависит и ETag.
+
+    :param request: входящий запрос (учитывается If-None-Match)
+    :param db: сеанс базы данных
+    :return: список сводок по сотрудникам (экземпляры EmployeeWorkload)
+    """
+    try:
+        as_of = workload_as_of()
+        etag = await make_etag(
+            request,
+            "employees",
+            extra=as_of.isoformat(),
+            db=db,
+        )
+        if is_not_modified(request, etag):
+            return not_modified_response(etag)
+
+        manager = await get_employee_manager(db=db)
+        workload = await manager.crud.get_workload(as_of=as_of)
+        return TimedORJSONResponse(content=workload, headers=etag_headers(etag))
+
+    except Exception as exc:
+        logger.error(f"Error retrieving employees workload: {exc}")
+        raise HTTPException(
+            status_code=500, detail="Failed to retrieve employees workload"
+        )
+
+
 @router.put(
     path="/update/{employee_id}",
     summary="Update employee by id",
@@ -127,6 +231,114 @@ async def update_employee(
         )
 
 
+@router.put(
+    path="/upsert",
+    summary="Create or update employee by email",
+    status_code=200,
+    response_model=dict,
+)
+async def upsert_employee(
+    employee: EmployeeRequest,
+    response: Response,
+    db: Annotated[AsyncSession, Depends(db_helper.session_getter)],
+) -> dict[str, int | str | bool]:
+    """
+    Создание сотрудника или обновление существующего с тем же email
+    (без email — с тем же ФИО). Повтор запроса не создает дубликатов.
+
+    :param employee: экземпляр модели pydantic EmployeeRequest
+    :param response: ответ (статус 201, если сотрудник создан)
+    :param db: сеанс базы данных
+    :return: ID сотрудника и признак его создания
+    """
+    try:
+        manager = await get_employee_manager(db=db)
+        upserted = await manager.crud.upsert(employee=employee)
+        response.status_code = upserted["status"]
+        return upserted
+
+    except Exception as exc:
+        logger.error(f"Error upserting employee: {exc}")
+        raise HTTPException(status_code=500, detail="Failed to upsert employee")
+
+
+@router.put(
+    path="/reassign",
+    summary="Reassign tasks of an employee",
+    status_code=200,
+    response_model=dict,
+)
+async def reassign_tasks(
+    reassignment: TaskReassignment,
+    response: Response,
+    db: Annotated[AsyncSession, Depends(db_helper.session_getter)],
+    background: bool = False,
+) -> dict[str, int | str | dict]:
+    """
+    Передача задач сотрудника (например, перед его удалением) одному или
+    нескольким сотрудникам: всем одному, по очереди или наименее загруженным.
+
+    :param reassignment: исходный сотрудник, новые исполнители и способ распределения
+    :param response: ответ (статус 202 для фонового задания)
+    :param db: сеанс базы данных
+    :param background: выполнить фоновым заданием и сразу вернуть его ID
+    :return: количество переданных задач, в том числе по новым исполнителям
+    """
+    if background:
+
+        async def reassign(job: Job) -> dict[str, int | str | dict]:
+            async with db_helper.session_factory() as session:
+                manager = await get_employee_manager(db=session)
+                return await manager.crud.reassign_tasks(reassignment=reassignment)
+
+        response.status_code = 202
+        return submit_job(
+            "reassign_tasks",
+            reassign,
+            message=f"Reassignment of tasks of employee "
+            f"{reassignment.from_employee_id} started",
+        )
+
+    try:
+        manager = await get_employee_manager(db=db)
+        reassigned = await manager.crud.reassign_tasks(reassignment=reassignment)
+        return reassigned
+
+    except Exception as exc:
+        logger.error(
+            f"Error reassigning tasks of employee {reassignment.from_employee_id}: {exc}"
+        )
+        raise HTTPException(status_code=500, detail="Failed to reassign tasks")
+
+
+@router.delete(
+    path="/delete/bulk",
+    summary="Delete employees by list of ids",
+    status_code=200,
+    response_model=dict,
+)
+async def delete_employees_bulk(
+    employee_ids: Annotated[List[int], Body(max_length=settings.bulk.max_items)],
+    db: Annotated[AsyncSession, Depends(db_helper.session_getter)],
+) -> dict[str, int | str | list]:
+    """
+    Удаление сотрудников по списку идентификаторов одним запросом.
+    Задачи удаленных сотрудников остаются без исполнителя.
+
+    :param employee_ids: список идентификаторов сотрудников
+    :param db: сеанс базы данных
+    :return: идентификаторы удаленных и не найденных сотрудников
+    """
+    try:
+        manager = await get_employee_manager(db=db)
+        delete_employees = await manager.crud.delete_many(employee_ids=employee_ids)
+        return delete_employees
+
+    except Exception as exc:
+        logger.error(f"Error deleting employees in bulk: {exc}")
+        raise HTTPException(status_code=500, detail="Failed to delete employees")
+
+
 @router.delete(
     path="/delete/{employee_id}",
     summary="Delete employee by id",
@@ -158,23 +370,28 @@ async def delete_employee_by_id(
 @router.delete(
     path="/delete/",
     summary="Delete all employees ",
-    status_code=200,
+    status_code=202,
     response_model=dict,
 )
-async def delete_all_employees(
-    db: Annotated[AsyncSession, Depends(db_helper.session_getter)]
-) -> dict[str, int | str]:
+async def delete_all_employees() -> dict[str, int | str]:
     """
     Удаление всех сотрудников.
 
-    :param db: сеанс базы данных
-    :return: сведения об удалении сотрудников, полученные в результате операции delete_all
+    Удаление выполняется фоновым заданием порциями по settings.jobs.chunk_size;
+    ход выполнения — GET /jobs/manager/jobs/{job_id}.
+
+    :return: ID фонового задания
     """
-    try:
-        manager = await get_employee_manager(db=db)
-        delete_employees = await manager.crud.delete_all()
-        return delete_employees
 
-    except Exception as exc:
-        logger.error(f"Error deleting all employees: {exc}")
-        raise HTTPException(status_code=500, detail="Failed to delete all employees")
+    async def delete_employees(job: Job) -> dict[str, int | str]:
+        async with db_helper.session_factory() as db:
+            manager = await get_employee_manager(db=db)
+            return await manager.crud.delete_all(
+                chunk_size=settings.jobs.chunk_size, progress=job.report
+            )
+
+    return submit_job(
+        "delete_all_employees",
+        delete_employees,
+        message="Deletion of all employees started",
+    )
@@ -0,0 +1,70 @@
+import logging
+from typing import Annotated, AsyncIterator
+
+from fastapi import APIRouter, Header, HTTPException, Query
+from fastapi.responses import StreamingResponse
+
+from core.config import settings
+from core.events import outbox_dispatcher
+from core.monitoring import current_request
+
+logger = logging.getLogger(__name__)
+router = APIRouter(prefix="/manager/events", tags=["Events"])
+
+
+@router.get(
+    path="/stream",
+    summary="Stream task and employee changes (Server-Sent Events)",
+    status_code=200,
+    response_class=StreamingResponse,
+)
+async def stream_events(
+    after: Annotated[
+        int | None,
+        Query(ge=0, description="ID of the last received event"),
+    ] = None,
+    last_event_id: Annotated[int | None, Header(ge=0)] = None,
+) -> StreamingResponse:
+    """
+    Лента изменений задач и сотрудников в формате Server-Sent Events.
+
+    Каждое событие содержит ID (позицию в ленте), имя вида "task.updated"
+    и данные: ID записи, тип изменения и измененные поля. Чтение можно
+    продолжить с позиции из заголовка Last-Event-ID (браузер передает его
+    при переподключении) или параметра after; без них передаются только
+    новые события. Если события после позиции уже удалены, первым приходит
+    событие "reset": состояние нужно загрузить заново.
+
+    :param after: ID последнего полученного события
+    :param last_event_id: то же из заголовка Last-Event-ID (имеет приоритет)
+    :return: потоковый ответ text/event-stream
+    """
+    if not outbox_dispatcher.running:
+        raise HTTPException(status_code=503, detail="Change feed is not available")
+
+    position = last_event_id if last_event_id is not None else after
+
+    async def event_stream() -> AsyncIterator[bytes]:
+        # Подписка длится долго: ее запросы к базе не относятся
+        # к показателям и лимиту SQL-запросов HTTP-запроса
+        current_request.set(None)
+        try:
+            yield b"retry: 3000\n\n"
+            async for events in outbox_dispatcher.follow(
+                after=position,
+                heartbeat_interval=settings.events.heartbeat_interval,
+            ):
+                if events:
+                    yield b"".join(change.to_sse() for change in events)
+                else:
+                    yield b": keep-alive\n\n"
+
+        except Exception as exc:
+            logger.error(f"Error streaming events: {exc}")
+            raise
+
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
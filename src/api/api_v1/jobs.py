@@ -0,0 +1,69 @@
+import logging
+from typing import Any
+
+from fastapi import APIRouter, HTTPException
+
+from core.jobs import JobFunc, JobQueueFull, job_runner
+
+logger = logging.getLogger(__name__)
+router = APIRouter(prefix="/manager/jobs", tags=["Jobs"])
+
+
+def submit_job(kind: str, func: JobFunc, message: str) -> dict[str, int | str]:
+    """
+    Постановка фонового задания в очередь для маршрутов, отвечающих 202.
+
+    :param kind: тип задания
+    :param func: функция, выполняющая задание
+    :param message: сообщение для ответа
+    :return: словарь со статусом 202 и ID задания
+    :raises HTTPException: 503, если обработчики не запущены или очередь заполнена
+    """
+    if not job_runner.running:
+        raise HTTPException(status_code=503, detail="Job runner is not available")
+    try:
+        job = job_runner.submit(kind, func)
+    except JobQueueFull as exc:
+        raise HTTPException(status_code=503, detail=str(exc))
+
+    logger.info(f"Submitted job {kind} {job.id}")
+    return {"status": 202, "message": message, "job_id": job.id}
+
+
+@router.get(path="", summary="List background jobs", status_code=200)
+async def list_jobs() -> list[dict[str, Any]]:
+    """
+    Получение списка фоновых заданий, начиная с последних.
+
+    :return: сведения о заданиях
+    """
+    return [job.as_dict() for job in reversed(job_runner.jobs.values())]
+
+
+@router.get(path="/{job_id}", summary="Get background job status", status_code=200)
+async def get_job(job_id: str) -> dict[str, Any]:
+    """
+    Получение состояния фонового задания: статус, прогресс и результат.
+
+    :param job_id: ID задания
+    :return: сведения о задании
+    """
+    job = job_runner.get(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+    return job.as_dict()
+
+
+@router.post(path="/{job_id}/cancel", summary="Cancel background job", status_code=200)
+async def cancel_job(job_id: str) -> dict[str, Any]:
+    """
+    Отмена фонового задания. Выполняющееся задание останавливается после
+    текущей порции; уже выполненные порции не откатываются.
+
+    :param job_id: ID задания
+    :return: сведения о задании
+    """
+    job = job_runner.cancel(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+    return job.as_dict()
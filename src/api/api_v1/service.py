@@ -0,0 +1,45 @@
+import logging
+
+from fastapi import APIRouter
+
+from core.cache import read_cache
+from core.events import event_broker, outbox_dispatcher
+from core.models import db_helper
+
+logger = logging.getLogger(__name__)
+router = APIRouter(prefix="/manager/service", tags=["Service"])
+
+
+@router.get(path="/cache", summary="Get read cache statistics", status_code=200)
+async def get_cache_stats() -> dict[str, int | str | bool]:
+    """
+    Получение счетчиков кэша чтения: попадания, промахи, вытеснения,
+    истечения срока жизни и инвалидации.
+
+    :return: словарь со сведениями о кэше
+    """
+    return read_cache.stats
+
+
+@router.get(
+    path="/pool", summary="Get database connection pool metrics", status_code=200
+)
+async def get_pool_metrics() -> dict[str, int | float | str]:
+    """
+    Получение состояния пула соединений: занятые соединения, выдачи и возвраты,
+    суммарное и максимальное время ожидания выдачи соединения.
+
+    :return: словарь со сведениями о пуле
+    """
+    return db_helper.pool_status()
+
+
+@router.get(path="/events", summary="Get change feed statistics", status_code=200)
+async def get_events_stats() -> dict[str, int | bool]:
+    """
+    Получение состояния ленты изменений: работает ли рассылка, позиция
+    последнего разосланного события и количество подписчиков.
+
+    :return: словарь со сведениями о ленте изменений
+    """
+    return {"running": outbox_dispatcher.running, **event_broker.stats}
@@ -1,12 +1,45 @@
 import logging
-from typing import Annotated, Sequence, List
-
-from fastapi import APIRouter, Depends, HTTPException
+from datetime import datetime
+from typing import Annotated, Any, AsyncIterator, Literal, List, Optional
+
+from fastapi import (
+    APIRouter,
+    Body,
+    Depends,
+    Header,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+)
+from fastapi.responses import StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from core.config import settings
+from core.jobs import Job
 from core.models import db_helper
-from core.schemas import TaskRequest, TaskResponse
-from crud.task import get_task_manager
+from core.monitoring import TimedORJSONResponse
+from core.schemas import (
+    Page,
+    Priority,
+    Status,
+    TaskChanges,
+    TaskFilter,
+    TaskRequest,
+    TaskResponse,
+    TaskSortField,
+    TaskStatusTransition,
+    TaskUpsert,
+)
+from crud.task import SyncTokenExpired, get_task_manager
+from crud.task_import import ImportFormat, TaskImporter
+from .conditional import (
+    etag_headers,
+    is_not_modified,
+    make_etag,
+    not_modified_response,
+)
+from .jobs import submit_job
 
 logger = logging.getLogger(__name__)
 router = APIRouter(prefix="/manager/tasks", tags=["Tasks"])
@@ -34,26 +67,278 @@ async def create(
         raise HTTPException(status_code=500, detail=str(exc))
 
 
+@router.post(
+    path="/bulk",
+    summary="Creating tasks in bulk",
+    status_code=201,
+    response_model=dict,
+)
+async def create_bulk(
+    tasks: Annotated[
+        List[dict[str, Any]], Body(max_length=settings.bulk.max_items)
+    ],
+    db: Annotated[AsyncSession, Depends(db_helper.session_getter)],
+) -> dict[str, int | str | list]:
+    """
+    Массовое создание задач за одно обращение к базе данных.
+
+    Элементы, не прошедшие проверку TaskRequest, не прерывают создание
+    остальных задач и возвращаются в списке ошибок с их индексом.
+
+    :param tasks: список данных задач (структура TaskRequest)
+    :param db: сеанс базы данных
+    :return: ID созданных задач и ошибки проверки отдельных элементов
+    """
+    try:
+        manager = await get_task_manager(db=db)
+        new_tasks = await manager.crud.create_many(tasks=tasks)
+
+        return new_tasks
+
+    except Exception as exc:
+        logger.error(msg=str(exc))
+        raise HTTPException(status_code=500, detail=str(exc))
+
+
+@router.post(
+    path="/import",
+    summary="Import tasks from CSV or NDJSON",
+    status_code=200,
+    response_model=dict,
+)
+async def import_tasks(
+    request: Request,
+    db: Annotated[AsyncSession, Depends(db_helper.session_getter)],
+    file_format: Annotated[
+        Optional[ImportFormat],
+        Query(alias="format", description="By default taken from Content-Type"),
+    ] = None,
+) -> dict[str, Any]:
+    """
+    Импорт задач из CSV или NDJSON, переданного телом запроса.
+
+    Тело читается потоком и загружается пачками через COPY, поэтому размер
+    файла не ограничен памятью. Столбцы соответствуют полям TaskRequest;
+    столбец employee_email назначает задачу сотруднику с этим email.
+    Строки с ошибками не прерывают импорт и перечисляются в отчете.
+
+    :param request: входящий запрос с содержимым файла
+    :param db: сеанс базы данных
+    :param file_format: формат файла: csv или ndjson
+    :return: количество созданных задач и ошибки с номерами строк
+    """
+    if file_format is None:
+        content_type = request.headers.get("content-type", "")
+        file_format = "csv" if "csv" in content_type else "ndjson"
+
+    try:
+        importer = TaskImporter(
+            db=db,
+            batch_size=settings.imports.batch_size,
+            max_errors=settings.imports.max_errors,
+            max_record_size=settings.imports.max_record_size,
+        )
+        report = await importer.run(request.stream(), file_format=file_format)
+
+        return report
+
+    except ValueError as ve:
+        logger.error(f"Invalid import file: {str(ve)}")
+        raise HTTPException(status_code=422, detail=str(ve))
+
+    except Exception as exc:
+        logger.error(f"Error importing tasks: {exc}")
+        raise HTTPException(status_code=500, detail="Failed to import tasks")
+
+
+@router.get(
+    path="",
+    summary="List tasks with filters and sorting",
+    status_code=200,
+    response_model=Page[TaskResponse],
+)
+async def list_tasks(
+    request: Request,
+    db: Annotated[AsyncSession, Depends(db_helper.read_session_getter)],
+    status: Annotated[Optional[List[Status]], Query()] = None,
+    priority: Annotated[Optional[List[Priority]], Query()] = None,
+    label: Optional[str] = None,
+    employee_id: Optional[int] = None,
+    due_from: Optional[datetime] = None,
+    due_to: Optional[datetime] = None,
+    sort: TaskSortField = TaskSortField.ID,
+    order: Literal["asc", "desc"] = "asc",
+    limit: Annotated[
+        int, Query(ge=1, le=settings.pagination.max_limit)
+    ] = settings.pagination.default_limit,
+    cursor: Optional[str] = None,
+) -> Response:
+    """
+    Получение задач постранично по сочетанию условий отбора с сортировкой.
+
+    :param request: входящий запрос (учитывается If-None-Match)
+    :param db: сеанс базы данных
+    :param status: статусы задач (параметр можно повторять)
+    :param priority: приоритеты задач (параметр можно повторять)
+    :param label: метка задачи
+    :param employee_id: идентификатор исполнителя
+    :param due_from: начало диапазона срока выполнения (включительно)
+    :param due_to: конец диапазона срока выполнения (не включительно)
+    :param sort: поле сортировки
+    :param order: направление сортировки
+    :param limit: максимальное количество задач на странице
+    :param cursor: курсор следующей страницы из предыдущего ответа
+    :return: страница задач (экземпляры TaskResponse) и курсор следующей страницы
+    """
+    try:
+        etag = await make_etag(request, "tasks", db=db)
+        if is_not_modified(request, etag):
+            return not_modified_response(etag)
+
+        filters = TaskFilter(
+            status=status,
+            priority=priority,
+            label=label,
+            employee_id=employee_id,
+            due_from=due_from,
+            due_to=due_to,
+        )
+        manager = await get_task_manager(db=db)
+        tasks = await manager.crud.get_filtered(
+            filters=filters,
+            sort=sort,
+            descending=order == "desc",
+            limit=limit,
+            cursor=cursor,
+        )
+
+        return TimedORJSONResponse(content=tasks, headers=etag_headers(etag))
+
+    except ValueError as ve:
+        logger.error(f"Invalid cursor for tasks list: {str(ve)}")
+        raise HTTPException(status_code=422, detail=str(ve))
+
+    except Exception as exc:
+        logger.error(msg=str(exc))
+        raise HTTPException(status_code=500, detail=str(exc))
+
+
 @router.get(
     path="/all",
     summary="Get all tasks",
     status_code=200,
-    response_model=List[TaskResponse],
+    response_model=Page[TaskResponse],
 )
 async def get_all_tasks(
-    db: Annotated[AsyncSession, Depends(db_helper.session_getter)]
-) -> Sequence[TaskResponse]:
+    request: Request,
+    db: Annotated[AsyncSession, Depends(db_helper.read_session_getter)],
+    limit: Annotated[
+        int, Query(ge=1, le=settings.pagination.max_limit)
+    ] = settings.pagination.default_limit,
+    cursor: Optional[str] = None,
+) -> Response:
     """
-    Получение всех задач одновременно
+    Получение задач постранично, в порядке возрастания идентификатора
 
+    :param request: входящий запрос (учитывается If-None-Match)
     :param db: сеанс базы данных
-    :return: список задач (экземпляры TaskRead)
+    :param limit: максимальное количество задач на странице
+    :param cursor: курсор следующей страницы из предыдущего ответа
+    :return: страница задач (экземпляры TaskResponse) и курсор следующей страницы
     """
     try:
+        etag = await make_etag(request, "tasks", db=db)
+        if is_not_modified(request, etag):
+            return not_modified_response(etag)
+
         manager = await get_task_manager(db=db)
-        all_tasks = await manager.crud.get_all()
+        all_tasks = await manager.crud.get_all(limit=limit, cursor=cursor)
 
-        return all_tasks
+        return TimedORJSONResponse(content=all_tasks, headers=etag_headers(etag))
+
+    except ValueError as ve:
+        logger.error(f"Invalid cursor for tasks page: {str(ve)}")
+        raise HTTPException(status_code=422, detail=str(ve))
+
+    except Exception as exc:
+        logger.error(msg=str(exc))
+        raise HTTPException(status_code=500, detail=str(exc))
+
+
+@router.get(
+    path="/export",
+    summary="Export all tasks as NDJSON",
+    status_code=200,
+    response_class=StreamingResponse,
+)
+async def export_tasks() -> StreamingResponse:
+    """
+    Потоковая выгрузка всех задач, по одной задаче в строке (NDJSON).
+
+    Сессия открывается внутри генератора: зависимости с yield завершаются
+    до начала отправки тела потокового ответа.
+
+    :return: потоковый ответ application/x-ndjson
+    """
+
+    async def ndjson() -> AsyncIterator[bytes]:
+        try:
+            async with db_helper.read_session() as db:
+                manager = await get_task_manager(db=db)
+                async for chunk in manager.crud.stream_all(
+                    batch_size=settings.export.batch_size
+                ):
+                    yield chunk
+
+        except Exception as exc:
+            logger.error(f"Error exporting tasks: {exc}")
+            raise
+
+    return StreamingResponse(ndjson(), media_type="application/x-ndjson")
+
+
+@router.get(
+    path="/changes",
+    summary="Get tasks changed since a sync token",
+    status_code=200,
+    response_model=TaskChanges,
+)
+async def get_changes(
+    db: Annotated[AsyncSession, Depends(db_helper.read_session_getter)],
+    since: Annotated[
+        Optional[str], Query(description="next_token from the previous response")
+    ] = None,
+    limit: Annotated[
+        int, Query(ge=1, le=settings.pagination.max_limit)
+    ] = settings.pagination.default_limit,
+) -> Response:
+    """
+    Инкрементальная синхронизация: задачи, созданные или измененные после
+    токена, и ID удаленных задач. Без токена возвращаются все задачи.
+
+    Клиент сохраняет next_token и передает его в следующем запросе;
+    при has_more = true следующий запрос нужно выполнить сразу. Токен старше
+    settings.sync.retention отклоняется с кодом 410: отметки об удалении
+    за этот период уже удалены, и клиенту нужна полная синхронизация.
+
+    :param db: сеанс базы данных
+    :param since: токен синхронизации из предыдущего ответа
+    :param limit: максимальное количество изменений в ответе
+    :return: измененные задачи, ID удаленных задач и токен следующего запроса
+    """
+    try:
+        manager = await get_task_manager(db=db)
+        changes = await manager.crud.get_changes(token=since, limit=limit)
+
+        return TimedORJSONResponse(content=changes)
+
+    except SyncTokenExpired as exc:
+        logger.info(f"Expired sync token for task changes: {str(exc)}")
+        raise HTTPException(status_code=410, detail=str(exc))
+
+    except ValueError as ve:
+        logger.error(f"Invalid sync token for task changes: {str(ve)}")
+        raise HTTPException(status_code=422, detail=str(ve))
 
     except Exception as exc:
         logger.error(msg=str(exc))
@@ -67,20 +352,31 @@ async def get_all_tasks(
     response_model=List[TaskResponse],
 )
 async def get_by_query(
-    query: str, db: Annotated[AsyncSession, Depends(db_helper.session_getter)]
-) -> Sequence[TaskResponse]:
+    query: str,
+    request: Request,
+    db: Annotated[AsyncSession, Depends(db_helper.read_session_getter)],
+    limit: Annotated[
+        int, Query(ge=1, le=settings.pagination.max_limit)
+    ] = settings.pagination.default_limit,
+) -> Response:
     """
-    Получение всех задач на основе запроса.
+    Получение задач на основе запроса, наиболее релевантные первыми.
 
     :param query: поисковый запрос
-    :param db: ceaнс базы данных
+    :param request: входящий запрос (учитывается If-None-Match)
+    :param db: сеанс базы данных
+    :param limit: максимальное количество задач в ответе
     :return: список задач (экземпляры TaskRead)
     """
     try:
+        etag = await make_etag(request, "tasks", db=db)
+        if is_not_modified(request, etag):
+            return not_modified_response(etag)
+
         manager = await get_task_manager(db=db)
-        tasks_by_query = await manager.crud.get_by_query(query=query)
+        tasks_by_query = await manager.crud.get_by_query(query=query, limit=limit)
 
-        return tasks_by_query
+        return TimedORJSONResponse(content=tasks_by_query, headers=etag_headers(etag))
 
     except Exception as exc:
         logger.error(msg=str(exc))
@@ -115,6 +411,81 @@ async def update(
         raise HTTPException(status_code=500, detail=str(exc))
 
 
+@router.put(
+    path="/upsert",
+    summary="Create or update task by external id",
+    status_code=200,
+    response_model=dict,
+)
+async def upsert(
+    task: TaskUpsert,
+    response: Response,
+    db: Annotated[AsyncSession, Depends(db_helper.session_getter)],
+    idempotency_key: Annotated[Optional[str], Header(max_length=100)] = None,
+) -> dict[str, int | str | bool]:
+    """
+    Идемпотентное создание задачи: повтор запроса с тем же внешним ключом
+    обновляет ранее созданную задачу вместо создания дубликата.
+
+    Внешний ключ передается полем external_id или заголовком Idempotency-Key.
+
+    :param task: экземпляр модели pydantic TaskUpsert
+    :param response: ответ (статус 201, если задача создана)
+    :param db: сеанс базы данных
+    :param idempotency_key: внешний ключ задачи, если не указан external_id
+    :return: ID задачи и признак ее создания
+    """
+    external_id = task.external_id or idempotency_key
+    if external_id is None:
+        raise HTTPException(
+            status_code=422, detail="external_id or Idempotency-Key is required"
+        )
+    if idempotency_key is not None and idempotency_key != external_id:
+        raise HTTPException(
+            status_code=422, detail="external_id does not match Idempotency-Key"
+        )
+
+    try:
+        manager = await get_task_manager(db=db)
+        upserted = await manager.crud.upsert(task=task, external_id=external_id)
+        response.status_code = upserted["status"]
+        return upserted
+
+    except Exception as exc:
+        logger.error(msg=str(exc))
+        raise HTTPException(status_code=500, detail=str(exc))
+
+
+@router.put(
+    path="/bulk/status",
+    summary="Move tasks to another status in bulk",
+    status_code=200,
+    response_model=dict,
+)
+async def transition_status(
+    transition: TaskStatusTransition,
+    db: Annotated[AsyncSession, Depends(db_helper.session_getter)],
+) -> dict[str, int | str | list]:
+    """
+    Перевод задач в другой статус одним запросом к базе данных.
+    Задачи выбираются по списку ID или по условиям отбора
+    (статус, метка, исполнитель, срок выполнения).
+
+    :param transition: выбор задач и целевой статус
+    :param db: сеанс базы данных
+    :return: ID задач, переведенных в целевой статус
+    """
+    try:
+        manager = await get_task_manager(db=db)
+        moved_tasks = await manager.crud.transition_status(transition=transition)
+
+        return moved_tasks
+
+    except Exception as exc:
+        logger.error(msg=str(exc))
+        raise HTTPException(status_code=500, detail=str(exc))
+
+
 @router.delete(
     path="/delete/id={task_id}", summary="Delete task by id", status_code=200
 )
@@ -140,25 +511,62 @@ async def delete_by_id(
 
 
 @router.delete(
-    path="/delete/status={status}",
-    summary="Delete all tasks according to the status",
+    path="/delete/bulk",
+    summary="Delete tasks by list of ids",
     status_code=200,
+    response_model=dict,
 )
-async def delete_all_by_status(
-    status: str, db: Annotated[AsyncSession, Depends(db_helper.session_getter)]
-) -> dict[str, int | str]:
+async def delete_bulk(
+    task_ids: Annotated[List[int], Body(max_length=settings.bulk.max_items)],
+    db: Annotated[AsyncSession, Depends(db_helper.session_getter)],
+) -> dict[str, int | str | list]:
     """
-    Удаление всех задач по статусу, пример: удаление всех «backlog» задач.
-    :param status:
+    Удаление задач по списку идентификаторов одним запросом.
+
+    :param task_ids: список идентификаторов задач
     :param db: сеанс базы данных
-    :return: сведения об удалении задачи, полученные в результате операции delete_all
+    :return: идентификаторы удаленных и не найденных задач
     """
     try:
         manager = await get_task_manager(db=db)
-        delete_tasks = await manager.crud.delete_all_by_status(status=status)
+        delete_tasks = await manager.crud.delete_many(task_ids=task_ids)
 
         return delete_tasks
 
     except Exception as exc:
         logger.error(msg=str(exc))
         raise HTTPException(status_code=500, detail=str(exc))
+
+
+@router.delete(
+    path="/delete/status={status}",
+    summary="Delete all tasks according to the status",
+    status_code=202,
+)
+async def delete_all_by_status(status: str) -> dict[str, int | str]:
+    """
+    Удаление всех задач по статусу, пример: удаление всех «backlog» задач.
+
+    Удаление выполняется фоновым заданием порциями по settings.jobs.chunk_size;
+    ход выполнения — GET /jobs/manager/jobs/{job_id}.
+    :param status: статус задач для удаления
+    :return: ID фонового задания
+    :raises HTTPException: 404, если статус не существует
+    """
+    if status not in [value.value for value in Status]:
+        raise HTTPException(status_code=404, detail="Invalid status value")
+
+    async def delete_tasks(job: Job) -> dict[str, int | str]:
+        async with db_helper.session_factory() as db:
+            manager = await get_task_manager(db=db)
+            return await manager.crud.delete_all_by_status(
+                status=status,
+                chunk_size=settings.jobs.chunk_size,
+                progress=job.report,
+            )
+
+    return submit_job(
+        "delete_tasks_by_status",
+        delete_tasks,
+        message=f"Deletion of {status!r} tasks started",
+    )
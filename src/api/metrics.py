@@ -0,0 +1,99 @@
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from core.cache import read_cache
+from core.models import db_helper
+from core.monitoring import registry, render_samples
+
+router = APIRouter(tags=["Service"])
+
+# Показатели пула, которые только растут; остальные — текущие значения
+POOL_COUNTERS = {
+    "connects",
+    "checkouts",
+    "checkins",
+    "invalidations",
+    "checkout_wait_count",
+    "checkout_wait_seconds_total",
+}
+
+
+def cache_metrics() -> str:
+    stats = read_cache.stats
+    counters = {
+        key: value
+        for key, value in stats.items()
+        if isinstance(value, int) and not isinstance(value, bool)
+    }
+    return "".join(
+        render_samples(
+            f"read_cache_{key}_total",
+            f"Read cache {key}.",
+            {(stats["backend"],): value},
+            ("backend",),
+            kind="counter",
+        )
+        for key, value in counters.items()
+    )
+
+
+def pool_metrics() -> str:
+    status = db_helper.pool_status()
+    pools = {"primary": status}
+    for replica in status.get("replicas", []):
+        pools[replica["url"]] = replica
+
+    keys = [
+        key
+        for key, value in status.items()
+        if isinstance(value, (int, float)) and not isinstance(value, bool)
+    ]
+    return "".join(
+        render_samples(
+            (
+                f"db_pool_{key}"
+                if key.endswith("_total") or key not in POOL_COUNTERS
+                else f"db_pool_{key}_total"
+            ),
+            f"Database connection pool {key.replace('_', ' ')}.",
+            {(name,): pool[key] for name, pool in pools.items() if key in pool},
+            ("database",),
+            kind="counter" if key in POOL_COUNTERS else "gauge",
+        )
+        for key in keys
+    )
+
+
+def replica_metrics() -> str:
+    samples = {
+        (replica["url"],): replica["lag_seconds"]
+        for replica in db_helper.pool_status()["replicas"]
+        if replica["lag_seconds"] is not None
+    }
+    if not samples:
+        return ""
+    return render_samples(
+        "db_replica_lag_seconds",
+        "Time since the last primary position replayed by the read replica.",
+        samples,
+        ("database",),
+    )
+
+
+@router.get(
+    path="/metrics",
+    summary="Prometheus metrics",
+    status_code=200,
+    response_class=PlainTextResponse,
+)
+async def get_metrics() -> PlainTextResponse:
+    """
+    Метрики процесса в текстовом формате Prometheus: HTTP-запросы,
+    SQL-запросы и время в базе данных, кэш чтения и пул соединений.
+
+    :return: текст метрик
+    """
+    return PlainTextResponse(
+        registry.render() + cache_metrics() + pool_metrics() + replica_metrics(),
+        media_type="text/plain; version=0.0.4; charset=utf-8",
+    )
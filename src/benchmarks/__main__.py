@@ -0,0 +1,159 @@
+"""
+Измерение производительности CRUD-классов и маршрутов API.
+
+Запуск (из каталога src, база данных — сервис pg из docker-compose):
+
+    docker compose up -d pg
+    alembic upgrade head
+    APP_CONFIG__DB__URL=postgresql+asyncpg://postgres:<password>@localhost:5432/task_tracker \\
+        python -m benchmarks run --sizes 1000,100000 --yes
+
+    python -m benchmarks compare benchmarks/results/a.json benchmarks/results/b.json
+
+Команда run очищает таблицы задач и сотрудников перед заполнением каждого
+набора данных, поэтому требует флаг --yes.
+"""
+
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+import httpx
+from sqlalchemy.engine import make_url
+
+from core.cache import read_cache
+from core.config import settings
+from core.models import db_helper
+from main import main_app
+from . import report
+from .dataset import seed
+from .measure import Measurement, measure
+from .scenarios import crud_scenarios, http_scenarios
+
+RESULTS_DIR = Path(__file__).parent / "results"
+
+
+async def run(args: argparse.Namespace) -> list[Measurement]:
+    read_cache.enabled = args.cache
+    results: list[Measurement] = []
+
+    async with main_app.router.lifespan_context(main_app):
+        async with httpx.AsyncClient(
+            transport=httpx.ASGITransport(app=main_app),
+            base_url="http://benchmark",
+            timeout=None,
+        ) as client:
+            scenarios = []
+            if "crud" in args.layers:
+                scenarios += crud_scenarios(db_helper.session_factory, read_cache)
+            if "http" in args.layers:
+                scenarios += http_scenarios(client)
+            if args.only:
+                scenarios = [s for s in scenarios if args.only in s.name]
+            # Операции записи изменяют набор данных и выполняются последними
+            scenarios.sort(key=lambda scenario: scenario.writes)
+
+            for size in args.sizes:
+                if not args.skip_seed:
+                    print(f"seeding {size} tasks...", file=sys.stderr)
+                    await seed(db_helper.session_factory, size, seed=args.seed)
+
+                for scenario in scenarios:
+                    result = await measure(
+                        scenario.build(size),
+                        dataset=size,
+                        layer=scenario.layer,
+                        name=scenario.name,
+                        iterations=scenario.iterations or args.iterations,
+                        warmup=min(args.warmup, scenario.iterations or args.warmup),
+                        concurrency=args.concurrency,
+                    )
+                    results.append(result)
+                    print(report.format_table([result]).splitlines()[-1])
+
+    return results
+
+
+def parse_sizes(value: str) -> list[int]:
+    return [int(size.replace("_", "")) for size in value.split(",") if size]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="seed datasets and measure")
+    run_parser.add_argument(
+        "--sizes",
+        type=parse_sizes,
+        default=[1_000, 10_000, 100_000],
+        help="comma separated task counts, e.g. 1000,100000,1000000",
+    )
+    run_parser.add_argument("--iterations", type=int, default=50)
+    run_parser.add_argument("--warmup", type=int, default=5)
+    run_parser.add_argument("--concurrency", type=int, default=1)
+    run_parser.add_argument(
+        "--layers",
+        type=lambda value: value.split(","),
+        default=["crud", "http"],
+        help="comma separated: crud, http",
+    )
+    run_parser.add_argument("--only", help="run operations whose name contains this")
+    run_parser.add_argument("--seed", type=int, default=42)
+    run_parser.add_argument(
+        "--cache", action="store_true", help="keep the read cache enabled"
+    )
+    run_parser.add_argument(
+        "--skip-seed", action="store_true", help="measure the data already in the db"
+    )
+    run_parser.add_argument("--output", type=Path)
+    run_parser.add_argument(
+        "--yes", action="store_true", help="allow truncating tasks and employees"
+    )
+
+    compare_parser = commands.add_parser("compare", help="compare two result files")
+    compare_parser.add_argument("baseline", type=Path)
+    compare_parser.add_argument("current", type=Path)
+    compare_parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="allowed relative latency growth before failing (0.1 = 10%%)",
+    )
+
+    args = parser.parse_args()
+
+    if args.command == "compare":
+        text, regressed = report.compare(args.baseline, args.current, args.threshold)
+        print(text)
+        return 1 if regressed else 0
+
+    if not args.skip_seed and not args.yes:
+        parser.error("run truncates tasks and employees: pass --yes or --skip-seed")
+
+    results = asyncio.run(run(args))
+
+    output = args.output or RESULTS_DIR / (
+        f"{report.git_revision() or 'results'}-{max(args.sizes)}.json"
+    )
+    report.save(
+        output,
+        results,
+        meta={
+            "database": make_url(str(settings.db.url)).render_as_string(
+                hide_password=True
+            ),
+            "sizes": args.sizes,
+            "iterations": args.iterations,
+            "warmup": args.warmup,
+            "concurrency": args.concurrency,
+            "cache": args.cache,
+        },
+    )
+    print(f"results saved to {output}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,136 @@
+import random
+from datetime import datetime, timedelta, timezone
+from typing import Any, Iterator
+
+from sqlalchemy import insert, text
+from sqlalchemy.ext.asyncio import async_sessionmaker, AsyncSession
+
+from core.cache import ReadCache, read_cache
+from core.models import Employee, Task
+from core.schemas import Priority, Status
+
+WORDS = (
+    "report",
+    "release",
+    "invoice",
+    "migration",
+    "backup",
+    "review",
+    "deploy",
+    "customer",
+    "dashboard",
+    "payment",
+    "search",
+    "import",
+    "export",
+    "audit",
+    "meeting",
+    "onboarding",
+)
+LABELS = ("backend", "frontend", "ops", "design", "qa", "docs", None)
+POSITIONS = ("developer", "analyst", "designer", "manager", "tester", "devops")
+
+BATCH_SIZE = 10_000
+
+
+def employees_for(tasks: int) -> int:
+    """
+    Количество сотрудников для набора данных: в среднем 50 задач на сотрудника.
+    """
+    return max(10, tasks // 50)
+
+
+def employee_rows(count: int) -> list[dict[str, Any]]:
+    return [
+        {
+            "fullname": f"Employee {number:07d}",
+            "position": POSITIONS[number % len(POSITIONS)],
+            "age": 20 + number % 45,
+            "email": f"employee{number}@example.com",
+            "hashed_password": "benchmark",
+            "is_active": number % 10 != 0,
+        }
+        for number in range(1, count + 1)
+    ]
+
+
+def task_rows(count: int, employees: int, seed: int) -> Iterator[list[dict[str, Any]]]:
+    """
+    Детерминированные данные задач, пачками по BATCH_SIZE.
+
+    :param count: количество задач
+    :param employees: количество сотрудников (ID от 1 до employees)
+    :param seed: начальное значение генератора случайных чисел
+    :return: итератор пачек строк для INSERT
+    """
+    rng = random.Random(seed)
+    now = datetime.now(timezone.utc)
+    priorities = [priority.value for priority in Priority]
+    statuses = [status.value for status in Status]
+
+    batch: list[dict[str, Any]] = []
+    for number in range(1, count + 1):
+        created_at = now - timedelta(minutes=rng.randint(0, 60 * 24 * 365))
+        batch.append(
+            {
+                "title": f"{rng.choice(WORDS).title()} {rng.choice(WORDS)} #{number}",
+                "description": " ".join(rng.choices(WORDS, k=12)),
+                "label": rng.choice(LABELS),
+                "priority": rng.choice(priorities),
+                "status": rng.choice(statuses),
+                "created_at": created_at,
+                "last_update": created_at,
+                "completed_at": created_at + timedelta(days=rng.randint(1, 60)),
+                # Примерно каждая десятая задача без исполнителя
+                "employee_id": (
+                    rng.randint(1, employees) if rng.random() > 0.1 else None
+                ),
+            }
+        )
+        if len(batch) == BATCH_SIZE:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+async def seed(
+    session_factory: async_sessionmaker[AsyncSession],
+    tasks: int,
+    seed: int = 42,
+    cache: ReadCache = read_cache,
+) -> None:
+    """
+    Пересоздание данных для измерений: таблицы задач и сотрудников очищаются,
+    затем заполняются заданным количеством задач.
+
+    TRUNCATE ... RESTART IDENTITY снова выдает прежние ID, поэтому
+    закэшированные страницы прошлого набора данных сбрасываются.
+
+    :param session_factory: фабрика сессий основной базы данных
+    :param tasks: количество задач
+    :param seed: начальное значение генератора случайных чисел
+    :param cache: кэш чтения задач и сотрудников
+    """
+    employees = employees_for(tasks)
+
+    async with session_factory() as session:
+        await session.execute(
+            text(
+                f"TRUNCATE {Task.__tablename__}, {Employee.__tablename__} "
+                "RESTART IDENTITY CASCADE"
+            )
+        )
+        await session.execute(insert(Employee), employee_rows(employees))
+        await session.commit()
+
+        for batch in task_rows(tasks, employees, seed):
+            await session.execute(insert(Task), batch)
+            await session.commit()
+
+        await session.execute(
+            text(f"ANALYZE {Task.__tablename__}, {Employee.__tablename__}")
+        )
+        await session.commit()
+
+    await cache.invalidate("tasks", "employees")
@@ -0,0 +1,151 @@
+import asyncio
+import os
+import resource
+import statistics
+import threading
+import time
+from dataclasses import asdict, dataclass
+from typing import Any, Awaitable, Callable
+
+PAGE_SIZE = os.sysconf("SC_PAGE_SIZE") if hasattr(os, "sysconf") else 4096
+
+
+def current_rss() -> int:
+    """
+    Текущий размер резидентной памяти процесса в байтах.
+
+    На Linux читается /proc/self/statm, на остальных системах используется
+    пиковое значение getrusage (оно не уменьшается).
+    """
+    try:
+        with open("/proc/self/statm", "rb") as statm:
+            return int(statm.read().split()[1]) * PAGE_SIZE
+    except OSError:
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # macOS возвращает байты, Linux — килобайты
+        return peak if os.uname().sysname == "Darwin" else peak * 1024
+
+
+class RssSampler:
+    """
+    Фоновый поток, фиксирующий максимальный RSS за время измерения.
+    """
+
+    def __init__(self, interval: float = 0.005) -> None:
+        self.interval = interval
+        self.peak = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            self.peak = max(self.peak, current_rss())
+            self._stop.wait(self.interval)
+
+    def __enter__(self) -> "RssSampler":
+        self.peak = current_rss()
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self._stop.set()
+        self._thread.join()
+        self.peak = max(self.peak, current_rss())
+
+
+@dataclass
+class Measurement:
+    """
+    Результат измерения одной операции на одном наборе данных.
+    """
+
+    dataset: int
+    layer: str
+    operation: str
+    iterations: int
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    mean_ms: float
+    max_ms: float
+    throughput_ops: float
+    peak_rss_mb: float
+
+    @property
+    def key(self) -> tuple[int, str, str]:
+        return self.dataset, self.layer, self.operation
+
+    def as_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+def percentile(samples: list[float], q: float) -> float:
+    """
+    Перцентиль с линейной интерполяцией между соседними значениями.
+
+    :param samples: отсортированные значения
+    :param q: уровень перцентиля от 0 до 100
+    :return: значение перцентиля
+    """
+    if len(samples) == 1:
+        return samples[0]
+    position = (len(samples) - 1) * q / 100
+    lower = int(position)
+    upper = min(lower + 1, len(samples) - 1)
+    return samples[lower] + (samples[upper] - samples[lower]) * (position - lower)
+
+
+async def measure(
+    operation: Callable[[], Awaitable[Any]],
+    *,
+    dataset: int,
+    layer: str,
+    name: str,
+    iterations: int,
+    warmup: int,
+    concurrency: int = 1,
+) -> Measurement:
+    """
+    Измерение задержки и пропускной способности асинхронной операции.
+
+    :param operation: измеряемая операция (вызывается без аргументов)
+    :param dataset: количество задач в наборе данных
+    :param layer: уровень измерения: "crud" или "http"
+    :param name: название операции
+    :param iterations: количество измеряемых вызовов
+    :param warmup: количество вызовов без измерения перед запуском
+    :param concurrency: количество одновременно выполняемых вызовов
+    :return: экземпляр Measurement
+    """
+    for _ in range(warmup):
+        await operation()
+
+    latencies: list[float] = []
+    remaining = iter(range(iterations))
+
+    async def worker() -> None:
+        for _ in remaining:
+            started = time.perf_counter()
+            await operation()
+            latencies.append(time.perf_counter() - started)
+
+    with RssSampler() as sampler:
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    milliseconds = [latency * 1000 for latency in latencies]
+    return Measurement(
+        dataset=dataset,
+        layer=layer,
+        operation=name,
+        iterations=iterations,
+        p50_ms=round(percentile(milliseconds, 50), 3),
+        p95_ms=round(percentile(milliseconds, 95), 3),
+        p99_ms=round(percentile(milliseconds, 99), 3),
+        mean_ms=round(statistics.fmean(milliseconds), 3),
+        max_ms=round(milliseconds[-1], 3),
+        throughput_ops=round(iterations / elapsed, 2),
+        peak_rss_mb=round(sampler.peak / 2**20, 1),
+    )
@@ -0,0 +1,106 @@
+import platform
+import subprocess
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+import orjson
+
+from .measure import Measurement
+
+# Метрики, рост которых считается ухудшением
+LATENCY_METRICS = ("p50_ms", "p95_ms", "p99_ms")
+
+
+def git_revision() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def save(path: Path, results: list[Measurement], meta: dict[str, Any]) -> None:
+    """
+    Сохранение результатов измерений в JSON вместе со сведениями о запуске.
+
+    :param path: путь к файлу результатов
+    :param results: результаты измерений
+    :param meta: параметры запуска
+    """
+    document = {
+        "meta": {
+            "revision": git_revision(),
+            "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            **meta,
+        },
+        "results": [result.as_dict() for result in results],
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(orjson.dumps(document, option=orjson.OPT_INDENT_2))
+
+
+def load(path: Path) -> dict[tuple[int, str, str], dict[str, Any]]:
+    document = orjson.loads(path.read_bytes())
+    return {
+        (result["dataset"], result["layer"], result["operation"]): result
+        for result in document["results"]
+    }
+
+
+def format_table(results: list[Measurement]) -> str:
+    header = (
+        f"{'dataset':>8}  {'layer':<5}  {'operation':<45}"
+        f"{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'ops/s':>10}{'rss MB':>9}"
+    )
+    lines = [header, "-" * len(header)]
+    for result in results:
+        lines.append(
+            f"{result.dataset:>8}  {result.layer:<5}  {result.operation:<45}"
+            f"{result.p50_ms:>10.2f}{result.p95_ms:>10.2f}{result.p99_ms:>10.2f}"
+            f"{result.throughput_ops:>10.1f}{result.peak_rss_mb:>9.1f}"
+        )
+    return "\n".join(lines)
+
+
+def compare(baseline: Path, current: Path, threshold: float) -> tuple[str, bool]:
+    """
+    Сравнение двух файлов результатов по совпадающим операциям.
+
+    :param baseline: файл результатов предыдущего запуска
+    :param current: файл результатов нового запуска
+    :param threshold: допустимый относительный рост задержки (0.1 — 10%)
+    :return: текст отчета и признак найденного ухудшения
+    """
+    before = load(baseline)
+    after = load(current)
+
+    header = f"{'dataset':>8}  {'layer':<5}  {'operation':<45}" + "".join(
+        f"{metric:>18}" for metric in LATENCY_METRICS
+    )
+    lines = [header, "-" * len(header)]
+    regressed = False
+
+    for key in sorted(before.keys() & after.keys()):
+        cells = []
+        for metric in LATENCY_METRICS:
+            old, new = before[key][metric], after[key][metric]
+            change = (new - old) / old if old else 0.0
+            marker = " !" if change > threshold else "  "
+            regressed = regressed or change > threshold
+            cells.append(f"{new:>9.2f} {change:>+6.0%}{marker}")
+        dataset, layer, operation = key
+        lines.append(f"{dataset:>8}  {layer:<5}  {operation:<45}" + "".join(cells))
+
+    for key in sorted(before.keys() - after.keys()):
+        lines.append(f"missing in {current.name}: {key}")
+    for key in sorted(after.keys() - before.keys()):
+        lines.append(f"new in {current.name}: {key}")
+
+    return "\n".join(lines), regressed
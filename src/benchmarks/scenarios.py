@@ -0,0 +1,244 @@
+import itertools
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable
+
+import httpx
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from core.cache import ReadCache
+from core.config import settings
+from core.schemas import Priority, Status, TaskFilter, TaskRequest, TaskSortField
+from crud.employees import EmployeeCRUD
+from crud.task import TaskCRUD
+from .dataset import employees_for
+
+API_URL = f"{settings.api.prefix}{settings.api.v1.prefix}"
+TASKS_URL = f"{API_URL}{settings.api.v1.tasks}/manager/tasks"
+EMPLOYEES_URL = f"{API_URL}{settings.api.v1.employees}/manager/employees"
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """
+    Измеряемая операция: уровень, название и фабрика вызова.
+
+    Фабрика получает размер набора данных и возвращает операцию без
+    аргументов; операции записи изменяют данные, поэтому выполняются
+    после операций чтения.
+    """
+
+    layer: str
+    name: str
+    build: Callable[[int], Callable[[], Awaitable[Any]]]
+    writes: bool = False
+    iterations: int | None = None  # None — значение из командной строки
+
+
+def crud_scenarios(
+    session_factory: async_sessionmaker[AsyncSession], cache: ReadCache
+) -> list[Scenario]:
+    """
+    Операции TaskCRUD и EmployeeCRUD; каждый вызов работает в новой сессии,
+    как обработчик запроса.
+    """
+
+    def tasks(call: Callable[[TaskCRUD], Awaitable[Any]]) -> Callable[[], Awaitable]:
+        async def operation() -> Any:
+            async with session_factory() as session:
+                return await call(TaskCRUD(db=session, cache=cache))
+
+        return operation
+
+    def employees(
+        call: Callable[[EmployeeCRUD], Awaitable[Any]],
+    ) -> Callable[[], Awaitable]:
+        async def operation() -> Any:
+            async with session_factory() as session:
+                return await call(EmployeeCRUD(db=session, cache=cache))
+
+        return operation
+
+    async def export(crud: TaskCRUD) -> int:
+        size = 0
+        async for chunk in crud.stream_all(batch_size=settings.export.batch_size):
+            size += len(chunk)
+        return size
+
+    open_tasks = TaskFilter(status=[Status.TODO, Status.IN_PROGRESS])
+    urgent = TaskFilter(priority=[Priority.HIGH, Priority.CRITICAL], label="backend")
+    counter = itertools.count(1)
+
+    def updated_task(size: int) -> Callable[[], Awaitable]:
+        return tasks(
+            lambda crud: crud.update(
+                task_id=next(counter) % size + 1,
+                task=TaskRequest(status=Status.IN_PROGRESS),
+            )
+        )
+
+    return [
+        Scenario(
+            "crud",
+            "tasks.get_all[100]",
+            lambda size: tasks(lambda crud: crud.get_all(limit=100)),
+        ),
+        Scenario(
+            "crud",
+            "tasks.get_all[1000]",
+            lambda size: tasks(lambda crud: crud.get_all(limit=1000)),
+        ),
+        Scenario(
+            "crud",
+            "tasks.get_filtered[open,created_at desc]",
+            lambda size: tasks(
+                lambda crud: crud.get_filtered(
+                    filters=open_tasks,
+                    sort=TaskSortField.CREATED_AT,
+                    descending=True,
+                    limit=100,
+                )
+            ),
+        ),
+        Scenario(
+            "crud",
+            "tasks.get_filtered[urgent backend]",
+            lambda size: tasks(
+                lambda crud: crud.get_filtered(
+                    filters=urgent, sort=TaskSortField.ID, descending=False, limit=100
+                )
+            ),
+        ),
+        Scenario(
+            "crud",
+            "tasks.get_by_query",
+            lambda size: tasks(
+                lambda crud: crud.get_by_query(query="invoice", limit=100)
+            ),
+        ),
+        Scenario("crud", "tasks.stream_all", lambda size: tasks(export), iterations=3),
+        Scenario(
+            "crud",
+            "employees.get_all[100]",
+            lambda size: employees(lambda crud: crud.get_all(limit=100)),
+        ),
+        Scenario(
+            "crud",
+            "employees.get_all[100,tasks]",
+            lambda size: employees(
+                lambda crud: crud.get_all(limit=100, include_tasks=True)
+            ),
+        ),
+        Scenario(
+            "crud",
+            "employees.get_by_query",
+            lambda size: employees(
+                lambda crud: crud.get_by_query(query="Employee 00001", limit=100)
+            ),
+        ),
+        Scenario(
+            "crud",
+            "employees.get_workload",
+            lambda size: employees(lambda crud: crud.get_workload()),
+        ),
+        Scenario(
+            "crud",
+            "tasks.create",
+            lambda size: tasks(
+                lambda crud: crud.create(task=TaskRequest(title="benchmark"))
+            ),
+            writes=True,
+        ),
+        Scenario(
+            "crud",
+            "tasks.create_many[100]",
+            lambda size: tasks(
+                lambda crud: crud.create_many(
+                    tasks=[{"title": f"benchmark {n}"} for n in range(100)]
+                )
+            ),
+            writes=True,
+        ),
+        Scenario("crud", "tasks.update", updated_task, writes=True),
+    ]
+
+
+def http_scenarios(client: httpx.AsyncClient) -> list[Scenario]:
+    """
+    Маршруты FastAPI, вызываемые через httpx.AsyncClient поверх ASGI-приложения.
+    """
+
+    def get(url: str, **params: Any) -> Callable[[int], Callable[[], Awaitable]]:
+        def build(size: int) -> Callable[[], Awaitable]:
+            async def operation() -> httpx.Response:
+                response = await client.get(url, params=params)
+                response.raise_for_status()
+                return response
+
+            return operation
+
+        return build
+
+    def post(url: str, body: Any) -> Callable[[int], Callable[[], Awaitable]]:
+        def build(size: int) -> Callable[[], Awaitable]:
+            async def operation() -> httpx.Response:
+                response = await client.post(url, json=body)
+                response.raise_for_status()
+                return response
+
+            return operation
+
+        return build
+
+    def employee_tasks(size: int) -> Callable[[], Awaitable]:
+        counter = itertools.count(1)
+
+        async def operation() -> httpx.Response:
+            employee_id = next(counter) % employees_for(size) + 1
+            response = await client.get(
+                TASKS_URL, params={"employee_id": employee_id, "limit": 100}
+            )
+            response.raise_for_status()
+            return response
+
+        return operation
+
+    return [
+        Scenario(
+            "http", "GET /tasks/all?limit=100", get(f"{TASKS_URL}/all", limit=100)
+        ),
+        Scenario(
+            "http", "GET /tasks/all?limit=1000", get(f"{TASKS_URL}/all", limit=1000)
+        ),
+        Scenario(
+            "http",
+            "GET /tasks?status=todo&sort=completed_at",
+            get(TASKS_URL, status="todo", sort="completed_at", limit=100),
+        ),
+        Scenario("http", "GET /tasks?employee_id=…", employee_tasks),
+        Scenario(
+            "http",
+            "GET /tasks/query",
+            get(f"{TASKS_URL}/query", query="invoice", limit=100),
+        ),
+        Scenario("http", "GET /tasks/export", get(f"{TASKS_URL}/export"), iterations=3),
+        Scenario(
+            "http",
+            "GET /employees/all?include=tasks",
+            get(f"{EMPLOYEES_URL}/all", limit=100, include="tasks"),
+        ),
+        Scenario("http", "GET /employees/workload", get(f"{EMPLOYEES_URL}/workload")),
+        Scenario(
+            "http",
+            "POST /tasks/new",
+            post(f"{TASKS_URL}/new", {"title": "benchmark"}),
+            writes=True,
+        ),
+        Scenario(
+            "http",
+            "POST /tasks/bulk[100]",
+            post(
+                f"{TASKS_URL}/bulk", [{"title": f"benchmark {n}"} for n in range(100)]
+            ),
+            writes=True,
+        ),
+    ]
@@ -0,0 +1,16 @@
+__all__ = (
+    "CacheBackend",
+    "CacheStats",
+    "MemoryCacheBackend",
+    "RedisCacheBackend",
+    "ReadCache",
+    "read_cache",
+)
+
+from .backends import (
+    CacheBackend,
+    CacheStats,
+    MemoryCacheBackend,
+    RedisCacheBackend,
+)
+from .read_cache import ReadCache, read_cache
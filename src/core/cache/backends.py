@@ -0,0 +1,170 @@
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import asdict, dataclass
+from typing import Any
+
+import orjson
+
+
+@dataclass
+class CacheStats:
+    """
+    Счетчики работы кэша.
+    """
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    invalidations: int = 0
+
+    def as_dict(self) -> dict[str, int]:
+        return asdict(self)
+
+
+class CacheBackend(ABC):
+    """
+    Хранилище кэша: значения с TTL и версии пространств имен.
+
+    Значения должны сериализоваться в JSON; None означает отсутствие значения.
+    shared — хранилище общее для всех процессов приложения, поэтому версии
+    пространств имен учитывают записи любого воркера. Вместе с версией
+    хранится время последней записи (time.time()), по которому проверяется
+    свежесть данных реплик.
+    """
+
+    name: str
+    shared: bool = False
+
+    def __init__(self) -> None:
+        self.stats = CacheStats()
+
+    @abstractmethod
+    async def get(self, key: str) -> Any | None: ...
+
+    @abstractmethod
+    async def set(self, key: str, value: Any, ttl: int) -> None: ...
+
+    @abstractmethod
+    async def get_version(self, namespace: str) -> int: ...
+
+    @abstractmethod
+    async def bump_version(self, namespace: str) -> int: ...
+
+    @abstractmethod
+    async def get_written_at(self, namespace: str) -> float: ...
+
+
+class MemoryCacheBackend(CacheBackend):
+    """
+    Кэш в памяти процесса с вытеснением по LRU и сроком жизни записей.
+
+    Версии пространств имен хранятся отдельно и не вытесняются; отсчет
+    начинается со времени запуска, чтобы версии не повторялись после рестарта.
+    Возвращаемые значения не копируются и не должны изменяться вызывающим кодом.
+    """
+
+    name = "memory"
+    shared = False
+
+    def __init__(self, max_entries: int = 10_000) -> None:
+        super().__init__()
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, tuple[float, Any]] = OrderedDict()
+        self._versions: dict[str, int] = {}
+        self._written_at: dict[str, float] = {}
+        self._initial_version = time.time_ns()
+
+    async def get(self, key: str) -> Any | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            del self._entries[key]
+            self.stats.expirations += 1
+            return None
+
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: Any, ttl: int) -> None:
+        self._entries[key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(key)
+
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.stats.evictions += 1
+
+    async def get_version(self, namespace: str) -> int:
+        return self._versions.get(namespace, self._initial_version)
+
+    async def bump_version(self, namespace: str) -> int:
+        self._written_at[namespace] = time.time()
+        self._versions[namespace] = await self.get_version(namespace) + 1
+        return self._versions[namespace]
+
+    async def get_written_at(self, namespace: str) -> float:
+        return self._written_at.get(namespace, 0.0)
+
+
+class RedisCacheBackend(CacheBackend):
+    """
+    Кэш в Redis (или совместимом сервере), общий для всех воркеров.
+
+    Вытеснение выполняет сам сервер, поэтому счетчик evictions не ведется.
+    """
+
+    name = "redis"
+    shared = True
+
+    def __init__(self, client: Any, prefix: str = "task_tracker") -> None:
+        super().__init__()
+        self.client = client
+        self.prefix = prefix
+
+    @classmethod
+    def from_url(cls, url: str, prefix: str = "task_tracker") -> "RedisCacheBackend":
+        """
+        Создание хранилища по адресу сервера; требует установленного пакета redis.
+
+        :param url: адрес сервера, например redis://localhost:6379/0
+        :param prefix: префикс ключей версий
+        :return: экземпляр RedisCacheBackend
+        """
+        try:
+            from redis.asyncio import Redis
+        except ImportError as exc:
+            raise RuntimeError(
+                "Redis cache backend requires the 'redis' package"
+            ) from exc
+
+        return cls(client=Redis.from_url(url), prefix=prefix)
+
+    def _version_key(self, namespace: str) -> str:
+        return f"{self.prefix}:version:{namespace}"
+
+    def _written_at_key(self, namespace: str) -> str:
+        return f"{self.prefix}:written_at:{namespace}"
+
+    async def get(self, key: str) -> Any | None:
+        raw = await self.client.get(key)
+        return None if raw is None else orjson.loads(raw)
+
+    async def set(self, key: str, value: Any, ttl: int) -> None:
+        await self.client.set(key, orjson.dumps(value), ex=ttl)
+
+    async def get_version(self, namespace: str) -> int:
+        raw = await self.client.get(self._version_key(namespace))
+        return 0 if raw is None else int(raw)
+
+    async def bump_version(self, namespace: str) -> int:
+        # Время записывается до версии: увидевший новую версию увидит и его
+        await self.client.set(self._written_at_key(namespace), repr(time.time()))
+        return int(await self.client.incr(self._version_key(namespace)))
+
+    async def get_written_at(self, namespace: str) -> float:
+        raw = await self.client.get(self._written_at_key(namespace))
+        return 0.0 if raw is None else float(raw)
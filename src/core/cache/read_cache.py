@@ -0,0 +1,133 @@
+import hashlib
+from typing import Any, Awaitable, Callable, Hashable
+
+import orjson
+
+from core.config import CacheConfig, settings
+from .backends import CacheBackend, MemoryCacheBackend, RedisCacheBackend
+
+
+class ReadCache:
+    """
+    Кэш чтения (read-through) перед CRUD-классами.
+
+    Ключ учитывает параметры запроса и текущую версию пространства имен;
+    запись инвалидирует пространство имен увеличением его версии, после чего
+    прежние ключи больше не используются и истекают по TTL.
+    """
+
+    def __init__(
+        self,
+        backend: CacheBackend,
+        ttl: int = 5,
+        enabled: bool = True,
+        prefix: str = "task_tracker",
+    ) -> None:
+        self.backend = backend
+        self.ttl = ttl
+        self.enabled = enabled
+        self.prefix = prefix
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        return {
+            "backend": self.backend.name,
+            "enabled": self.enabled,
+            **self.backend.stats.as_dict(),
+        }
+
+    @property
+    def shared(self) -> bool:
+        return self.backend.shared
+
+    async def version(self, namespace: str) -> int:
+        return await self.backend.get_version(namespace)
+
+    async def is_fresh(self, synced_at: float | None, *namespaces: str) -> bool:
+        """
+        Проверка, что данные источника чтения не старше версий пространств имен.
+
+        Реплика, еще не воспроизведшая последнюю запись, вернула бы прежние
+        данные, которые сохранились бы в кэше (и получили бы ETag) под
+        новой версией.
+
+        :param synced_at: момент, записи до которого видны в источнике
+            (None — основная база)
+        :param namespaces: пространства имен, от которых зависят данные
+        :return: True, если результат чтения можно кэшировать
+        """
+        if synced_at is None:
+            return True
+        for namespace in namespaces:
+            if synced_at < await self.backend.get_written_at(namespace):
+                return False
+        return True
+
+    async def get_or_load(
+        self,
+        namespace: str,
+        key: tuple[Hashable, ...],
+        loader: Callable[[], Awaitable[Any]],
+        ttl: int | None = None,
+        synced_at: float | None = None,
+    ) -> Any:
+        """
+        Получение значения из кэша либо загрузка и сохранение при промахе.
+
+        :param namespace: пространство имен (таблица), например "tasks"
+        :param key: параметры запроса, однозначно определяющие результат
+        :param loader: функция загрузки; должна вернуть JSON-совместимое значение
+        :param ttl: срок жизни значения, если он короче общего TTL кэша
+        :param synced_at: свежесть источника чтения (replica_synced_at);
+            данные отставшей реплики загружаются без кэширования
+        :return: закэшированное или загруженное значение
+        """
+        if not self.enabled or not await self.is_fresh(synced_at, namespace):
+            return await loader()
+
+        version = await self.backend.get_version(namespace)
+        digest = hashlib.sha1(orjson.dumps(key)).hexdigest()
+        cache_key = f"{self.prefix}:{namespace}:{version}:{digest}"
+
+        value = await self.backend.get(cache_key)
+        if value is not None:
+            self.backend.stats.hits += 1
+            return value
+
+        self.backend.stats.misses += 1
+        value = await loader()
+        await self.backend.set(
+            cache_key, value, self.ttl if ttl is None else min(ttl, self.ttl)
+        )
+        return value
+
+    async def invalidate(self, *namespaces: str) -> None:
+        """
+        Инвалидация всех закэшированных чтений указанных пространств имен.
+
+        :param namespaces: пространства имен, затронутые записью
+        """
+        for namespace in namespaces:
+            await self.backend.bump_version(namespace)
+            self.backend.stats.invalidations += 1
+
+
+def build_backend(config: CacheConfig) -> CacheBackend:
+    """
+    Создание хранилища кэша по настройкам приложения.
+
+    :param config: настройки кэша
+    :return: экземпляр CacheBackend
+    """
+    if config.backend == "redis":
+        return RedisCacheBackend.from_url(config.redis_url, prefix=config.prefix)
+
+    return MemoryCacheBackend(max_entries=config.max_entries)
+
+
+read_cache = ReadCache(
+    backend=build_backend(settings.cache),
+    ttl=settings.cache.ttl,
+    enabled=settings.cache.enabled,
+    prefix=settings.cache.prefix,
+)
@@ -1,9 +1,24 @@
-from pydantic import BaseModel
-from pydantic import PostgresDsn
+from typing import Annotated, Literal
+
+from pydantic import AfterValidator, BaseModel
 from pydantic_settings import (
     BaseSettings,
     SettingsConfigDict,
 )
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import ArgumentError
+
+
+def check_database_url(value: str) -> str:
+    try:
+        make_url(value)
+    except ArgumentError as exc:
+        raise ValueError(str(exc)) from exc
+    return value
+
+
+# Адрес базы данных в формате SQLAlchemy (dialect+driver://...)
+DatabaseUrl = Annotated[str, AfterValidator(check_database_url)]
 
 
 class RunConfig(BaseModel):
@@ -15,6 +30,9 @@ class ApiV1Prefix(BaseModel):
     prefix: str = "/v1"
     employees: str = "/employees"
     tasks: str = "/tasks"
+    service: str = "/service"
+    events: str = "/events"
+    jobs: str = "/jobs"
 
 
 class ApiPrefix(BaseModel):
@@ -22,12 +40,100 @@ class ApiPrefix(BaseModel):
     v1: ApiV1Prefix = ApiV1Prefix()
 
 
+class PaginationConfig(BaseModel):
+    default_limit: int = 100
+    max_limit: int = 1000
+
+
+class ExportConfig(BaseModel):
+    batch_size: int = 1000
+
+
+class BulkConfig(BaseModel):
+    max_items: int = 10_000
+
+
+class ImportConfig(BaseModel):
+    batch_size: int = 10_000  # Строк на одну проверку и один COPY
+    max_errors: int = 1000  # Ошибок в отчете, остальные только считаются
+    read_size: int = 1 << 20  # Байт за одно чтение файла (CLI)
+    # Максимальная длина одной записи файла: незакрытая кавычка в CSV
+    # не должна накапливать в памяти весь оставшийся файл
+    max_record_size: int = 1 << 20
+
+
+class CacheConfig(BaseModel):
+    enabled: bool = True
+    backend: Literal["memory", "redis"] = "memory"
+    ttl: int = 5
+    max_entries: int = 10_000
+    redis_url: str = "redis://localhost:6379/0"
+    prefix: str = "task_tracker"
+    # Точность подсчета просроченных задач в нагрузке сотрудников (секунды):
+    # сводка рассчитывается на начало интервала и кэшируется в его пределах
+    workload_interval: int = 60
+
+
+class MonitoringConfig(BaseModel):
+    enabled: bool = True
+    server_timing: bool = True
+    slow_request_threshold: float | None = None  # секунды
+    max_logged_statements: int = 50
+
+
+class QueryGuardConfig(BaseModel):
+    # lazy="raise" для отношений: ленивая загрузка вызывает исключение
+    strict_loading: bool = False
+    # Максимум SQL-запросов на один HTTP-запрос (None — без ограничения)
+    max_statements: int | None = None
+    mode: Literal["warn", "raise"] = "warn"
+
+
+class EventsConfig(BaseModel):
+    # Фоновая рассылка событий outbox подписчикам ленты изменений
+    enabled: bool = True
+    poll_interval: float = 0.5  # секунды
+    batch_size: int = 500
+    retention: int = 7 * 24 * 3600  # секунды
+    prune_interval: float = 3600.0
+    queue_size: int = 1000
+    heartbeat_interval: float = 15.0
+
+
+class SyncConfig(BaseModel):
+    # Срок действия токена синхронизации задач (секунды): отметки об удалении
+    # старше него удаляются, а клиент с более старым токеном получает 410
+    # и выполняет полную синхронизацию
+    retention: int = 30 * 24 * 3600
+    prune_interval: float = 3600.0
+
+
+class JobsConfig(BaseModel):
+    workers: int = 2
+    queue_size: int = 100
+    max_finished: int = 1000  # Завершенные задания, хранимые для просмотра
+    # Строк на одну транзакцию при массовом удалении
+    chunk_size: int = 5000
+
+
 class DatabaseConfig(BaseModel):
-    url: PostgresDsn
+    url: DatabaseUrl
     echo: bool = False
     echo_pool: bool = False
-    pool_size: int = 50
+    pool_size: int = 5
     max_overflow: int = 10
+    pool_timeout: float = 30.0
+    pool_recycle: int = 1800
+    pool_pre_ping: bool = False
+    statement_cache_size: int = 100
+    prepared_statement_cache_size: int = 100
+    statement_timeout: int | None = None  # миллисекунды
+    pgbouncer: bool = False
+    replica_urls: list[DatabaseUrl] = []
+    # Пауза перед повторным обращением к реплике после ошибки соединения
+    replica_retry_interval: float = 5.0
+    # Период активной проверки реплик: доступность и отставание (позиция WAL)
+    replica_probe_interval: float = 1.0
 
     naming_convention: dict[str, str] = {
         "ix": "ix_%(column_0_label)s",
@@ -50,6 +156,16 @@ class Settings(BaseSettings):
     )
     run: RunConfig = RunConfig()
     api: ApiPrefix = ApiPrefix()
+    pagination: PaginationConfig = PaginationConfig()
+    export: ExportConfig = ExportConfig()
+    bulk: BulkConfig = BulkConfig()
+    imports: ImportConfig = ImportConfig()
+    cache: CacheConfig = CacheConfig()
+    monitoring: MonitoringConfig = MonitoringConfig()
+    query_guard: QueryGuardConfig = QueryGuardConfig()
+    events: EventsConfig = EventsConfig()
+    sync: SyncConfig = SyncConfig()
+    jobs: JobsConfig = JobsConfig()
     db: DatabaseConfig
 
 
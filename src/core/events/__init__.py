@@ -0,0 +1,14 @@
+__all__ = (
+    "ChangeEvent",
+    "EventBroker",
+    "OutboxDispatcher",
+    "Subscription",
+    "append_events",
+    "event_broker",
+    "events_from",
+    "outbox_dispatcher",
+)
+
+from .broker import ChangeEvent, EventBroker, Subscription, event_broker
+from .dispatcher import OutboxDispatcher, outbox_dispatcher
+from .outbox import append_events, events_from
@@ -0,0 +1,149 @@
+import asyncio
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Iterator
+
+import orjson
+from sqlalchemy import Row
+
+from core.config import settings
+from core.schemas import format_timestamp
+
+
+# Позиция в ленте изменений: (номер транзакции, ID события)
+Position = tuple[int, int]
+
+
+@dataclass(frozen=True)
+class ChangeEvent:
+    """
+    Событие ленты изменений; данные кодируются в JSON один раз
+    для всех подписчиков.
+    """
+
+    id: int
+    seq: int
+    name: str
+    data: bytes
+
+    @property
+    def position(self) -> Position:
+        return self.seq, self.id
+
+    @classmethod
+    def from_row(cls, row: Row) -> "ChangeEvent":
+        """
+        :param row: строка (id, seq, aggregate, aggregate_id, event_type,
+            payload, created_at) таблицы outbox_events
+        """
+        (
+            event_id,
+            seq,
+            aggregate,
+            aggregate_id,
+            event_type,
+            payload,
+            created_at,
+        ) = row
+        data = {
+            "id": aggregate_id,
+            "aggregate": aggregate,
+            "type": event_type,
+            "payload": payload,
+            "created_at": format_timestamp(created_at),
+        }
+        return cls(event_id, seq, f"{aggregate}.{event_type}", orjson.dumps(data))
+
+    @classmethod
+    def reset(cls, position: Position) -> "ChangeEvent":
+        """
+        Событие для клиента, продолжающего чтение с позиции, события после
+        которой уже удалены: состояние нужно загрузить заново.
+        """
+        seq, event_id = position
+        return cls(event_id, seq, "reset", orjson.dumps({"position": event_id}))
+
+    def to_sse(self) -> bytes:
+        return b"id: %d\nevent: %s\ndata: %s\n\n" % (
+            self.id,
+            self.name.encode(),
+            self.data,
+        )
+
+
+class Subscription:
+    """
+    Очередь пачек событий одного подписчика.
+
+    Если подписчик не успевает читать, его очередь сбрасывается и вместо
+    событий кладется None: пропущенное дочитывается из outbox.
+    """
+
+    def __init__(self, queue_size: int) -> None:
+        self.queue: asyncio.Queue[list[ChangeEvent] | None] = asyncio.Queue(
+            maxsize=queue_size
+        )
+        self.closed = False
+
+    def put(self, events: list[ChangeEvent] | None) -> None:
+        try:
+            self.queue.put_nowait(events)
+        except asyncio.QueueFull:
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(None)
+
+    async def get(self, timeout: float) -> list[ChangeEvent] | None:
+        """
+        :param timeout: время ожидания, секунды
+        :return: пачка событий; пустой список, если за время ожидания событий
+            не было; None, если события пропущены и их нужно прочитать из outbox
+        """
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return []
+
+
+class EventBroker:
+    """
+    Рассылка событий подписчикам внутри процесса.
+
+    position — позиция последнего разосланного события: все события
+    до нее включительно уже есть в outbox, следующие придут через очередь
+    подписки.
+    """
+
+    def __init__(self, queue_size: int = 1000) -> None:
+        self.queue_size = queue_size
+        self.position: Position = (0, 0)
+        self.subscribers: set[Subscription] = set()
+
+    @property
+    def stats(self) -> dict[str, Any]:
+        return {"position": self.position[1], "subscribers": len(self.subscribers)}
+
+    @contextmanager
+    def subscribe(self) -> Iterator[Subscription]:
+        subscription = Subscription(self.queue_size)
+        self.subscribers.add(subscription)
+        try:
+            yield subscription
+        finally:
+            self.subscribers.discard(subscription)
+
+    def publish(self, events: list[ChangeEvent]) -> None:
+        self.position = events[-1].position
+        for subscription in self.subscribers:
+            subscription.put(events)
+
+    def close(self) -> None:
+        """
+        Завершение всех подписок (остановка приложения).
+        """
+        for subscription in self.subscribers:
+            subscription.closed = True
+            subscription.put(None)
+
+
+event_broker = EventBroker(queue_size=settings.events.queue_size)
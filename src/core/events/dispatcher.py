@@ -0,0 +1,224 @@
+import asyncio
+import logging
+import time
+from contextlib import suppress
+from datetime import timedelta
+from typing import AsyncIterator
+
+from sqlalchemy import delete, event, func, select, tuple_
+
+from core.config import settings
+from core.models import OutboxEvent, db_helper, settled_seq
+from core.models.db_helper import DatabaseHelper
+from .broker import ChangeEvent, EventBroker, Position, event_broker
+
+logger = logging.getLogger(__name__)
+
+event_columns = (
+    OutboxEvent.id,
+    OutboxEvent.seq,
+    OutboxEvent.aggregate,
+    OutboxEvent.aggregate_id,
+    OutboxEvent.event_type,
+    OutboxEvent.payload,
+    OutboxEvent.created_at,
+)
+
+
+class OutboxDispatcher:
+    """
+    Фоновая задача, читающая новые события outbox по порядку (seq, id)
+    и рассылающая их подписчикам через EventBroker.
+
+    Новые события ищутся раз в poll_interval, а также сразу после каждой
+    фиксации транзакции в этом процессе. Читаются только события транзакций
+    с номером меньше pg_snapshot_xmin: все такие транзакции завершены,
+    поэтому позже перед разосланным событием не появится новое, а ID
+    откатившейся транзакции ленту не задерживают.
+    """
+
+    def __init__(
+        self,
+        db: DatabaseHelper,
+        broker: EventBroker,
+        poll_interval: float = 0.5,
+        batch_size: int = 500,
+        retention: int = 7 * 24 * 3600,
+        prune_interval: float = 3600.0,
+    ) -> None:
+        self.db = db
+        self.broker = broker
+        self.poll_interval = poll_interval
+        self.batch_size = batch_size
+        self.retention = retention
+        self.prune_interval = prune_interval
+        self._task: asyncio.Task | None = None
+        self._wakeup = asyncio.Event()
+
+    @property
+    def running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    async def start(self) -> None:
+        if self.running:
+            return
+        stmt = (
+            select(OutboxEvent.seq, OutboxEvent.id)
+            .where(OutboxEvent.seq < settled_seq)
+            .order_by(OutboxEvent.seq.desc(), OutboxEvent.id.desc())
+            .limit(1)
+        )
+        async with self.db.session_factory() as session:
+            last = (await session.execute(stmt)).one_or_none()
+        self.broker.position = (0, 0) if last is None else tuple(last)
+        self._wakeup = asyncio.Event()
+        event.listen(self.db.engine.sync_engine, "commit", self._on_commit)
+        self._task = asyncio.create_task(self._run(), name="outbox-dispatcher")
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        event.remove(self.db.engine.sync_engine, "commit", self._on_commit)
+        self._task.cancel()
+        with suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+        self.broker.close()
+
+    def wake(self) -> None:
+        self._wakeup.set()
+
+    def _on_commit(self, connection) -> None:
+        self.wake()
+
+    async def _run(self) -> None:
+        next_prune = time.monotonic() + self.prune_interval
+        while True:
+            loaded = 0
+            try:
+                loaded = await self.dispatch()
+                if time.monotonic() >= next_prune:
+                    next_prune = time.monotonic() + self.prune_interval
+                    await self.prune()
+            except Exception as exc:
+                logger.error(f"Error dispatching outbox events: {exc}")
+
+            if loaded < self.batch_size:
+                with suppress(asyncio.TimeoutError):
+                    await asyncio.wait_for(self._wakeup.wait(), self.poll_interval)
+                self._wakeup.clear()
+
+    async def dispatch(self) -> int:
+        """
+        Рассылка очередной пачки событий после broker.position.
+
+        :return: количество прочитанных событий (равно batch_size,
+            если, возможно, прочитаны не все)
+        """
+        stmt = (
+            select(*event_columns)
+            .where(
+                tuple_(OutboxEvent.seq, OutboxEvent.id) > tuple_(*self.broker.position),
+                OutboxEvent.seq < settled_seq,
+            )
+            .order_by(OutboxEvent.seq, OutboxEvent.id)
+            .limit(self.batch_size)
+        )
+        async with self.db.session_factory() as session:
+            rows = (await session.execute(stmt)).all()
+
+        if rows:
+            self.broker.publish([ChangeEvent.from_row(row) for row in rows])
+        return len(rows)
+
+    async def prune(self) -> None:
+        """
+        Удаление событий старше retention секунд.
+        """
+        stmt = delete(OutboxEvent).where(
+            OutboxEvent.created_at < func.now() - timedelta(seconds=self.retention)
+        )
+        async with self.db.session_factory() as session:
+            result = await session.execute(stmt)
+            await session.commit()
+        if result.rowcount:
+            logger.info(f"Pruned {result.rowcount} outbox events")
+
+    async def _resume_position(self, after: int) -> Position | None:
+        """
+        Позиция клиента по ID последнего полученного события.
+
+        :return: позиция или None, если события после нее уже удалены
+        """
+        async with self.db.session_factory() as session:
+            if after == 0:
+                first_id = await session.scalar(select(func.min(OutboxEvent.id)))
+                return (0, 0) if first_id is None or first_id <= 1 else None
+            seq = await session.scalar(
+                select(OutboxEvent.seq).where(OutboxEvent.id == after)
+            )
+        return None if seq is None else (seq, after)
+
+    async def _load(self, after: Position, until: Position) -> list[ChangeEvent]:
+        position = tuple_(OutboxEvent.seq, OutboxEvent.id)
+        stmt = (
+            select(*event_columns)
+            .where(position > tuple_(*after), position <= tuple_(*until))
+            .order_by(OutboxEvent.seq, OutboxEvent.id)
+            .limit(self.batch_size)
+        )
+        async with self.db.session_factory() as session:
+            rows = (await session.execute(stmt)).all()
+        return [ChangeEvent.from_row(row) for row in rows]
+
+    async def follow(
+        self, after: int | None, heartbeat_interval: float
+    ) -> AsyncIterator[list[ChangeEvent]]:
+        """
+        Лента изменений для одного клиента: события после позиции after
+        из outbox, затем новые события по мере их рассылки.
+
+        Соединение с базой данных берется только на время дочитывания
+        из outbox, а не на все время подписки.
+
+        :param after: ID последнего полученного клиентом события;
+            None — только новые события
+        :param heartbeat_interval: через сколько секунд без событий
+            выдать пустую пачку (для поддержания соединения)
+        :return: асинхронный итератор пачек событий
+        """
+        with self.broker.subscribe() as subscription:
+            position = self.broker.position
+            if after is not None:
+                resumed = await self._resume_position(after)
+                if resumed is None:
+                    yield [ChangeEvent.reset(position)]
+                else:
+                    position = resumed
+
+            while not subscription.closed:
+                while position < self.broker.position:
+                    events = await self._load(position, self.broker.position)
+                    if not events:
+                        position = self.broker.position
+                        break
+                    yield events
+                    position = events[-1].position
+
+                events = await subscription.get(heartbeat_interval)
+                if events is None:
+                    continue
+                events = [change for change in events if change.position > position]
+                if events:
+                    position = events[-1].position
+                yield events
+
+
+outbox_dispatcher = OutboxDispatcher(
+    db=db_helper,
+    broker=event_broker,
+    poll_interval=settings.events.poll_interval,
+    batch_size=settings.events.batch_size,
+    retention=settings.events.retention,
+    prune_interval=settings.events.prune_interval,
+)
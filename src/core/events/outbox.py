@@ -0,0 +1,65 @@
+from typing import Any, Iterable
+
+from sqlalchemy import CTE, ColumnElement, Insert, insert, literal, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.models import OutboxEvent
+
+
+async def append_events(
+    session: AsyncSession,
+    aggregate: str,
+    event_type: str,
+    changes: Iterable[tuple[int | None, dict[str, Any]]],
+) -> None:
+    """
+    Добавление событий в outbox в текущей транзакции сессии
+    (один INSERT на все события).
+
+    :param session: сессия, в транзакции которой выполнено изменение
+    :param aggregate: тип записи: "task" или "employee"
+    :param event_type: тип изменения: "created", "updated" или "deleted"
+    :param changes: пары (ID записи, данные события)
+    """
+    rows = [
+        {
+            "aggregate": aggregate,
+            "aggregate_id": aggregate_id,
+            "event_type": event_type,
+            "payload": payload,
+        }
+        for aggregate_id, payload in changes
+    ]
+    if rows:
+        await session.execute(insert(OutboxEvent), rows)
+
+
+def events_from(
+    changed: CTE,
+    aggregate: str,
+    event_type: str,
+    payload: ColumnElement[Any] | None = None,
+) -> Insert:
+    """
+    INSERT событий по строкам, возвращенным изменяющим CTE
+    (UPDATE/DELETE ... RETURNING id), — для массовых изменений,
+    ID которых заранее неизвестны и не передаются в приложение.
+
+    :param changed: CTE с RETURNING, содержащий столбец id
+    :param aggregate: тип записи: "task" или "employee"
+    :param event_type: тип изменения: "updated" или "deleted"
+    :param payload: выражение JSONB с данными события (по умолчанию {})
+    :return: выражение INSERT ... SELECT ... FROM changed
+    """
+    columns = ["aggregate", "aggregate_id", "event_type"]
+    values: list[ColumnElement[Any]] = [
+        literal(aggregate),
+        changed.c.id,
+        literal(event_type),
+    ]
+    if payload is not None:
+        columns.append("payload")
+        values.append(payload)
+    return insert(OutboxEvent).from_select(
+        columns, select(*values).select_from(changed)
+    )
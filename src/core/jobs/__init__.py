@@ -0,0 +1,19 @@
+__all__ = (
+    "Job",
+    "JobCancelled",
+    "JobFunc",
+    "JobQueueFull",
+    "JobRunner",
+    "JobStatus",
+    "job_runner",
+)
+
+from .runner import (
+    Job,
+    JobCancelled,
+    JobFunc,
+    JobQueueFull,
+    JobRunner,
+    JobStatus,
+    job_runner,
+)
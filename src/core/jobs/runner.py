@@ -0,0 +1,248 @@
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from contextlib import suppress
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from enum import Enum
+from typing import Any, Awaitable, Callable
+from uuid import uuid4
+
+from core.config import settings
+
+logger = logging.getLogger(__name__)
+
+
+class JobStatus(str, Enum):
+    PENDING = "pending"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+    CANCELLED = "cancelled"
+
+
+class JobCancelled(Exception):
+    """
+    Задание отменено; выбрасывается из Job.report между порциями работы.
+    """
+
+
+class JobQueueFull(RuntimeError):
+    """
+    Очередь заданий заполнена.
+    """
+
+
+def _isoformat(timestamp: float | None) -> str | None:
+    if timestamp is None:
+        return None
+    return datetime.fromtimestamp(timestamp, tz=timezone.utc).isoformat()
+
+
+@dataclass
+class Job:
+    """
+    Фоновое задание: состояние, прогресс и результат.
+    """
+
+    kind: str
+    id: str = field(default_factory=lambda: uuid4().hex)
+    status: JobStatus = JobStatus.PENDING
+    processed: int = 0
+    total: int | None = None
+    result: Any = None
+    error: str | None = None
+    cancel_requested: bool = False
+    created_at: float = field(default_factory=time.time)
+    started_at: float | None = None
+    finished_at: float | None = None
+
+    @property
+    def finished(self) -> bool:
+        return self.status in (
+            JobStatus.SUCCEEDED,
+            JobStatus.FAILED,
+            JobStatus.CANCELLED,
+        )
+
+    def report(self, processed: int, total: int | None = None) -> None:
+        """
+        Отметка прогресса после очередной порции работы; здесь же
+        задание останавливается, если запрошена отмена.
+
+        :param processed: количество обработанных записей
+        :param total: общее количество записей, если известно
+        :raises JobCancelled: если запрошена отмена задания
+        """
+        self.processed = processed
+        if total is not None:
+            self.total = total
+        if self.cancel_requested:
+            raise JobCancelled(f"Job {self.id} cancelled")
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "id": self.id,
+            "kind": self.kind,
+            "status": self.status.value,
+            "processed": self.processed,
+            "total": self.total,
+            "result": self.result,
+            "error": self.error,
+            "cancel_requested": self.cancel_requested,
+            "created_at": _isoformat(self.created_at),
+            "started_at": _isoformat(self.started_at),
+            "finished_at": _isoformat(self.finished_at),
+        }
+
+
+JobFunc = Callable[[Job], Awaitable[Any]]
+
+
+class JobRunner:
+    """
+    Очередь фоновых заданий и пул asyncio-обработчиков внутри процесса.
+
+    Задания хранятся в памяти процесса: после перезапуска приложения
+    их состояние теряется. Отмена кооперативная: задание завершает текущую
+    порцию (транзакцию) и останавливается при следующем вызове Job.report.
+    """
+
+    def __init__(
+        self, workers: int = 2, queue_size: int = 100, max_finished: int = 1000
+    ) -> None:
+        self.workers = workers
+        self.queue_size = queue_size
+        self.max_finished = max_finished
+        self.jobs: OrderedDict[str, Job] = OrderedDict()
+        self._queue: asyncio.Queue[tuple[Job, JobFunc]] = asyncio.Queue(queue_size)
+        self._tasks: list[asyncio.Task] = []
+        self._periodic: list[tuple[float, str, JobFunc]] = []
+
+    @property
+    def running(self) -> bool:
+        return bool(self._tasks)
+
+    async def start(self) -> None:
+        if self.running:
+            return
+        self._queue = asyncio.Queue(self.queue_size)
+        self._tasks = [
+            asyncio.create_task(self._work(), name=f"job-worker-{number}")
+            for number in range(self.workers)
+        ]
+        self._tasks += [
+            asyncio.create_task(
+                self._repeat(interval, kind, func), name=f"job-every-{kind}"
+            )
+            for interval, kind, func in self._periodic
+        ]
+
+    def every(self, interval: float, kind: str, func: JobFunc) -> None:
+        """
+        Регистрация периодического задания: после запуска обработчиков
+        оно ставится в очередь каждые interval секунд.
+
+        :param interval: период (секунды)
+        :param kind: тип задания, например "prune_task_tombstones"
+        :param func: асинхронная функция, выполняющая задание
+        """
+        self._periodic.append((interval, kind, func))
+
+    async def stop(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        for task in self._tasks:
+            with suppress(asyncio.CancelledError):
+                await task
+        self._tasks = []
+
+        for job in self.jobs.values():
+            if job.status is JobStatus.PENDING:
+                self._finish(job, JobStatus.CANCELLED, error="Application stopped")
+
+    def submit(self, kind: str, func: JobFunc) -> Job:
+        """
+        Постановка задания в очередь.
+
+        :param kind: тип задания, например "delete_tasks_by_status"
+        :param func: асинхронная функция, выполняющая задание; получает Job
+            для отметки прогресса и возвращает JSON-совместимый результат
+        :return: созданное задание
+        :raises JobQueueFull: если очередь заполнена
+        """
+        job = Job(kind=kind)
+        try:
+            self._queue.put_nowait((job, func))
+        except asyncio.QueueFull:
+            raise JobQueueFull("Too many pending jobs") from None
+        self.jobs[job.id] = job
+        self._forget_finished()
+        return job
+
+    def get(self, job_id: str) -> Job | None:
+        return self.jobs.get(job_id)
+
+    def cancel(self, job_id: str) -> Job | None:
+        """
+        Отмена задания: ожидающее отменяется сразу, выполняющееся —
+        после текущей порции работы.
+
+        :param job_id: ID задания
+        :return: задание или None, если оно не найдено
+        """
+        job = self.jobs.get(job_id)
+        if job is None or job.finished:
+            return job
+
+        job.cancel_requested = True
+        if job.status is JobStatus.PENDING:
+            self._finish(job, JobStatus.CANCELLED)
+        return job
+
+    @staticmethod
+    def _finish(job: Job, status: JobStatus, error: str | None = None) -> None:
+        job.status = status
+        job.error = error
+        job.finished_at = time.time()
+
+    def _forget_finished(self) -> None:
+        finished = [job.id for job in self.jobs.values() if job.finished]
+        for job_id in finished[: max(len(finished) - self.max_finished, 0)]:
+            del self.jobs[job_id]
+
+    async def _repeat(self, interval: float, kind: str, func: JobFunc) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            try:
+                self.submit(kind, func)
+            except JobQueueFull:
+                logger.warning(f"Periodic job {kind} skipped: queue is full")
+
+    async def _work(self) -> None:
+        while True:
+            job, func = await self._queue.get()
+            if job.finished:
+                continue
+
+            job.status = JobStatus.RUNNING
+            job.started_at = time.time()
+            try:
+                job.result = await func(job)
+                self._finish(job, JobStatus.SUCCEEDED)
+            except JobCancelled:
+                self._finish(job, JobStatus.CANCELLED)
+            except asyncio.CancelledError:
+                self._finish(job, JobStatus.CANCELLED, error="Application stopped")
+                raise
+            except Exception as exc:
+                logger.error(f"Job {job.kind} {job.id} failed: {exc}")
+                self._finish(job, JobStatus.FAILED, error=str(exc))
+
+
+job_runner = JobRunner(
+    workers=settings.jobs.workers,
+    queue_size=settings.jobs.queue_size,
+    max_finished=settings.jobs.max_finished,
+)
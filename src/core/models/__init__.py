@@ -1,13 +1,20 @@
 __all__ = (
     "db_helper",
+    "replica_synced_at",
     "Base",
     "Employee",
     "Task",
+    "OutboxEvent",
+    "TaskTombstone",
     "EmployeeRelationMixin",
+    "settled_seq",
 )
 
-from .db_helper import db_helper
+from .db_helper import db_helper, replica_synced_at
 from .base import Base
 from .employee import Employee
 from .task import Task
+from .outbox_event import OutboxEvent
+from .task_tombstone import TaskTombstone
 from .mixin import EmployeeRelationMixin
+from .xact import settled_seq
@@ -7,6 +7,10 @@ from sqlalchemy.orm import declared_attr
 from core.config import settings
 from utils import camel_case_to_snake_case
 
+# Стратегия загрузки отношений по умолчанию; в строгом режиме ленивая
+# загрузка запрещена, и каждый N+1 сразу обнаруживается исключением
+RELATIONSHIP_LAZY = "raise" if settings.query_guard.strict_loading else "select"
+
 
 class Base(DeclarativeBase):
     __abstract__ = True
@@ -1,13 +1,155 @@
-from typing import AsyncGenerator
+import asyncio
+import itertools
+import logging
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from dataclasses import asdict, dataclass, field
+from typing import Any, AsyncGenerator, AsyncIterator, Sequence
+from uuid import uuid4
 
+from sqlalchemy import event, text
+from sqlalchemy.engine import make_url
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.ext.asyncio import (
     create_async_engine,
     AsyncEngine,
     async_sessionmaker,
     AsyncSession,
 )
+from sqlalchemy.pool import AsyncAdaptedQueuePool, NullPool
 
 from core.config import settings
+from core.monitoring import instrument_engine, instrument_sessions, record_pool_wait
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class PoolMetrics:
+    """
+    Счетчики пула соединений и время ожидания выдачи соединения.
+    """
+
+    connects: int = 0
+    checkouts: int = 0
+    checkins: int = 0
+    invalidations: int = 0
+    checkout_wait_count: int = 0
+    checkout_wait_seconds_total: float = 0.0
+    checkout_wait_seconds_max: float = 0.0
+
+    @property
+    def in_use(self) -> int:
+        return self.checkouts - self.checkins
+
+    def observe_checkout_wait(self, seconds: float) -> None:
+        self.checkout_wait_count += 1
+        self.checkout_wait_seconds_total += seconds
+        self.checkout_wait_seconds_max = max(self.checkout_wait_seconds_max, seconds)
+
+    def as_dict(self) -> dict[str, int | float]:
+        return {**asdict(self), "in_use": self.in_use}
+
+
+# Ключ Session.info: момент, записи до которого воспроизведены на реплике
+SYNCED_AT_KEY = "replica_synced_at"
+# Ключ info записи пула: время ожидания ее выдачи
+CHECKOUT_WAIT_KEY = "checkout_wait"
+
+
+class CheckoutTimerMixin:
+    """
+    Примесь к классу пула: время получения соединения (ожидание свободного
+    или открытие нового) сохраняется в info записи пула и учитывается
+    обработчиком события checkout. Соединение берется при первом запросе
+    сессии, поэтому ответы без обращения к базе пул не занимают.
+    """
+
+    def _do_get(self):
+        started = time.perf_counter()
+        record = super()._do_get()
+        record.info[CHECKOUT_WAIT_KEY] = time.perf_counter() - started
+        return record
+
+
+class TimedQueuePool(CheckoutTimerMixin, AsyncAdaptedQueuePool):
+    pass
+
+
+class TimedNullPool(CheckoutTimerMixin, NullPool):
+    pass
+
+
+@dataclass
+class ReplicaNode:
+    """
+    Реплика для чтения: движок, фабрика сессий и состояние доступности.
+
+    synced_at — время (time.time()), все транзакции основной базы до которого
+    уже воспроизведены на реплике; определяется активной проверкой.
+    """
+
+    url: str
+    engine: AsyncEngine
+    session_factory: async_sessionmaker[AsyncSession]
+    pool_metrics: PoolMetrics = field(default_factory=PoolMetrics)
+    unavailable_until: float = 0.0
+    synced_at: float = 0.0
+
+    @property
+    def is_available(self) -> bool:
+        return self.unavailable_until <= time.monotonic()
+
+
+def parse_lsn(value: str) -> int:
+    """
+    Позиция в журнале WAL (pg_lsn, например "16/B374D848") в виде числа.
+    """
+    high, low = value.split("/")
+    return (int(high, 16) << 32) | int(low, 16)
+
+
+def replica_synced_at(session: AsyncSession) -> float | None:
+    """
+    Свежесть данных сессии чтения.
+
+    :param session: сессия, полученная из read_session
+    :return: момент, записи до которого видны в сессии, или None для сессии
+        основной базы (видны все записи)
+    """
+    return session.info.get(SYNCED_AT_KEY)
+
+
+def asyncpg_connect_args(
+    statement_cache_size: int,
+    prepared_statement_cache_size: int,
+    statement_timeout: int | None,
+    pgbouncer: bool,
+) -> dict[str, Any]:
+    """
+    Параметры подключения asyncpg.
+
+    В режиме PgBouncer (transaction pooling) подготовленные выражения
+    отключаются, а statement_timeout не передается в стартовом пакете:
+    его следует задать для роли или базы данных (ALTER ROLE ... SET).
+
+    :return: словарь connect_args для create_async_engine
+    """
+    if pgbouncer:
+        return {
+            "statement_cache_size": 0,
+            "prepared_statement_cache_size": 0,
+            "prepared_statement_name_func": lambda: f"__asyncpg_{uuid4()}__",
+        }
+
+    connect_args: dict[str, Any] = {
+        "statement_cache_size": statement_cache_size,
+        "prepared_statement_cache_size": prepared_statement_cache_size,
+    }
+    if statement_timeout is not None:
+        connect_args["server_settings"] = {"statement_timeout": str(statement_timeout)}
+    return connect_args
 
 
 class DatabaseHelper:
@@ -18,29 +160,287 @@ class DatabaseHelper:
         echo_pool: bool = False,
         pool_size: int = 5,
         max_overflow: int = 10,
+        pool_timeout: float = 30.0,
+        pool_recycle: int = 1800,
+        pool_pre_ping: bool = False,
+        statement_cache_size: int = 100,
+        prepared_statement_cache_size: int = 100,
+        statement_timeout: int | None = None,
+        pgbouncer: bool = False,
+        replica_urls: Sequence[str] = (),
+        replica_retry_interval: float = 5.0,
+        replica_probe_interval: float = 1.0,
     ) -> None:
-        self.engine: AsyncEngine = create_async_engine(
-            url=url,
-            echo=echo,
-            echo_pool=echo_pool,
-            pool_size=pool_size,
-            max_overflow=max_overflow,
+        self._engine_options: dict[str, Any] = {
+            "echo": echo,
+            "echo_pool": echo_pool,
+            "pool_pre_ping": pool_pre_ping,
+        }
+        if pgbouncer:
+            # Пулом соединений управляет PgBouncer
+            self._engine_options["poolclass"] = TimedNullPool
+        else:
+            self._engine_options.update(
+                poolclass=TimedQueuePool,
+                pool_size=pool_size,
+                max_overflow=max_overflow,
+                pool_timeout=pool_timeout,
+                pool_recycle=pool_recycle,
+            )
+        self._asyncpg_connect_args = asyncpg_connect_args(
+            statement_cache_size=statement_cache_size,
+            prepared_statement_cache_size=prepared_statement_cache_size,
+            statement_timeout=statement_timeout,
+            pgbouncer=pgbouncer,
         )
 
-        self.session_factory: async_sessionmaker[AsyncSession] = async_sessionmaker(
-            bind=self.engine,
+        self.engine: AsyncEngine = self._create_engine(url)
+        instrument_sessions()
+        self.session_factory = self._create_session_factory(self.engine)
+        self.pool_metrics = PoolMetrics()
+        self._listen_pool_events(self.engine, self.pool_metrics)
+
+        self.replicas: list[ReplicaNode] = []
+        for replica_url in replica_urls:
+            engine = self._create_engine(replica_url)
+            replica = ReplicaNode(
+                url=make_url(replica_url).render_as_string(hide_password=True),
+                engine=engine,
+                session_factory=self._create_session_factory(engine),
+            )
+            self._listen_pool_events(engine, replica.pool_metrics)
+            self.replicas.append(replica)
+
+        self.replica_retry_interval = replica_retry_interval
+        self.replica_probe_interval = replica_probe_interval
+        self._replica_cycle = itertools.count()
+        self._last_primary_commit = 0.0
+        # Позиции WAL основной базы и время их получения, по возрастанию
+        self._primary_positions: deque[tuple[int, float]] = deque(maxlen=600)
+        self._probe_task: asyncio.Task | None = None
+        self._listen_primary_commits()
+
+    def _create_engine(self, url: str) -> AsyncEngine:
+        options = dict(self._engine_options)
+        if make_url(url).get_driver_name() == "asyncpg":
+            options["connect_args"] = self._asyncpg_connect_args
+        engine = create_async_engine(url=url, **options)
+        instrument_engine(engine)
+        return engine
+
+    @staticmethod
+    def _create_session_factory(
+        engine: AsyncEngine,
+    ) -> async_sessionmaker[AsyncSession]:
+        return async_sessionmaker(
+            bind=engine,
             autoflush=False,
             autocommit=False,
             expire_on_commit=False,
         )
 
+    @staticmethod
+    def _listen_pool_events(engine: AsyncEngine, metrics: PoolMetrics) -> None:
+        target = engine.sync_engine
+
+        @event.listens_for(target, "connect")
+        def on_connect(dbapi_connection, connection_record) -> None:
+            metrics.connects += 1
+
+        @event.listens_for(target, "checkout")
+        def on_checkout(dbapi_connection, connection_record, connection_proxy) -> None:
+            metrics.checkouts += 1
+            waited = connection_record.info.pop(CHECKOUT_WAIT_KEY, None)
+            if waited is not None:
+                metrics.observe_checkout_wait(waited)
+                record_pool_wait(waited)
+
+        @event.listens_for(target, "checkin")
+        def on_checkin(dbapi_connection, connection_record) -> None:
+            metrics.checkins += 1
+
+        @event.listens_for(target, "invalidate")
+        def on_invalidate(dbapi_connection, connection_record, exception) -> None:
+            metrics.invalidations += 1
+
+    def _listen_primary_commits(self) -> None:
+        @event.listens_for(self.engine.sync_engine, "commit")
+        def on_commit(connection) -> None:
+            self._last_primary_commit = time.time()
+
+    @staticmethod
+    def _pool_status(
+        engine: AsyncEngine, metrics: PoolMetrics
+    ) -> dict[str, int | float | str]:
+        pool = engine.pool
+        status: dict[str, int | float | str] = {
+            "pool": type(pool).__name__,
+            **metrics.as_dict(),
+        }
+        if hasattr(pool, "size"):
+            status.update(
+                size=pool.size(),
+                checked_in=pool.checkedin(),
+                overflow=pool.overflow(),
+            )
+        return status
+
+    def pool_status(self) -> dict[str, Any]:
+        """
+        Текущее состояние пулов соединений основной базы и реплик.
+
+        :return: словарь со сведениями о пулах
+        """
+        return {
+            **self._pool_status(self.engine, self.pool_metrics),
+            "replicas": [
+                {
+                    "url": replica.url,
+                    "available": replica.is_available,
+                    "lag_seconds": (
+                        max(time.time() - replica.synced_at, 0.0)
+                        if replica.synced_at
+                        else None
+                    ),
+                    **self._pool_status(replica.engine, replica.pool_metrics),
+                }
+                for replica in self.replicas
+            ],
+        }
+
+    async def start(self) -> None:
+        """
+        Запуск активной проверки реплик (если они настроены).
+        """
+        if self.replicas and self._probe_task is None:
+            self._probe_task = asyncio.create_task(self._probe_loop())
+
+    async def stop(self) -> None:
+        if self._probe_task is not None:
+            self._probe_task.cancel()
+            try:
+                await self._probe_task
+            except asyncio.CancelledError:
+                pass
+            self._probe_task = None
+
+    async def _probe_loop(self) -> None:
+        while True:
+            try:
+                await self.probe_replicas()
+            except Exception as exc:
+                logger.error(f"Read replica probe failed: {exc}")
+            await asyncio.sleep(self.replica_probe_interval)
+
+    @staticmethod
+    async def _wal_position(engine: AsyncEngine, function: str) -> int | None:
+        # У баз без потоковой репликации (не PostgreSQL) позиции нет
+        if engine.dialect.name != "postgresql":
+            async with engine.connect() as connection:
+                await connection.execute(text("SELECT 1"))
+            return None
+
+        async with engine.connect() as connection:
+            position = await connection.scalar(text(f"SELECT {function}::text"))
+        return None if position is None else parse_lsn(position)
+
+    def _mark_unavailable(self, replica: ReplicaNode, exc: BaseException) -> None:
+        replica.unavailable_until = time.monotonic() + self.replica_retry_interval
+        logger.warning(f"Read replica {replica.url} is unavailable: {exc!r}")
+
+    async def probe_replicas(self) -> None:
+        """
+        Проверка доступности реплик и воспроизведенной ими позиции WAL.
+
+        Позиция основной базы запоминается вместе со временем, полученным
+        до запроса, поэтому реплика, воспроизведшая эту позицию, содержит
+        все транзакции, завершенные до этого времени (synced_at).
+        Недоступная реплика исключается из чтения до следующей успешной
+        проверки.
+        """
+        sampled_at = time.time()
+        primary_position = await self._wal_position(self.engine, "pg_current_wal_lsn()")
+        if primary_position is not None:
+            self._primary_positions.append((primary_position, sampled_at))
+
+        for replica in self.replicas:
+            try:
+                replayed = await asyncio.wait_for(
+                    self._wal_position(replica.engine, "pg_last_wal_replay_lsn()"),
+                    timeout=self.replica_probe_interval,
+                )
+            except (OSError, asyncio.TimeoutError, SQLAlchemyError) as exc:
+                self._mark_unavailable(replica, exc)
+                continue
+
+            replica.unavailable_until = 0.0
+            if replayed is None or primary_position is None:
+                # Без репликации (например, та же база): отставания нет
+                replica.synced_at = sampled_at
+                continue
+            replica.synced_at = max(
+                (
+                    position_sampled_at
+                    for position, position_sampled_at in self._primary_positions
+                    if position <= replayed
+                ),
+                default=replica.synced_at,
+            )
+
     async def dispose(self) -> None:
+        await self.stop()
         await self.engine.dispose()
+        for replica in self.replicas:
+            await replica.engine.dispose()
+
+    def _read_replica(self) -> ReplicaNode | None:
+        """
+        Очередная доступная реплика (round-robin) или None.
+
+        После записи в этом процессе чтение идет в основную базу, пока
+        реплика не воспроизведет ее (по данным активной проверки), чтобы
+        не получить с реплики данные, еще не дошедшие до нее.
+        """
+        available = [
+            replica
+            for replica in self.replicas
+            if replica.is_available and replica.synced_at >= self._last_primary_commit
+        ]
+        if not available:
+            return None
+        return available[next(self._replica_cycle) % len(available)]
+
+    def _open_read_session(self) -> AsyncSession:
+        replica = self._read_replica()
+        if replica is None:
+            return self.session_factory()
+
+        session = replica.session_factory()
+        session.info[SYNCED_AT_KEY] = replica.synced_at
+        return session
 
     async def session_getter(self) -> AsyncGenerator[AsyncSession, None]:
         async with self.session_factory() as session:
             yield session
 
+    @asynccontextmanager
+    async def read_session(self) -> AsyncIterator[AsyncSession]:
+        """
+        Сессия только для чтения: реплика по кругу среди доступных,
+        при их отсутствии — основная база. Доступность реплик определяет
+        активная проверка (probe_replicas); соединение берется при первом
+        запросе сессии.
+
+        Свежесть данных реплики возвращает replica_synced_at(session).
+        """
+        session = self._open_read_session()
+        async with session:
+            yield session
+
+    async def read_session_getter(self) -> AsyncGenerator[AsyncSession, None]:
+        async with self.read_session() as session:
+            yield session
+
 
 db_helper = DatabaseHelper(
     url=str(settings.db.url),
@@ -48,4 +448,14 @@ db_helper = DatabaseHelper(
     echo_pool=settings.db.echo_pool,
     pool_size=settings.db.pool_size,
     max_overflow=settings.db.max_overflow,
+    pool_timeout=settings.db.pool_timeout,
+    pool_recycle=settings.db.pool_recycle,
+    pool_pre_ping=settings.db.pool_pre_ping,
+    statement_cache_size=settings.db.statement_cache_size,
+    prepared_statement_cache_size=settings.db.prepared_statement_cache_size,
+    statement_timeout=settings.db.statement_timeout,
+    pgbouncer=settings.db.pgbouncer,
+    replica_urls=settings.db.replica_urls,
+    replica_retry_interval=settings.db.replica_retry_interval,
+    replica_probe_interval=settings.db.replica_probe_interval,
 )
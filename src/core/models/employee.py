@@ -1,16 +1,30 @@
 from typing import TYPE_CHECKING, List, Optional
 
-from sqlalchemy import String, Boolean
+from sqlalchemy import String, Boolean, Index
 from sqlalchemy.orm import Mapped, relationship
 from sqlalchemy.orm import mapped_column
 
-from .base import Base
+from .base import Base, RELATIONSHIP_LAZY
 
 if TYPE_CHECKING:
     from .task import Task
 
 
 class Employee(Base):
+    __table_args__ = (
+        Index(
+            "ix_employees_fullname_trgm",
+            "fullname",
+            postgresql_using="gin",
+            postgresql_ops={"fullname": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_employees_position_trgm",
+            "position",
+            postgresql_using="gin",
+            postgresql_ops={"position": "gin_trgm_ops"},
+        ),
+    )
 
     fullname: Mapped[str] = mapped_column(String(50), unique=True)
     position: Mapped[str] = mapped_column(String(50))
@@ -20,7 +34,9 @@ class Employee(Base):
     refresh_token: Mapped[Optional[str]] = mapped_column(String(256))
     is_active: Mapped[bool] = mapped_column(Boolean, default=True)
 
-    tasks: Mapped[List["Task"]] = relationship(back_populates="employee")
+    tasks: Mapped[List["Task"]] = relationship(
+        back_populates="employee", lazy=RELATIONSHIP_LAZY
+    )
 
     def __str__(self):
         return self.fullname
@@ -3,6 +3,8 @@ from typing import TYPE_CHECKING
 from sqlalchemy import ForeignKey
 from sqlalchemy.orm import Mapped, mapped_column, relationship, declared_attr
 
+from .base import RELATIONSHIP_LAZY
+
 if TYPE_CHECKING:
     from .employee import Employee
 
@@ -22,4 +24,8 @@ class EmployeeRelationMixin:
 
     @declared_attr
     def employee(cls) -> Mapped["Employee"]:
-        return relationship("Employee", back_populates=cls._employee_back_populates)
+        return relationship(
+            "Employee",
+            back_populates=cls._employee_back_populates,
+            lazy=RELATIONSHIP_LAZY,
+        )
@@ -0,0 +1,47 @@
+from datetime import datetime
+from typing import Any
+
+from sqlalchemy import BigInteger, DateTime, Index, String, func
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.orm import Mapped
+from sqlalchemy.orm import mapped_column
+
+from .base import Base
+from .xact import current_xact_seq
+
+
+class OutboxEvent(Base):
+    """
+    Событие изменения задачи или сотрудника (transactional outbox).
+
+    Записывается в той же транзакции, что и само изменение, поэтому
+    события есть ровно у зафиксированных изменений. ID события — позиция
+    в ленте изменений, с которой клиент может продолжить чтение.
+
+    ID выдается последовательностью до фиксации транзакции, поэтому событие
+    с меньшим ID может стать видимым позже (или не появиться вовсе, если
+    транзакция откатилась). Лента упорядочена по (seq, id): seq — номер
+    транзакции, а события транзакций с номером меньше pg_snapshot_xmin
+    уже не изменятся.
+    """
+
+    __table_args__ = (Index("ix_outbox_events_seq_id", "seq", "id"),)
+
+    id: Mapped[int] = mapped_column(BigInteger, primary_key=True)
+    seq: Mapped[int] = mapped_column(BigInteger, server_default=current_xact_seq)
+    aggregate: Mapped[str] = mapped_column(String(20))  # "task", "employee"
+    aggregate_id: Mapped[int | None]
+    event_type: Mapped[str] = mapped_column(String(20))  # "created", "updated", ...
+    # Для "created" — запись целиком, для "updated" — измененные поля
+    payload: Mapped[dict[str, Any]] = mapped_column(JSONB, server_default="{}")
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        index=True,
+    )
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}(id={self.id}, aggregate={self.aggregate!r}, "
+            f"aggregate_id={self.aggregate_id}, event_type={self.event_type!r})"
+        )
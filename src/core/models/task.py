@@ -1,4 +1,5 @@
-from datetime import datetime, timedelta
+from datetime import datetime
+from sqlalchemy import BigInteger, DateTime, FetchedValue, Index, String, func, text
 from sqlalchemy.orm import Mapped
 from sqlalchemy.orm import mapped_column
 
@@ -8,23 +9,55 @@ from .mixin import EmployeeRelationMixin
 
 class Task(Base, EmployeeRelationMixin):
     _employee_back_populates = "tasks"
+    __table_args__ = (
+        Index(
+            "ix_tasks_title_trgm",
+            "title",
+            postgresql_using="gin",
+            postgresql_ops={"title": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_tasks_description_trgm",
+            "description",
+            postgresql_using="gin",
+            postgresql_ops={"description": "gin_trgm_ops"},
+        ),
+        Index("ix_tasks_status_priority_id", "status", "priority", "id"),
+        Index("ix_tasks_employee_id_status", "employee_id", "status"),
+        Index("ix_tasks_updated_seq_id", "updated_seq", "id"),
+    )
 
     title: Mapped[str] = mapped_column(index=True, default="Untitled")
     description: Mapped[str | None]
-    label: Mapped[str | None]
+    label: Mapped[str | None] = mapped_column(index=True)
     priority: Mapped[str] = mapped_column(index=True, default="medium")
     status: Mapped[str] = mapped_column(default="backlog")
     attachment: Mapped[str | None]
+    # Ключ задачи во внешней системе (или Idempotency-Key) для идемпотентного
+    # создания: повторная передача обновляет ту же задачу
+    external_id: Mapped[str | None] = mapped_column(String(100), unique=True)
 
-    created_at: Mapped[str] = mapped_column(
-        default=datetime.now().strftime("%Y-%m-%d %H:%M")
+    created_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        index=True,
+    )
+    last_update: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        onupdate=func.now(),
     )
-    last_update: Mapped[str] = mapped_column(
-        default=datetime.now().strftime("%Y-%m-%d %H:%M"),
-        onupdate=datetime.now().strftime("%Y-%m-%d %H:%M"),
+    completed_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=text("now() + interval '7 days'"),
+        index=True,
     )
-    completed_at: Mapped[str] = mapped_column(
-        default=(datetime.now() + timedelta(days=7)).strftime("%Y-%m-%d %H:%M")
+    # Номер транзакции последнего изменения (pg_current_xact_id), выставляется
+    # триггером; по нему выбираются изменения для синхронизации клиентов
+    updated_seq: Mapped[int] = mapped_column(
+        BigInteger,
+        server_default=text("pg_current_xact_id()::text::bigint"),
+        server_onupdate=FetchedValue(),
     )
 
     def __str__(self):
@@ -0,0 +1,31 @@
+from datetime import datetime
+
+from sqlalchemy import BigInteger, DateTime, Index, func
+from sqlalchemy.orm import Mapped
+from sqlalchemy.orm import mapped_column
+
+from .base import Base
+
+
+class TaskTombstone(Base):
+    """
+    Отметка об удаленной задаче для инкрементальной синхронизации.
+
+    Заполняется триггером на DELETE таблицы tasks; id — ID удаленной задачи,
+    deleted_seq — номер транзакции удаления (как Task.updated_seq).
+    """
+
+    __table_args__ = (Index("ix_task_tombstones_deleted_seq_id", "deleted_seq", "id"),)
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=False)
+    deleted_seq: Mapped[int] = mapped_column(BigInteger)
+    deleted_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True),
+        server_default=func.now(),
+        index=True,
+    )
+
+    def __repr__(self):
+        return (
+            f"{self.__class__.__name__}(id={self.id}, deleted_seq={self.deleted_seq})"
+        )
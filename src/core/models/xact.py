@@ -0,0 +1,11 @@
+from sqlalchemy import BigInteger, Text, cast, func, text
+
+# Номер текущей транзакции: значение по умолчанию для столбцов, по которым
+# изменения читаются в порядке завершения транзакций
+current_xact_seq = text("pg_current_xact_id()::text::bigint")
+
+# Номер самой ранней незавершенной транзакции: все изменения с меньшим
+# номером уже зафиксированы (или отменены) и видны
+settled_seq = cast(
+    cast(func.pg_snapshot_xmin(func.pg_current_snapshot()), Text), BigInteger
+)
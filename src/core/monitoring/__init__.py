@@ -0,0 +1,26 @@
+__all__ = (
+    "QueryGuardMiddleware",
+    "RequestMetrics",
+    "RequestMetricsMiddleware",
+    "StatementLimitExceeded",
+    "TimedORJSONResponse",
+    "current_request",
+    "instrument_engine",
+    "instrument_sessions",
+    "record_pool_wait",
+    "record_serialization",
+    "registry",
+    "render_samples",
+)
+
+from .context import (
+    RequestMetrics,
+    StatementLimitExceeded,
+    current_request,
+    record_pool_wait,
+    record_serialization,
+)
+from .middleware import QueryGuardMiddleware, RequestMetricsMiddleware
+from .prometheus import registry, render_samples
+from .responses import TimedORJSONResponse
+from .sql import instrument_engine, instrument_sessions
@@ -0,0 +1,110 @@
+import re
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+class StatementLimitExceeded(RuntimeError):
+    """
+    Запрос выполнил больше SQL-запросов, чем разрешено (признак N+1).
+    """
+
+
+@dataclass
+class RequestMetrics:
+    """
+    Показатели одного HTTP-запроса: SQL-запросы, время в базе данных,
+    ожидание соединения из пула и сериализация ответа.
+    """
+
+    statement_count: int = 0
+    lazy_load_count: int = 0
+    db_seconds: float = 0.0
+    pool_wait_seconds: float = 0.0
+    serialization_seconds: float = 0.0
+    keep_statements: bool = False
+    max_logged_statements: int = 50
+    statements: list[tuple[float, str]] = field(default_factory=list)
+    statement_limit: int | None = None
+    raise_on_limit: bool = False
+    limit_exceeded: bool = False
+
+    @property
+    def over_limit(self) -> bool:
+        # В режиме "raise" лишний запрос не выполняется и не учитывается
+        return self.limit_exceeded or (
+            self.statement_limit is not None
+            and self.statement_count > self.statement_limit
+        )
+
+    def check_statement_limit(self) -> None:
+        """
+        Проверка перед выполнением очередного SQL-запроса.
+
+        :raises StatementLimitExceeded: если запрос превысит лимит
+            и включен режим "raise"
+        """
+        if (
+            self.raise_on_limit
+            and self.statement_limit is not None
+            and self.statement_count >= self.statement_limit
+        ):
+            self.limit_exceeded = True
+            raise StatementLimitExceeded(
+                f"Request exceeded the limit of {self.statement_limit} SQL "
+                f"statements ({self.lazy_load_count} lazy loads), possible N+1 query"
+            )
+
+    def observe_statement(self, statement: str, seconds: float) -> None:
+        self.statement_count += 1
+        self.db_seconds += seconds
+        if self.keep_statements and len(self.statements) < self.max_logged_statements:
+            self.statements.append((seconds, _WHITESPACE.sub(" ", statement)[:500]))
+
+    def server_timing(self, total_seconds: float) -> str:
+        """
+        Значение заголовка Server-Timing (длительности в миллисекундах).
+
+        :param total_seconds: полное время обработки запроса
+        :return: строка заголовка
+        """
+        app_seconds = max(
+            total_seconds
+            - self.db_seconds
+            - self.pool_wait_seconds
+            - self.serialization_seconds,
+            0.0,
+        )
+        return ", ".join(
+            (
+                f'db;dur={self.db_seconds * 1000:.2f};desc="{self.statement_count} queries"',
+                f"pool;dur={self.pool_wait_seconds * 1000:.2f}",
+                f"serialize;dur={self.serialization_seconds * 1000:.2f}",
+                f"app;dur={app_seconds * 1000:.2f}",
+                f"total;dur={total_seconds * 1000:.2f}",
+            )
+        )
+
+
+current_request: ContextVar[RequestMetrics | None] = ContextVar(
+    "current_request", default=None
+)
+
+
+def record_pool_wait(seconds: float) -> None:
+    """
+    Учет ожидания соединения из пула в показателях текущего запроса.
+    """
+    metrics = current_request.get()
+    if metrics is not None:
+        metrics.pool_wait_seconds += seconds
+
+
+def record_serialization(seconds: float) -> None:
+    """
+    Учет времени сериализации ответа в показателях текущего запроса.
+    """
+    metrics = current_request.get()
+    if metrics is not None:
+        metrics.serialization_seconds += seconds
@@ -0,0 +1,163 @@
+import logging
+import time
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from .context import RequestMetrics, current_request
+from .prometheus import (
+    http_request_db_seconds,
+    http_request_duration,
+    http_request_lazy_loads,
+    http_request_pool_wait_seconds,
+    http_request_serialization_seconds,
+    http_request_statements,
+    http_requests,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class RequestMetricsMiddleware:
+    """
+    Сбор показателей каждого HTTP-запроса: заголовок Server-Timing,
+    метрики Prometheus и журналирование медленных запросов.
+
+    Реализован как ASGI-middleware (без BaseHTTPMiddleware), чтобы не
+    буферизовать потоковые ответы.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        server_timing: bool = True,
+        slow_request_threshold: float | None = None,
+        max_logged_statements: int = 50,
+    ) -> None:
+        self.app = app
+        self.server_timing = server_timing
+        self.slow_request_threshold = slow_request_threshold
+        self.max_logged_statements = max_logged_statements
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        metrics = RequestMetrics(
+            keep_statements=self.slow_request_threshold is not None,
+            max_logged_statements=self.max_logged_statements,
+        )
+        token = current_request.set(metrics)
+        started = time.perf_counter()
+        status = 500
+
+        async def send_with_timing(message: Message) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                if self.server_timing:
+                    headers = MutableHeaders(scope=message)
+                    headers.append(
+                        "Server-Timing",
+                        metrics.server_timing(time.perf_counter() - started),
+                    )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            current_request.reset(token)
+            self.observe(scope, status, time.perf_counter() - started, metrics)
+
+    def observe(
+        self, scope: Scope, status: int, elapsed: float, metrics: RequestMetrics
+    ) -> None:
+        route = scope.get("route")
+        # Шаблон пути, а не сам путь: число значений метки остается ограниченным
+        labels = (scope["method"], getattr(route, "path_format", "unmatched"))
+
+        http_requests.inc((*labels, str(status)))
+        http_request_duration.observe(elapsed, labels)
+        http_request_statements.observe(metrics.statement_count, labels)
+        http_request_lazy_loads.inc(labels, metrics.lazy_load_count)
+        http_request_db_seconds.inc(labels, metrics.db_seconds)
+        http_request_pool_wait_seconds.inc(labels, metrics.pool_wait_seconds)
+        http_request_serialization_seconds.inc(labels, metrics.serialization_seconds)
+
+        if (
+            self.slow_request_threshold is not None
+            and elapsed >= self.slow_request_threshold
+        ):
+            logger.warning(
+                f"Slow request {scope['method']} {scope['path']}: "
+                f"{elapsed * 1000:.2f} ms, {metrics.statement_count} statements, "
+                f"{metrics.lazy_load_count} lazy loads, "
+                f"db {metrics.db_seconds * 1000:.2f} ms, "
+                f"pool wait {metrics.pool_wait_seconds * 1000:.2f} ms"
+                f"{format_statements(metrics)}"
+            )
+
+
+class QueryGuardMiddleware:
+    """
+    Контроль количества SQL-запросов на один HTTP-запрос (обнаружение N+1).
+
+    Работает независимо от RequestMetricsMiddleware: если показатели запроса
+    уже собираются, лимит устанавливается на них, иначе middleware заводит
+    собственные.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        max_statements: int,
+        mode: str = "warn",
+        max_logged_statements: int = 50,
+    ) -> None:
+        self.app = app
+        self.max_statements = max_statements
+        self.raise_on_limit = mode == "raise"
+        self.max_logged_statements = max_logged_statements
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        metrics = current_request.get()
+        token = None
+        if metrics is None:
+            metrics = RequestMetrics(max_logged_statements=self.max_logged_statements)
+            token = current_request.set(metrics)
+        metrics.keep_statements = True
+        metrics.statement_limit = self.max_statements
+        metrics.raise_on_limit = self.raise_on_limit
+
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            if token is not None:
+                current_request.reset(token)
+            if metrics.over_limit:
+                logger.warning(
+                    f"Too many SQL statements in request "
+                    f"{scope['method']} {scope['path']}: "
+                    f"{metrics.statement_count} statements "
+                    f"(limit {self.max_statements}), "
+                    f"{metrics.lazy_load_count} lazy loads"
+                    f"{format_statements(metrics)}"
+                )
+
+
+def format_statements(metrics: RequestMetrics) -> str:
+    """
+    Выполненные SQL-запросы с длительностью для записи в журнал.
+
+    :param metrics: показатели запроса
+    :return: строки вида "  12.34 ms  SELECT ...", каждая с новой строки
+    """
+    return "".join(
+        f"\n  {seconds * 1000:8.2f} ms  {statement}"
+        for seconds, statement in metrics.statements
+    )
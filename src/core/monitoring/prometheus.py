@@ -0,0 +1,187 @@
+import math
+from collections import defaultdict
+from typing import Iterable, Mapping
+
+Labels = tuple[str, ...]
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(names: Iterable[str], values: Iterable[str]) -> str:
+    pairs = [f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)]
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class Counter:
+    """
+    Монотонно растущий счетчик с метками.
+    """
+
+    kind = "counter"
+
+    def __init__(self, name: str, description: str, labels: Labels = ()) -> None:
+        self.name = name
+        self.description = description
+        self.labels = labels
+        self.values: dict[Labels, float] = defaultdict(float)
+
+    def inc(self, labels: Labels = (), amount: float = 1.0) -> None:
+        self.values[labels] += amount
+
+    def samples(self) -> list[str]:
+        return [
+            f"{self.name}{_format_labels(self.labels, labels)} {_format_value(value)}"
+            for labels, value in self.values.items()
+        ]
+
+
+class Histogram:
+    """
+    Гистограмма с накопительными интервалами (bucket), суммой и количеством.
+    """
+
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        description: str,
+        buckets: Iterable[float],
+        labels: Labels = (),
+    ) -> None:
+        self.name = name
+        self.description = description
+        self.labels = labels
+        self.buckets = tuple(sorted(buckets)) + (math.inf,)
+        self.counts: dict[Labels, list[int]] = {}
+        self.sums: dict[Labels, float] = defaultdict(float)
+
+    def observe(self, value: float, labels: Labels = ()) -> None:
+        counts = self.counts.setdefault(labels, [0] * len(self.buckets))
+        for index, bound in enumerate(self.buckets):
+            if value <= bound:
+                counts[index] += 1
+        self.sums[labels] += value
+
+    def samples(self) -> list[str]:
+        lines = []
+        for labels, counts in self.counts.items():
+            for bound, count in zip(self.buckets, counts):
+                bucket_labels = _format_labels(
+                    (*self.labels, "le"), (*labels, _format_value(bound))
+                )
+                lines.append(f"{self.name}_bucket{bucket_labels} {count}")
+            formatted = _format_labels(self.labels, labels)
+            lines.append(
+                f"{self.name}_sum{formatted} {_format_value(self.sums[labels])}"
+            )
+            lines.append(f"{self.name}_count{formatted} {counts[-1]}")
+        return lines
+
+
+class MetricsRegistry:
+    """
+    Набор метрик процесса в текстовом формате Prometheus (version 0.0.4).
+    """
+
+    def __init__(self) -> None:
+        self._metrics: list[Counter | Histogram] = []
+
+    def counter(self, name: str, description: str, labels: Labels = ()) -> Counter:
+        metric = Counter(name, description, labels)
+        self._metrics.append(metric)
+        return metric
+
+    def histogram(
+        self,
+        name: str,
+        description: str,
+        buckets: Iterable[float],
+        labels: Labels = (),
+    ) -> Histogram:
+        metric = Histogram(name, description, buckets, labels)
+        self._metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        lines = []
+        for metric in self._metrics:
+            lines.append(f"# HELP {metric.name} {metric.description}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.samples())
+        return "\n".join(lines) + "\n"
+
+
+def render_samples(
+    name: str,
+    description: str,
+    samples: Mapping[Labels, float],
+    labels: Labels = (),
+    kind: str = "gauge",
+) -> str:
+    """
+    Метрика, значения которой вычисляются в момент запроса /metrics
+    (например, из счетчиков кэша или пула соединений).
+
+    :param name: имя метрики
+    :param description: описание метрики
+    :param samples: значения по наборам меток
+    :param labels: имена меток
+    :param kind: тип метрики: "gauge" или "counter"
+    :return: текст метрики в формате Prometheus
+    """
+    lines = [f"# HELP {name} {description}", f"# TYPE {name} {kind}"]
+    lines.extend(
+        f"{name}{_format_labels(labels, values)} {_format_value(value)}"
+        for values, value in samples.items()
+    )
+    return "\n".join(lines) + "\n"
+
+
+registry = MetricsRegistry()
+
+http_requests = registry.counter(
+    "http_requests_total",
+    "HTTP requests by route and status code.",
+    ("method", "route", "status"),
+)
+http_request_duration = registry.histogram(
+    "http_request_duration_seconds",
+    "HTTP request processing time.",
+    (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+    ("method", "route"),
+)
+http_request_statements = registry.histogram(
+    "http_request_db_statements",
+    "SQL statements executed per HTTP request.",
+    (1, 2, 5, 10, 20, 50, 100),
+    ("method", "route"),
+)
+http_request_lazy_loads = registry.counter(
+    "http_request_lazy_loads_total",
+    "ORM relationship lazy loads (N+1 candidates).",
+    ("method", "route"),
+)
+http_request_db_seconds = registry.counter(
+    "http_request_db_seconds_total",
+    "Time spent executing SQL statements.",
+    ("method", "route"),
+)
+http_request_pool_wait_seconds = registry.counter(
+    "http_request_pool_wait_seconds_total",
+    "Time spent waiting for a pooled database connection.",
+    ("method", "route"),
+)
+http_request_serialization_seconds = registry.counter(
+    "http_request_serialization_seconds_total",
+    "Time spent encoding JSON responses.",
+    ("method", "route"),
+)
@@ -0,0 +1,19 @@
+import time
+from typing import Any
+
+from fastapi.responses import ORJSONResponse
+
+from .context import record_serialization
+
+
+class TimedORJSONResponse(ORJSONResponse):
+    """
+    ORJSONResponse с учетом времени кодирования в показателях запроса.
+    """
+
+    def render(self, content: Any) -> bytes:
+        started = time.perf_counter()
+        try:
+            return super().render(content)
+        finally:
+            record_serialization(time.perf_counter() - started)
@@ -0,0 +1,67 @@
+import time
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.orm import ORMExecuteState, Session
+
+from .context import current_request
+
+
+def instrument_engine(engine: AsyncEngine) -> None:
+    """
+    Подсчет SQL-запросов и времени их выполнения для текущего HTTP-запроса.
+
+    Время измеряется между событиями before/after_cursor_execute, поэтому
+    включает сетевой обмен с сервером, но не чтение строк серверного курсора.
+
+    :param engine: асинхронный движок SQLAlchemy
+    """
+    target = engine.sync_engine
+
+    @event.listens_for(target, "before_cursor_execute")
+    def before_cursor_execute(
+        conn, cursor, statement, parameters, context, executemany
+    ) -> None:
+        metrics = current_request.get()
+        if metrics is not None:
+            metrics.check_statement_limit()
+            context._monitoring_started = time.perf_counter()
+
+    @event.listens_for(target, "after_cursor_execute")
+    def after_cursor_execute(
+        conn, cursor, statement, parameters, context, executemany
+    ) -> None:
+        metrics = current_request.get()
+        started = getattr(context, "_monitoring_started", None)
+        if metrics is not None and started is not None:
+            metrics.observe_statement(statement, time.perf_counter() - started)
+
+    @event.listens_for(target, "handle_error")
+    def handle_error(exception_context) -> None:
+        # Неудачный запрос тоже учитывается: время до ошибки — время в базе
+        metrics = current_request.get()
+        context = exception_context.execution_context
+        started = getattr(context, "_monitoring_started", None)
+        if metrics is not None and started is not None:
+            metrics.observe_statement(
+                exception_context.statement or "", time.perf_counter() - started
+            )
+
+
+def _count_lazy_loads(orm_execute_state: ORMExecuteState) -> None:
+    # is_relationship_load истинно и для selectinload/subqueryload — это
+    # запланированные запросы, а не N+1; ленивую загрузку выдает только
+    # объект, из которого она выполняется
+    metrics = current_request.get()
+    if metrics is not None and orm_execute_state.lazy_loaded_from is not None:
+        metrics.lazy_load_count += 1
+
+
+def instrument_sessions(session_class: type[Session] = Session) -> None:
+    """
+    Подсчет ленивых загрузок отношений ORM для текущего HTTP-запроса.
+
+    :param session_class: класс синхронной сессии, используемый AsyncSession
+    """
+    if not event.contains(session_class, "do_orm_execute", _count_lazy_loads):
+        event.listen(session_class, "do_orm_execute", _count_lazy_loads)
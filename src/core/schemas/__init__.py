@@ -1,15 +1,45 @@
 __all__ = (
     "EmployeeRequest",
     "EmployeeResponse",
+    "EmployeeSummary",
+    "EmployeeWithTasks",
+    "EmployeeWorkload",
+    "Page",
+    "format_due_date",
+    "format_timestamp",
+    "Priority",
+    "ReassignStrategy",
+    "Status",
+    "TaskChanges",
+    "TaskFilter",
+    "TaskReassignment",
     "TaskRequest",
     "TaskResponse",
+    "TaskSortField",
+    "TaskStatusTransition",
+    "TaskUpsert",
 )
 
 from .employee import (
     EmployeeRequest,
     EmployeeResponse,
+    EmployeeSummary,
+    EmployeeWithTasks,
+    EmployeeWorkload,
+    ReassignStrategy,
+    TaskReassignment,
 )
+from .pagination import Page
 from .task import (
+    Priority,
+    Status,
+    TaskChanges,
+    TaskFilter,
     TaskRequest,
     TaskResponse,
+    TaskSortField,
+    TaskStatusTransition,
+    TaskUpsert,
+    format_due_date,
+    format_timestamp,
 )
@@ -1,8 +1,9 @@
-from typing import Optional, List
-from pydantic import BaseModel, ConfigDict, field_validator
+from enum import Enum
+from typing import Dict, Optional, List
+from pydantic import BaseModel, ConfigDict, Field, field_validator, model_validator
 from pydantic.networks import EmailStr
 
-from .task import TaskResponse
+from .task import Status, TaskResponse
 
 
 class EmployeeRequest(BaseModel):
@@ -42,3 +43,71 @@ class EmployeeResponse(EmployeeRequest):
     tasks: Optional[List[TaskResponse]] = (
         None  # Список идентификаторов задач сотрудника
     )
+
+
+class EmployeeSummary(BaseModel):
+    """
+    Представляет краткие сведения о сотруднике для списков и поиска.
+    """
+
+    id: int
+    fullname: str
+    position: str
+    age: Optional[int] = None
+    email: Optional[str] = None
+    is_active: bool
+    task_count: int
+
+
+class EmployeeWithTasks(EmployeeSummary):
+    """
+    Представляет краткие сведения о сотруднике вместе с его задачами
+    (параметр include=tasks).
+    """
+
+    tasks: List[TaskResponse]
+
+
+class EmployeeWorkload(BaseModel):
+    """
+    Представляет сводку по задачам сотрудника, рассчитанную в базе данных.
+    """
+
+    employee_id: int
+    fullname: str
+    total: int  # Все задачи сотрудника
+    open: int  # Задачи в любом статусе, кроме «done»
+    overdue: int  # Незавершенные задачи с истекшим сроком выполнения
+    by_status: Dict[str, int]
+    by_priority: Dict[str, int]
+
+
+class ReassignStrategy(str, Enum):
+    """
+    Представляет способы распределения задач между новыми исполнителями.
+    """
+
+    SINGLE = "single"  # все задачи одному сотруднику
+    ROUND_ROBIN = "round_robin"  # по очереди, в порядке ID задач
+    LEAST_LOADED = "least_loaded"  # выравнивание числа открытых задач
+
+
+class TaskReassignment(BaseModel):
+    """
+    Представляет передачу задач сотрудника другим сотрудникам.
+    """
+
+    from_employee_id: int
+    to_employee_ids: List[int] = Field(min_length=1, max_length=100)
+    strategy: ReassignStrategy = ReassignStrategy.SINGLE
+    status: Optional[List[Status]] = None  # None — задачи в любом статусе
+
+    @model_validator(mode="after")
+    def validate_targets(self) -> "TaskReassignment":
+        if len(set(self.to_employee_ids)) != len(self.to_employee_ids):
+            raise ValueError("Target employees must not repeat")
+        if self.from_employee_id in self.to_employee_ids:
+            raise ValueError("Tasks cannot be reassigned to their current employee")
+        if self.strategy is ReassignStrategy.SINGLE and len(self.to_employee_ids) > 1:
+            raise ValueError("Strategy 'single' takes exactly one target employee")
+        return self
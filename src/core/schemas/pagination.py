@@ -0,0 +1,14 @@
+from typing import Generic, List, Optional, TypeVar
+
+from pydantic import BaseModel
+
+T = TypeVar("T")
+
+
+class Page(BaseModel, Generic[T]):
+    """
+    Представляет страницу результатов keyset-пагинации.
+    """
+
+    items: List[T]
+    next_cursor: Optional[str] = None  # None, если страница последняя
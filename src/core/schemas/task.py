@@ -1,9 +1,52 @@
-from typing import Optional
+import time
+from typing import List, Optional
 
 from enum import Enum
 from datetime import datetime, timedelta
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import (
+    BaseModel,
+    ConfigDict,
+    Field,
+    field_serializer,
+    field_validator,
+    model_validator,
+)
+
+from core.config import settings
+
+TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M"
+DUE_DATE_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+
+def default_due_date() -> datetime:
+    """
+    Срок выполнения задачи по умолчанию: через неделю от текущего момента.
+    """
+    return datetime.now().astimezone() + timedelta(days=7)
+
+
+def as_aware(value: datetime) -> datetime:
+    """
+    Время без часового пояса считается локальным временем сервера.
+    """
+    return value if value.tzinfo is not None else value.astimezone()
+
+
+def format_due_date(value: datetime) -> str:
+    """
+    Срок выполнения в прежнем строковом формате, в котором он хранился в базе.
+    """
+    # time.localtime дает то же локальное время, что и astimezone(),
+    # но вдвое быстрее: форматирование выполняется для каждой задачи ответа
+    return time.strftime(DUE_DATE_FORMAT, time.localtime(as_aware(value).timestamp()))
+
+
+def format_timestamp(value: datetime) -> str:
+    """
+    Время создания или изменения задачи в формате ответов API.
+    """
+    return time.strftime(TIMESTAMP_FORMAT, time.localtime(as_aware(value).timestamp()))
 
 
 class Priority(str, Enum):
@@ -28,6 +71,53 @@ class Status(str, Enum):
     DONE = "done"
 
 
+class TaskSortField(str, Enum):
+    """
+    Представляет поля, по которым возможна сортировка списка задач.
+    """
+
+    ID = "id"
+    CREATED_AT = "created_at"
+    COMPLETED_AT = "completed_at"
+
+
+class TaskFilter(BaseModel):
+    """
+    Представляет условия отбора задач; условия объединяются через AND.
+    """
+
+    status: Optional[List[Status]] = None
+    priority: Optional[List[Priority]] = None
+    label: Optional[str] = None
+    employee_id: Optional[int] = None
+    due_from: Optional[datetime] = None
+    due_to: Optional[datetime] = None
+
+    @field_validator("due_from", "due_to")
+    def validate_due_dates(cls, v: Optional[datetime]) -> Optional[datetime]:
+        return None if v is None else as_aware(v)
+
+
+class TaskStatusTransition(BaseModel):
+    """
+    Представляет массовый перевод задач в другой статус: задачи выбираются
+    по списку ID или по условиям отбора.
+    """
+
+    ids: Optional[List[int]] = Field(default=None, max_length=settings.bulk.max_items)
+    filter: Optional[TaskFilter] = None
+    status: Status
+
+    @model_validator(mode="after")
+    def validate_selection(self) -> "TaskStatusTransition":
+        if (self.ids is None) == (self.filter is None):
+            raise ValueError("Either ids or filter must be provided")
+        if self.filter is not None and not self.filter.model_dump(exclude_none=True):
+            # Пустой фильтр затронул бы все задачи
+            raise ValueError("Filter must contain at least one condition")
+        return self
+
+
 class TaskRequest(BaseModel):
     """
     Представляет основную схему-структуру задач.
@@ -38,12 +128,18 @@ class TaskRequest(BaseModel):
     label: Optional[str] = None
     priority: Priority = Priority.MEDIUM.value
     status: Status = Status.BACKLOG.value
-    completed_at: str = (datetime.now() + timedelta(days=7)).strftime(
-        "%Y-%m-%d %H:%M:%S"
-    )
+    completed_at: datetime = Field(default_factory=default_due_date)
 
     attachment: Optional[str] = None
 
+    @field_validator("completed_at")
+    def validate_completed_at(cls, v: datetime) -> datetime:
+        return as_aware(v)
+
+    @field_serializer("completed_at", when_used="json")
+    def serialize_completed_at(self, v: datetime) -> str:
+        return format_due_date(v)
+
 
 class TaskResponse(TaskRequest):
     """
@@ -55,5 +151,34 @@ class TaskResponse(TaskRequest):
     )
 
     id: int
-    created_at: str
-    last_update: str
+    created_at: datetime
+    last_update: datetime
+
+    @field_validator("created_at", "last_update")
+    def validate_timestamps(cls, v: datetime) -> datetime:
+        return as_aware(v)
+
+    @field_serializer("created_at", "last_update", when_used="json")
+    def serialize_timestamps(self, v: datetime) -> str:
+        return format_timestamp(v)
+
+
+class TaskUpsert(TaskRequest):
+    """
+    Представляет структуру запроса для идемпотентного создания задачи.
+    """
+
+    # Ключ задачи во внешней системе; если не передан, используется
+    # заголовок Idempotency-Key
+    external_id: Optional[str] = Field(default=None, min_length=1, max_length=100)
+
+
+class TaskChanges(BaseModel):
+    """
+    Представляет изменения задач после токена синхронизации.
+    """
+
+    items: List[TaskResponse]  # Созданные или измененные задачи
+    deleted: List[int]  # ID удаленных задач
+    next_token: str  # Токен для следующего запроса изменений
+    has_more: bool  # Изменения получены не полностью, запросить сразу
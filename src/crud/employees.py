@@ -1,26 +1,149 @@
+import heapq
+import itertools
+import time
+from collections import defaultdict
 from dataclasses import dataclass
-from typing import Type
-
-from sqlalchemy import or_, select, delete, Sequence
+from datetime import datetime, timezone
+from typing import Any, Callable, Sequence, Type
+
+from sqlalchemy import (
+    CTE,
+    BigInteger,
+    ColumnElement,
+    Insert,
+    Integer,
+    Select,
+    and_,
+    any_,
+    bindparam,
+    false,
+    literal,
+    or_,
+    select,
+    delete,
+    update,
+    func,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB, insert
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm.attributes import set_committed_value
+
+from core.cache import ReadCache, read_cache
+from core.config import settings
+from core.events import append_events, events_from
+from core.models import Employee, Task, replica_synced_at
+from core.schemas import (
+    EmployeeRequest,
+    Priority,
+    ReassignStrategy,
+    Status,
+    TaskReassignment,
+)
+from crud.task import task_columns, task_to_json
+from crud.upsert import (
+    changed_columns,
+    integrity_error_response,
+    required_columns,
+    was_inserted,
+)
+from utils import build_page, contains_pattern, decode_id_cursor
+
+
+def workload_as_of(interval: int = settings.cache.workload_interval) -> datetime:
+    """
+    Момент расчета нагрузки сотрудников: начало текущего интервала.
+
+    Просроченность задач зависит от текущего времени, поэтому сводка
+    (и ее ETag) относится к началу интервала, а не к моменту запроса.
+
+    :param interval: длина интервала в секундах
+    :return: начало интервала (UTC)
+    """
+    now = time.time()
+    return datetime.fromtimestamp(now - now % interval, tz=timezone.utc)
 
-from core.models import Employee
-from core.schemas import EmployeeResponse, EmployeeRequest
+
+def least_loaded_quotas(loads: dict[int, int], count: int) -> dict[int, int]:
+    """
+    Распределение задач поочередной выдачей наименее загруженному
+    сотруднику (при равной нагрузке — с меньшим ID); куча по нагрузке,
+    O(count · log len(loads)).
+
+    :param loads: текущее количество открытых задач по ID сотрудников
+    :param count: количество распределяемых задач
+    :return: количество задач, выдаваемых каждому сотруднику
+    """
+    heap = [(load, employee_id) for employee_id, load in loads.items()]
+    heapq.heapify(heap)
+    quotas = dict.fromkeys(loads, 0)
+    for _ in range(count):
+        load, employee_id = heap[0]
+        quotas[employee_id] += 1
+        heapq.heapreplace(heap, (load + 1, employee_id))
+    return quotas
+
+
+task_count = (
+    select(func.count(Task.id))
+    .where(Task.employee_id == Employee.id)
+    .correlate(Employee)
+    .scalar_subquery()
+    .label("task_count")
+)
+summary_columns = (
+    Employee.id,
+    Employee.fullname,
+    Employee.position,
+    Employee.age,
+    Employee.email,
+    Employee.is_active,
+    task_count,
+)
+
+# Поля сотрудника, не попадающие в события outbox
+private_fields = {"hashed_password", "refresh_token"}
+
+
+def employee_event_payload(data: dict[str, Any]) -> dict[str, Any]:
+    return {key: value for key, value in data.items() if key not in private_fields}
+
+
+def detach_tasks(*clauses: ColumnElement[bool]) -> Insert:
+    """
+    Открепление задач от сотрудников одним UPDATE с записью событий
+    "updated" для каждой открепленной задачи в outbox.
+
+    :param clauses: условия отбора задач
+    :return: выражение WITH detached AS (UPDATE ...) INSERT INTO outbox_events ...
+    """
+    detached = (
+        update(Task)
+        .where(*clauses)
+        .values(employee_id=None)
+        .returning(Task.id)
+        .cte("detached")
+    )
+    payload = literal({"employee_id": None}, JSONB)
+    return events_from(detached, "task", "updated", payload)
 
 
 class EmployeeCRUD:
     """
     Класс для CRUD операций с сотрудниками.
+
+    Каждое изменение записывает события в outbox в той же транзакции.
     """
 
-    def __init__(self, db: AsyncSession):
+    def __init__(self, db: AsyncSession, cache: ReadCache = read_cache):
         """
         Инициализация CRUD класса для сотрудников.
 
         :param db: асинхронная сессия базы данных
+        :param cache: кэш чтения сотрудников
         """
         self.db = db
+        self.cache = cache
 
     async def create(self, employee: EmployeeRequest) -> dict[str, int | str]:
         """
@@ -35,129 +158,683 @@ class EmployeeCRUD:
 
         async with self.db as session:
             session.add(db_employee)
+            await session.flush()
+            payload = {
+                "id": db_employee.id,
+                **employee_event_payload(employee.model_dump(mode="json")),
+            }
+            await append_events(
+                session, "employee", "created", [(db_employee.id, payload)]
+            )
             await session.commit()
-            # Проверка, имеет ли модель отношение tasks
-            if hasattr(Employee, "tasks"):
-                result = await session.execute(
-                    select(Employee)
-                    .options(selectinload(Employee.tasks))
-                    .filter_by(id=db_employee.id)
-                )
-                db_employee = result.scalars().one()
+            # У нового сотрудника задач нет, загружать отношение tasks не нужно
+            set_committed_value(db_employee, "tasks", [])
 
+        await self.cache.invalidate("employees")
         return db_employee
 
-    async def get_all(self) -> Sequence[Employee] | dict[str, int | str]:
+    async def upsert(self, employee: EmployeeRequest) -> dict[str, Any]:
+        """
+        Создание сотрудника или обновление существующего с тем же email
+        (если email не передан — с тем же ФИО) одним
+        INSERT ... ON CONFLICT DO UPDATE ... RETURNING.
+
+        Обновляются только переданные поля и только если они отличаются
+        от сохраненных; иначе сотрудник не изменяется, а его ID читается
+        отдельным запросом. PostgreSQL проверяет NOT NULL до ON CONFLICT,
+        поэтому без обязательных полей новый сотрудник не может быть
+        создан и выполняется UPDATE существующего.
+
+        :param employee: данные сотрудника
+        :return: словарь с ID сотрудника и признаком создания; статус 409,
+            если значение другого уникального поля уже занято, и 422, если
+            для нового сотрудника не хватает обязательных полей
+        """
+        updated_data = employee.model_dump(exclude_unset=True)
+        key = "email" if updated_data.get("email") else "fullname"
+        if not updated_data.get(key):
+            return {"status": 422, "message": "Employee email or fullname is required"}
+
+        table = Employee.__table__
+        changes = [name for name in updated_data if name != key]
+        missing = [name for name in required_columns(table) if name not in updated_data]
+        if not missing:
+            stmt = insert(table).values(**updated_data)
+            if changes:
+                stmt = stmt.on_conflict_do_update(
+                    index_elements=[key],
+                    set_={name: stmt.excluded[name] for name in changes},
+                    where=changed_columns(table, stmt.excluded, changes),
+                )
+            else:
+                stmt = stmt.on_conflict_do_nothing(index_elements=[key])
+            stmt = stmt.returning(table.c.id, was_inserted)
+        elif changes:
+            stmt = (
+                update(table)
+                .where(
+                    table.c[key] == updated_data[key],
+                    changed_columns(table, updated_data, changes),
+                )
+                .values({name: updated_data[name] for name in changes})
+                .returning(table.c.id, false().label("inserted"))
+            )
+        else:
+            stmt = None
+
+        async with self.db as session:
+            try:
+                result = None if stmt is None else await session.execute(stmt)
+            except IntegrityError as exc:
+                await session.rollback()
+                return integrity_error_response(exc, "Employee")
+
+            row = None if result is None else result.one_or_none()
+            if row is None:
+                await session.rollback()
+                employee_id = await session.scalar(
+                    select(Employee.id).where(table.c[key] == updated_data[key])
+                )
+                if employee_id is None:
+                    return {
+                        "status": 422,
+                        "message": f"Employee field is required: {missing[0]}",
+                    }
+                return {
+                    "status": 200,
+                    "message": "Employee Is Up To Date",
+                    "id": employee_id,
+                    "created": False,
+                }
+
+            employee_id, created = row
+            if created:
+                payload = {
+                    "id": employee_id,
+                    **employee_event_payload(employee.model_dump(mode="json")),
+                }
+            else:
+                payload = employee_event_payload(
+                    employee.model_dump(mode="json", include=set(changes))
+                )
+            await append_events(
+                session,
+                "employee",
+                "created" if created else "updated",
+                [(employee_id, payload)],
+            )
+            await session.commit()
+
+        await self.cache.invalidate("employees")
+
+        return {
+            "status": 201 if created else 200,
+            "message": "Successfully Created!" if created else "Successfully Updated!",
+            "id": employee_id,
+            "created": created,
+        }
+
+    async def _attach_tasks(self, employees: list[dict[str, Any]]) -> None:
         """
-        Получение всех cотрудников.
+        Добавление списка задач к сведениям о сотрудниках одним запросом.
 
-        :return: последовательность всех записей
+        :param employees: краткие сведения о сотрудниках (изменяются на месте)
         """
+        if not employees:
+            return
+
         async with self.db as session:
             result = await session.execute(
-                select(Employee).options(selectinload(Employee.tasks))
+                select(Task.employee_id, *task_columns)
+                .where(Task.employee_id.in_([row["id"] for row in employees]))
+                .order_by(Task.id)
             )
-            return result.scalars().all()
+            tasks = result.all()
+
+        tasks_by_employee = defaultdict(list)
+        for task in tasks:
+            tasks_by_employee[task.employee_id].append(task_to_json(task))
+
+        for row in employees:
+            row["tasks"] = tasks_by_employee[row["id"]]
+
+    async def get_all(
+        self, limit: int, cursor: str | None = None, include_tasks: bool = False
+    ) -> dict[str, Any]:
+        """
+        Получение страницы cотрудников, упорядоченных по ID (keyset-пагинация).
+
+        По умолчанию выбираются только краткие сведения (EmployeeSummary)
+        с количеством задач; задачи загружаются только по запросу.
+
+        :param limit: максимальное количество сотрудников на странице
+        :param cursor: курсор, полученный вместе с предыдущей страницей
+        :param include_tasks: добавить к сотрудникам списки их задач
+        :return: словарь со списком сотрудников и курсором следующей страницы
+        :raises ValueError: если курсор поврежден
+        """
+
+        async def load() -> dict[str, Any]:
+            last_id = decode_id_cursor(cursor)
+            stmt = select(*summary_columns).order_by(Employee.id).limit(limit + 1)
+            if last_id is not None:
+                stmt = stmt.where(Employee.id > last_id)
+
+            async with self.db as session:
+                result = await session.execute(stmt)
+                employees = [row._asdict() for row in result]
+
+            page = build_page(employees, limit, lambda row: {"id": row["id"]})
+            if include_tasks:
+                await self._attach_tasks(page["items"])
+            return page
+
+        return await self.cache.get_or_load(
+            "employees",
+            ("all", limit, cursor, include_tasks),
+            load,
+            synced_at=replica_synced_at(self.db),
+        )
 
     async def get_by_query(
-        self, query: str
-    ) -> Sequence[Employee] | dict[str, int | str]:
+        self, query: str, limit: int, include_tasks: bool = False
+    ) -> list[dict[str, Any]]:
         """
-        Получение всех записей на основе предоставленного запроса по одному из них:
+        Получение записей на основе предоставленного запроса по одному из них:
 
         - fullname
         - position
+
+        Поиск подстроки обслуживается GIN-индексами pg_trgm, результаты
+        упорядочены по релевантности (word_similarity).
         :param query: поисковый запрос
+        :param limit: максимальное количество найденных сотрудников
+        :param include_tasks: добавить к сотрудникам списки их задач
         :return: последовательность найденных сотрудников
         """
-        async with self.db as session:
-            stmt = (
-                select(Employee)
-                .options(selectinload(Employee.tasks))
-                .filter(
-                    or_(
-                        Employee.fullname.ilike(f"%{query}%"),
-                        Employee.position.ilike(f"%{query}%"),
+
+        async def load() -> list[dict[str, Any]]:
+            pattern = contains_pattern(query)
+            rank = func.greatest(
+                func.word_similarity(query, Employee.fullname),
+                func.word_similarity(query, Employee.position),
+            )
+
+            async with self.db as session:
+                stmt = (
+                    select(*summary_columns)
+                    .filter(
+                        or_(
+                            Employee.fullname.ilike(pattern),
+                            Employee.position.ilike(pattern),
+                        )
                     )
+                    .order_by(rank.desc(), Employee.id)
+                    .limit(limit)
                 )
-            )
-            result = await session.execute(stmt)
-            employees_db = result.scalars().all()
+                result = await session.execute(stmt)
+                employees_db = [row._asdict() for row in result]
+
+            if include_tasks:
+                await self._attach_tasks(employees_db)
             return employees_db
 
+        return await self.cache.get_or_load(
+            "employees",
+            ("query", query, limit, include_tasks),
+            load,
+            synced_at=replica_synced_at(self.db),
+        )
+
+    async def get_workload(self, as_of: datetime | None = None) -> list[dict[str, Any]]:
+        """
+        Получение сводки по задачам каждого сотрудника: количество задач
+        по статусам и приоритетам, открытые и просроченные задачи.
+
+        Агрегация выполняется одним GROUP BY по задачам, поэтому размер
+        ответа зависит от числа сотрудников, а не задач.
+
+        :param as_of: момент, на который считаются просроченные задачи
+            (по умолчанию начало текущего интервала workload_as_of)
+        :return: список сводок (структура EmployeeWorkload), упорядоченный по ID
+        """
+
+        if as_of is None:
+            as_of = workload_as_of()
+
+        async def load() -> list[dict[str, Any]]:
+            is_open = Task.status != Status.DONE.value
+            counts = (
+                select(
+                    Task.employee_id,
+                    func.count().label("total"),
+                    func.count().filter(is_open).label("open"),
+                    func.count()
+                    .filter(is_open, Task.completed_at < as_of)
+                    .label("overdue"),
+                    *(
+                        func.count().filter(Task.status == status.value)
+                        for status in Status
+                    ),
+                    *(
+                        func.count().filter(Task.priority == priority.value)
+                        for priority in Priority
+                    ),
+                )
+                .where(Task.employee_id.is_not(None))
+                .group_by(Task.employee_id)
+                .subquery()
+            )
+            count_columns = list(counts.c)[1:]
+            stmt = (
+                select(
+                    Employee.id,
+                    Employee.fullname,
+                    *(func.coalesce(column, 0) for column in count_columns),
+                )
+                .outerjoin(counts, counts.c.employee_id == Employee.id)
+                .order_by(Employee.id)
+            )
+
+            async with self.db as session:
+                result = await session.execute(stmt)
+                rows = result.all()
+
+            statuses = [status.value for status in Status]
+            priorities = [priority.value for priority in Priority]
+            workload = []
+            for employee_id, fullname, total, open_, overdue, *values in rows:
+                workload.append(
+                    {
+                        "employee_id": employee_id,
+                        "fullname": fullname,
+                        "total": total,
+                        "open": open_,
+                        "overdue": overdue,
+                        "by_status": dict(zip(statuses, values)),
+                        "by_priority": dict(zip(priorities, values[len(statuses) :])),
+                    }
+                )
+            return workload
+
+        # Запись кэша относится к интервалу и не переживает его
+        interval = settings.cache.workload_interval
+        remaining = interval - int(time.time() - as_of.timestamp())
+        return await self.cache.get_or_load(
+            "employees",
+            ("workload", as_of.isoformat()),
+            load,
+            ttl=max(remaining, 1),
+            synced_at=replica_synced_at(self.db),
+        )
+
     async def update(
         self, employee_id: int, employee: EmployeeRequest
     ) -> dict[str, int | str]:
         """
-        Обновление сотрудника по ID.
+        Частичное обновление сотрудника по ID одним UPDATE ... RETURNING.
 
         :param employee_id: ID сотрудника для обновления
-        :param employee: новые данные для сотрудника
+        :param employee: новые данные для сотрудника (учитываются только переданные поля)
         :return: словарь с результатом операции
         """
+        updated_data = employee.model_dump(exclude_unset=True)
+
+        if updated_data:
+            stmt = (
+                update(Employee)
+                .where(Employee.id == employee_id)
+                .values(**updated_data)
+                .returning(Employee.id)
+                .execution_options(synchronize_session=False)
+            )
+        else:
+            stmt = select(Employee.id).where(Employee.id == employee_id)
+
         async with self.db as session:
-            stmt = select(Employee).filter(Employee.id == employee_id)
             result = await session.execute(stmt)
-            db_employee = result.scalars().first()
+            updated_id = result.scalar_one_or_none()
 
-            if not db_employee:
+            if updated_id is None:
+                await session.rollback()
                 return {
                     "status": 404,
                     "message": f"Updating failed, Employee not found!",
                     "id": employee_id,
                 }
 
-            updated_data = employee.model_dump(exclude_unset=True)
+            if updated_data:
+                payload = employee_event_payload(
+                    employee.model_dump(mode="json", exclude_unset=True)
+                )
+                await append_events(
+                    session, "employee", "updated", [(employee_id, payload)]
+                )
+            await session.commit()
+
+        await self.cache.invalidate("employees")
+
+        return {
+            "status": 200,
+            "message": "Successfully Updated!",
+            "id": employee_id,
+        }
+
+    @staticmethod
+    def _source(reassignment: TaskReassignment) -> list[ColumnElement[bool]]:
+        tasks = Task.__table__
+        source = [tasks.c.employee_id == reassignment.from_employee_id]
+        if reassignment.status:
+            source.append(
+                tasks.c.status.in_([status.value for status in reassignment.status])
+            )
+        return source
+
+    @staticmethod
+    async def _quotas(
+        session: AsyncSession, reassignment: TaskReassignment
+    ) -> dict[int, int]:
+        """
+        Количество задач каждому сотруднику для least_loaded по текущей
+        нагрузке (открытым задачам) сотрудников и числу передаваемых задач.
+        """
+        tasks = Task.__table__
+        target = (
+            func.unnest(
+                bindparam(
+                    "targets",
+                    list(reassignment.to_employee_ids),
+                    type_=ARRAY(Integer),
+                )
+            )
+            .table_valued("employee_id")
+            .render_derived(name="target")
+        )
+        result = await session.execute(
+            select(target.c.employee_id, func.count(tasks.c.id))
+            .select_from(
+                target.outerjoin(
+                    tasks,
+                    and_(
+                        tasks.c.employee_id == target.c.employee_id,
+                        tasks.c.status != Status.DONE.value,
+                    ),
+                )
+            )
+            .group_by(target.c.employee_id)
+        )
+        loads = {employee_id: load for employee_id, load in result.all()}
+        count = await session.scalar(
+            select(func.count())
+            .select_from(tasks)
+            .where(*EmployeeCRUD._source(reassignment))
+        )
+        return least_loaded_quotas(loads, count)
+
+    @staticmethod
+    def _assignment(
+        reassignment: TaskReassignment, quotas: dict[int, int] | None = None
+    ) -> CTE:
+        """
+        CTE (id задачи, новый исполнитель) для распределения задач между
+        несколькими сотрудниками.
+
+        Задачи нумеруются по ID; при round_robin номер задачи по модулю
+        выбирает сотрудника из списка, при least_loaded сотрудники получают
+        подряд идущие номера по заранее рассчитанному количеству задач
+        (quotas), и сотрудник по номеру задачи находится width_bucket
+        в массиве границ.
+        """
+        tasks = Task.__table__
+        moved = (
+            select(
+                tasks.c.id,
+                func.row_number().over(order_by=tasks.c.id).label("position"),
+            )
+            .where(*EmployeeCRUD._source(reassignment))
+            .cte("moved")
+        )
+
+        if reassignment.strategy is ReassignStrategy.ROUND_ROBIN:
+            targets = list(reassignment.to_employee_ids)
+            slot = (moved.c.position - 1) % len(targets) + 1
+        else:
+            targets = [
+                employee_id
+                for employee_id in reassignment.to_employee_ids
+                if quotas[employee_id]
+            ] or list(reassignment.to_employee_ids[:1])
+            # Первый номер задачи каждого сотрудника: 1, 1 + q1, 1 + q1 + q2, ...
+            bounds = list(
+                itertools.accumulate(
+                    [1, *(quotas[employee_id] for employee_id in targets[:-1])]
+                )
+            )
+            slot = func.width_bucket(
+                moved.c.position,
+                bindparam("bounds", bounds, type_=ARRAY(BigInteger)),
+            )
+
+        target = (
+            func.unnest(bindparam("targets", targets, type_=ARRAY(Integer)))
+            .table_valued("employee_id", with_ordinality="ordinal")
+            .render_derived(name="target")
+        )
+        return (
+            select(moved.c.id, target.c.employee_id)
+            .join(target, target.c.ordinal == slot)
+            .cte("assignment")
+        )
+
+    @staticmethod
+    def _reassignment(
+        reassignment: TaskReassignment, quotas: dict[int, int] | None = None
+    ) -> Select:
+        """
+        UPDATE передачи задач с событиями outbox; возвращает количество
+        переданных задач по новым исполнителям.
+        """
+        tasks = Task.__table__
+        if reassignment.strategy is ReassignStrategy.SINGLE:
+            stmt = (
+                update(tasks)
+                .where(*EmployeeCRUD._source(reassignment))
+                .values(employee_id=reassignment.to_employee_ids[0])
+            )
+        else:
+            assignment = EmployeeCRUD._assignment(reassignment, quotas=quotas)
+            stmt = (
+                update(tasks)
+                .where(tasks.c.id == assignment.c.id)
+                .values(employee_id=assignment.c.employee_id)
+            )
+        reassigned = stmt.returning(tasks.c.id, tasks.c.employee_id).cte("reassigned")
+        payload = func.jsonb_build_object(
+            literal("employee_id"), reassigned.c.employee_id
+        )
+        events = events_from(reassigned, "task", "updated", payload).cte("events")
+        return (
+            select(reassigned.c.employee_id, func.count())
+            .group_by(reassigned.c.employee_id)
+            .add_cte(events)
+        )
+
+    async def reassign_tasks(
+        self, reassignment: TaskReassignment
+    ) -> dict[str, int | str | dict]:
+        """
+        Передача задач сотрудника другим сотрудникам одним UPDATE в одной
+        транзакции; количество переданных задач считается в базе данных
+        по RETURNING employee_id.
 
-            for key, value in updated_data.items():
-                setattr(db_employee, key, value)
+        Для least_loaded количество задач каждому сотруднику заранее
+        рассчитывается по текущей нагрузке (least_loaded_quotas).
 
+        :param reassignment: исходный сотрудник, новые исполнители, способ
+            распределения и, при необходимости, статусы передаваемых задач
+        :return: словарь с количеством переданных задач по сотрудникам
+        """
+        employee_ids = [reassignment.from_employee_id, *reassignment.to_employee_ids]
+
+        async with self.db as session:
+            result = await session.execute(
+                select(Employee.id).where(
+                    Employee.id
+                    == any_(bindparam("ids", employee_ids, type_=ARRAY(Integer)))
+                )
+            )
+            missing = sorted(set(employee_ids) - set(result.scalars().all()))
+            if missing:
+                await session.rollback()
+                return {
+                    "status": 404,
+                    "message": f"Reassignment failed, Employees not found: {missing}",
+                }
+
+            quotas = None
+            if reassignment.strategy is ReassignStrategy.LEAST_LOADED:
+                quotas = await self._quotas(session, reassignment)
+            result = await session.execute(
+                self._reassignment(reassignment, quotas=quotas)
+            )
+            by_employee = {employee_id: count for employee_id, count in result.all()}
             await session.commit()
-            await session.refresh(db_employee)
 
-            return {
-                "status": 200,
-                "message": "Successfully Updated!",
-                "id": employee_id,
-            }
+        moved = sum(by_employee.values())
+        if moved:
+            await self.cache.invalidate("employees", "tasks")
+
+        return {
+            "status": 200,
+            "message": f"Reassigned {moved} tasks",
+            "moved": moved,
+            "by_employee": {
+                employee_id: by_employee.get(employee_id, 0)
+                for employee_id in reassignment.to_employee_ids
+            },
+        }
 
     async def delete_by_id(self, employee_id: int) -> dict[str, int | str]:
         """
         Удаление сотрудника по ID.
 
+        Задачи сотрудника открепляются одним UPDATE, сам сотрудник удаляется
+        DELETE ... RETURNING в той же транзакции.
+
         :param employee_id: ID сотрудника для удаления
         :return: словарь с результатом операции
         """
         async with self.db as session:
-            stmt = select(Employee).filter(Employee.id == employee_id)
-            result = await session.execute(stmt)
-            db_employee = result.scalars().first()
+            await session.execute(detach_tasks(Task.employee_id == employee_id))
+            result = await session.execute(
+                delete(Employee)
+                .where(Employee.id == employee_id)
+                .returning(Employee.id)
+                .execution_options(synchronize_session=False)
+            )
 
-            if not db_employee:
+            if result.scalar_one_or_none() is None:
+                await session.rollback()
                 return {
                     "status": 404,
                     "message": f"Deletion failed, Employee not found!",
                     "id": employee_id,
                 }
 
-            await session.delete(db_employee)
+            await append_events(session, "employee", "deleted", [(employee_id, {})])
             await session.commit()
 
+        await self.cache.invalidate("employees", "tasks")
+
         return {"status": 200, "message": "Successfully Deleted!", "id": employee_id}
 
-    async def delete_all(self) -> dict[str, int | str]:
+    async def delete_many(
+        self, employee_ids: Sequence[int]
+    ) -> dict[str, int | str | list]:
         """
-        Удаление всех сотрудников.
+        Удаление сотрудников по списку ID.
 
-        :return: словарь с результатом операции
+        Задачи сотрудников открепляются одним UPDATE, сотрудники удаляются
+        одним DELETE ... WHERE id = ANY(:ids) в той же транзакции.
+
+        :param employee_ids: ID сотрудников для удаления
+        :return: словарь с ID удаленных и не найденных сотрудников
         """
+        ids = bindparam("ids", list(employee_ids), type_=ARRAY(Integer))
+
         async with self.db as session:
-            async with session.begin():
-                stmt = delete(Employee)
-                await session.execute(stmt)
-                await session.commit()
+            await session.execute(detach_tasks(Task.employee_id == any_(ids)))
+            result = await session.execute(
+                delete(Employee)
+                .where(Employee.id == any_(ids))
+                .returning(Employee.id)
+                .execution_options(synchronize_session=False)
+            )
+            deleted_ids = list(result.scalars().all())
+            await append_events(
+                session,
+                "employee",
+                "deleted",
+                [(employee_id, {}) for employee_id in deleted_ids],
+            )
+            await session.commit()
+
+        await self.cache.invalidate("employees", "tasks")
+
+        deleted = set(deleted_ids)
+        return {
+            "status": 200,
+            "message": f"Deleted {len(deleted_ids)} of {len(employee_ids)} employees",
+            "ids": deleted_ids,
+            "not_found": [
+                employee_id
+                for employee_id in employee_ids
+                if employee_id not in deleted
+            ],
+        }
+
+    async def delete_all(
+        self,
+        chunk_size: int = 5000,
+        progress: Callable[[int, int | None], None] | None = None,
+    ) -> dict[str, int | str]:
+        """
+        Удаление всех сотрудников порциями по chunk_size (как delete_many),
+        каждая порция — отдельная короткая транзакция.
 
-        return {"status": 200, "message": "Employees Successfully Deleted!"}
+        :param chunk_size: количество сотрудников в одной порции
+        :param progress: вызывается после каждой порции с количеством
+            удаленных и общим количеством сотрудников; может прервать
+            удаление исключением (отмена фонового задания)
+        :return: словарь с результатом операции
+        """
+        chunk = select(Employee.id).order_by(Employee.id).limit(chunk_size)
+
+        async with self.db as session:
+            total = await session.scalar(select(func.count()).select_from(Employee))
+
+        removed = 0
+        if progress is not None:
+            progress(removed, total)
+        while True:
+            async with self.db as session:
+                result = await session.execute(chunk)
+                employee_ids = list(result.scalars().all())
+            if not employee_ids:
+                break
+
+            deleted = await self.delete_many(employee_ids=employee_ids)
+            removed += len(deleted["ids"])
+            if progress is not None:
+                progress(removed, total)
+            if len(employee_ids) < chunk_size:
+                break
+
+        return {
+            "status": 200,
+            "message": "Employees Successfully Deleted!",
+            "deleted": removed,
+        }
 
 
 @dataclass(frozen=True)
@@ -1,28 +1,260 @@
 import logging
+import time
 from dataclasses import dataclass
-from typing import Sequence
-from sqlalchemy import or_, select, delete
+from datetime import datetime, timedelta
+from typing import Any, AsyncIterator, Callable, Sequence
+
+import orjson
+from pydantic import ValidationError
+from sqlalchemy import (
+    ColumnElement,
+    Integer,
+    Row,
+    any_,
+    bindparam,
+    false,
+    literal,
+    null,
+    or_,
+    select,
+    delete,
+    insert,
+    true,
+    tuple_,
+    union_all,
+    update,
+    func,
+)
+from sqlalchemy.dialects.postgresql import ARRAY, JSONB
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
 
-from core.models import Task
-from core.schemas import TaskRequest
+from core.cache import ReadCache, read_cache
+from core.config import settings
+from core.events import append_events, events_from
+from core.models import Task, TaskTombstone, replica_synced_at, settled_seq
+from core.schemas import (
+    TaskFilter,
+    TaskRequest,
+    TaskSortField,
+    TaskStatusTransition,
+    TaskUpsert,
+    format_due_date,
+    format_timestamp,
+)
+from crud.upsert import changed_columns, was_inserted
+from utils import (
+    build_page,
+    contains_pattern,
+    decode_cursor,
+    decode_id_cursor,
+    encode_cursor,
+)
 
 logger = logging.getLogger(__name__)
 
+# Столбцы задачи в порядке полей TaskResponse
+task_columns = (
+    Task.title,
+    Task.description,
+    Task.label,
+    Task.priority,
+    Task.status,
+    Task.completed_at,
+    Task.attachment,
+    Task.id,
+    Task.created_at,
+    Task.last_update,
+)
+
+
+def task_to_json(row: Row) -> dict[str, Any]:
+    """
+    Сведения о задаче из строки запроса по task_columns в том же виде,
+    что и TaskResponse в режиме JSON, без создания объектов ORM и pydantic.
+
+    :param row: строка результата, оканчивающаяся полями task_columns
+    :return: словарь, готовый к кодированию в JSON
+    """
+    (
+        title,
+        description,
+        label,
+        priority,
+        status,
+        completed_at,
+        attachment,
+        task_id,
+        created_at,
+        last_update,
+    ) = row[-len(task_columns) :]
+    return {
+        "title": title,
+        "description": description,
+        "label": label,
+        "priority": priority,
+        "status": status,
+        "completed_at": format_due_date(completed_at),
+        "attachment": attachment,
+        "id": task_id,
+        "created_at": format_timestamp(created_at),
+        "last_update": format_timestamp(last_update),
+    }
+
+
+def task_event_payload(task: Row | Task) -> dict[str, Any]:
+    """
+    Данные события создания задачи: сведения о задаче и ID исполнителя.
+
+    :param task: строка (employee_id, *task_columns) или объект задачи
+    :return: словарь, готовый к сохранению в outbox
+    """
+    if isinstance(task, Task):
+        row = tuple(getattr(task, column.key) for column in task_columns)
+    else:
+        row = task
+    return {**task_to_json(row), "employee_id": task.employee_id}
+
+
+def task_filter_clauses(filters: TaskFilter) -> list[ColumnElement[bool]]:
+    """
+    Преобразование условий отбора задач в условия WHERE.
+
+    :param filters: условия отбора
+    :return: список условий, объединяемых через AND
+    """
+    clauses: list[ColumnElement[bool]] = []
+    if filters.status:
+        clauses.append(Task.status.in_([status.value for status in filters.status]))
+    if filters.priority:
+        clauses.append(
+            Task.priority.in_([priority.value for priority in filters.priority])
+        )
+    if filters.label is not None:
+        clauses.append(Task.label == filters.label)
+    if filters.employee_id is not None:
+        clauses.append(Task.employee_id == filters.employee_id)
+    if filters.due_from is not None:
+        clauses.append(Task.completed_at >= filters.due_from)
+    if filters.due_to is not None:
+        clauses.append(Task.completed_at < filters.due_to)
+    return clauses
+
+
+def decode_sort_cursor(cursor: str, sort: TaskSortField) -> tuple[Any, ...]:
+    """
+    Получение позиции keyset-пагинации для выбранной сортировки.
+
+    :param cursor: курсор из предыдущего ответа
+    :param sort: поле сортировки
+    :return: (id,) при сортировке по ID, иначе (значение поля, id)
+    :raises ValueError: если курсор поврежден или получен для другой сортировки
+    """
+    payload = decode_cursor(cursor)
+    last_id = payload.get("id")
+    if (
+        not isinstance(last_id, int)
+        or isinstance(last_id, bool)
+        or payload.get("sort") != sort.value
+    ):
+        raise ValueError("Invalid cursor")
+    if sort is TaskSortField.ID:
+        return (last_id,)
+
+    key = payload.get("key")
+    if not isinstance(key, str):
+        raise ValueError("Invalid cursor")
+    return datetime.fromisoformat(key), last_id
+
+
+# Запас к сроку хранения отметок об удалении: deleted_at — время начала
+# транзакции удаления, которая может зафиксироваться позже выдачи токена
+TOMBSTONE_MARGIN = timedelta(hours=1)
+
+
+class SyncTokenExpired(Exception):
+    """
+    Токен синхронизации старше срока хранения отметок об удалении:
+    часть удалений могла быть потеряна, нужна полная синхронизация.
+    """
+
+
+@dataclass(frozen=True)
+class SyncPosition:
+    """
+    Позиция синхронизации из токена.
+
+    since — номер, начиная с которого нужны изменения, issued — время
+    выдачи токена с этим номером (Unix-время); until, until_issued и after
+    заданы только при продолжении неполного ответа: верхняя граница текущей
+    синхронизации, время ее получения и последняя полученная пара (номер, ID).
+    """
+
+    since: int = 0
+    issued: int = 0
+    until: int | None = None
+    until_issued: int | None = None
+    after: tuple[int, int] | None = None
+
+
+def decode_changes_token(token: str | None) -> SyncPosition:
+    """
+    Получение позиции синхронизации из токена.
+
+    :param token: токен из предыдущего ответа или None для первой синхронизации
+    :return: позиция синхронизации; у токенов без времени выдачи issued = 0
+    :raises ValueError: если токен поврежден
+    """
+    if token is None:
+        return SyncPosition()
+
+    payload = decode_cursor(token)
+    since, issued = payload.get("seq"), payload.get("issued", 0)
+    until, after = payload.get("until"), payload.get("after")
+    if (
+        not isinstance(since, int)
+        or not isinstance(issued, int)
+        or (until is None) != (after is None)
+    ):
+        raise ValueError("Invalid sync token")
+    if until is None:
+        return SyncPosition(since=since, issued=issued)
+
+    until_issued = payload.get("until_issued", 0)
+    if (
+        not isinstance(until, int)
+        or not isinstance(until_issued, int)
+        or not isinstance(after, list)
+        or len(after) != 2
+        or not all(isinstance(value, int) for value in after)
+    ):
+        raise ValueError("Invalid sync token")
+    return SyncPosition(
+        since=since,
+        issued=issued,
+        until=until,
+        until_issued=until_issued,
+        after=(after[0], after[1]),
+    )
+
 
 class TaskCRUD:
     """
     Класс для CRUD операций с задачами.
+
+    Каждое изменение записывает события в outbox в той же транзакции.
     """
 
-    def __init__(self, db: AsyncSession):
+    def __init__(self, db: AsyncSession, cache: ReadCache = read_cache):
         """
         Инициализация CRUD класса для задач.
 
         :param db: асинхронная сессия базы данных
+        :param cache: кэш чтения задач
         """
         self.db = db
+        self.cache = cache
 
     async def create(self, task: TaskRequest) -> dict[str, int | str]:
         """
@@ -38,118 +270,676 @@ class TaskCRUD:
 
         async with self.db as session:
             session.add(task_db)
-            await session.commit()
+            await session.flush()
             await session.refresh(task_db)
+            await append_events(
+                session, "task", "created", [(task_db.id, task_event_payload(task_db))]
+            )
+            await session.commit()
+
+        await self.cache.invalidate("tasks", "employees")
 
         return {"status": 201, "message": "Successfully Created!", "id": task_db.id}
 
-    async def get_all(self) -> Sequence[Task] | dict[str, int | str]:
+    async def create_many(
+        self, tasks: Sequence[dict[str, Any]]
+    ) -> dict[str, int | str | list]:
+        """
+        Массовое создание задач одним INSERT ... RETURNING в одной транзакции.
+
+        Каждый элемент проверяется схемой TaskRequest отдельно: ошибки
+        возвращаются с индексом элемента, а корректные задачи сохраняются.
+
+        :param tasks: данные задач в исходном (непроверенном) виде
+        :return: словарь с ID созданных задач (в порядке элементов) и ошибками
+        """
+        rows: list[dict[str, Any]] = []
+        errors: list[dict[str, Any]] = []
+
+        for index, raw_task in enumerate(tasks):
+            try:
+                rows.append(TaskRequest.model_validate(raw_task).model_dump())
+            except ValidationError as exc:
+                errors.append(
+                    {
+                        "index": index,
+                        "errors": exc.errors(include_url=False, include_context=False),
+                    }
+                )
+
+        ids: list[int] = []
+        if rows:
+            async with self.db as session:
+                result = await session.execute(
+                    insert(Task).returning(
+                        Task.employee_id, *task_columns, sort_by_parameter_order=True
+                    ),
+                    rows,
+                )
+                created = result.all()
+                ids = [task.id for task in created]
+                await append_events(
+                    session,
+                    "task",
+                    "created",
+                    [(task.id, task_event_payload(task)) for task in created],
+                )
+                await session.commit()
+
+            await self.cache.invalidate("tasks", "employees")
+
+        return {
+            "status": 201,
+            "message": f"Created {len(ids)} of {len(tasks)} tasks",
+            "ids": ids,
+            "errors": errors,
+        }
+
+    async def upsert(self, task: TaskUpsert, external_id: str) -> dict[str, Any]:
         """
-        Получение всех записей.
+        Идемпотентное создание задачи по внешнему ключу одним
+        INSERT ... ON CONFLICT (external_id) DO UPDATE ... RETURNING.
+
+        Существующая задача обновляется только переданными полями и только
+        если они отличаются от сохраненных, поэтому повтор того же запроса
+        ничего не изменяет.
 
-        :return: последовательность всех записей
+        :param task: данные задачи
+        :param external_id: ключ задачи во внешней системе
+        :return: словарь с ID задачи и признаком создания
         """
+        table = Task.__table__
+        stmt = pg_insert(table).values(
+            **task.model_dump(exclude={"external_id"}), external_id=external_id
+        )
+        changes = [
+            name
+            for name in task.model_dump(exclude_unset=True)
+            if name != "external_id"
+        ]
+        if changes:
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["external_id"],
+                set_={
+                    **{name: stmt.excluded[name] for name in changes},
+                    # onupdate не применяется к ON CONFLICT DO UPDATE
+                    "last_update": func.now(),
+                },
+                where=changed_columns(table, stmt.excluded, changes),
+            )
+        else:
+            stmt = stmt.on_conflict_do_nothing(index_elements=["external_id"])
+        stmt = stmt.returning(was_inserted, table.c.employee_id, *task_columns)
+
         async with self.db as session:
-            result = await session.execute(select(Task))
-            return result.scalars().all()
+            result = await session.execute(stmt)
+            row = result.one_or_none()
+
+            if row is None:
+                await session.rollback()
+                task_id = await session.scalar(
+                    select(Task.id).where(Task.external_id == external_id)
+                )
+                return {
+                    "status": 200,
+                    "message": "Task Is Up To Date",
+                    "id": task_id,
+                    "created": False,
+                }
+
+            if row.inserted:
+                await append_events(
+                    session, "task", "created", [(row.id, task_event_payload(row))]
+                )
+            else:
+                payload = task.model_dump(mode="json", include=set(changes))
+                await append_events(session, "task", "updated", [(row.id, payload)])
+            await session.commit()
+
+        await self.cache.invalidate("tasks", "employees")
 
-    async def get_by_query(self, query: str) -> Sequence[Task] | dict[str, int | str]:
+        return {
+            "status": 201 if row.inserted else 200,
+            "message": (
+                "Successfully Created!" if row.inserted else "Successfully Updated!"
+            ),
+            "id": row.id,
+            "created": row.inserted,
+        }
+
+    async def get_all(self, limit: int, cursor: str | None = None) -> dict[str, Any]:
+        """
+        Получение страницы записей, упорядоченных по ID (keyset-пагинация).
+
+        :param limit: максимальное количество записей на странице
+        :param cursor: курсор, полученный вместе с предыдущей страницей
+        :return: словарь со списком записей и курсором следующей страницы
+        :raises ValueError: если курсор поврежден
+        """
+
+        async def load() -> dict[str, Any]:
+            last_id = decode_id_cursor(cursor)
+            stmt = select(*task_columns).order_by(Task.id).limit(limit + 1)
+            if last_id is not None:
+                stmt = stmt.where(Task.id > last_id)
+
+            async with self.db as session:
+                result = await session.execute(stmt)
+                tasks = result.all()
+
+            page = build_page(tasks, limit, lambda task: {"id": task.id})
+            page["items"] = [task_to_json(task) for task in page["items"]]
+            return page
+
+        return await self.cache.get_or_load(
+            "tasks", ("all", limit, cursor), load, synced_at=replica_synced_at(self.db)
+        )
+
+    async def get_filtered(
+        self,
+        filters: TaskFilter,
+        sort: TaskSortField,
+        descending: bool,
+        limit: int,
+        cursor: str | None = None,
+    ) -> dict[str, Any]:
+        """
+        Получение страницы задач по условиям отбора с сортировкой
+        и keyset-пагинацией.
+
+        Сортировка по дате дополняется ID для однозначного порядка, а позиция
+        курсора дополнительно ограничивает диапазон по самому полю, чтобы
+        планировщик мог использовать btree-индекс этого поля.
+
+        :param filters: условия отбора
+        :param sort: поле сортировки
+        :param descending: сортировка по убыванию
+        :param limit: максимальное количество задач на странице
+        :param cursor: курсор, полученный вместе с предыдущей страницей
+        :return: словарь со списком задач и курсором следующей страницы
+        :raises ValueError: если курсор поврежден
+        """
+
+        async def load() -> dict[str, Any]:
+            keys = [Task.id]
+            if sort is not TaskSortField.ID:
+                keys.insert(0, getattr(Task, sort.value))
+
+            stmt = (
+                select(*task_columns)
+                .where(*task_filter_clauses(filters))
+                .order_by(*(key.desc() if descending else key for key in keys))
+                .limit(limit + 1)
+            )
+
+            if cursor is not None:
+                position = decode_sort_cursor(cursor, sort)
+                after = tuple_(*position, types=[key.type for key in keys])
+                if descending:
+                    stmt = stmt.where(tuple_(*keys) < after)
+                else:
+                    stmt = stmt.where(tuple_(*keys) > after)
+                if len(keys) > 1:
+                    bound = (
+                        keys[0] <= position[0] if descending else keys[0] >= position[0]
+                    )
+                    stmt = stmt.where(bound)
+
+            async with self.db as session:
+                result = await session.execute(stmt)
+                tasks = result.all()
+
+            def cursor_of(task: Row) -> dict[str, Any]:
+                position = {"sort": sort.value, "id": task.id}
+                if sort is not TaskSortField.ID:
+                    position["key"] = getattr(task, sort.value).isoformat()
+                return position
+
+            page = build_page(tasks, limit, cursor_of)
+            page["items"] = [task_to_json(task) for task in page["items"]]
+            return page
+
+        cache_key = (
+            "filtered",
+            filters.model_dump(mode="json"),
+            sort.value,
+            descending,
+            limit,
+            cursor,
+        )
+        return await self.cache.get_or_load(
+            "tasks", cache_key, load, synced_at=replica_synced_at(self.db)
+        )
+
+    async def stream_all(self, batch_size: int) -> AsyncIterator[bytes]:
+        """
+        Потоковая выгрузка всех задач в формате NDJSON.
+
+        Строки читаются серверным курсором пачками по batch_size и кодируются
+        напрямую из кортежей Row, без создания объектов ORM и pydantic.
+
+        :param batch_size: количество строк, получаемых за одно обращение к курсору
+        :return: асинхронный итератор фрагментов NDJSON, по одному на пачку
+        """
+        stmt = (
+            select(Task.__table__)
+            .order_by(Task.id)
+            .execution_options(yield_per=batch_size)
+        )
+
+        async with self.db as session:
+            result = await session.stream(stmt)
+            async for rows in result.partitions():
+                yield b"".join(orjson.dumps(row._asdict()) + b"\n" for row in rows)
+
+    async def get_changes(
+        self,
+        token: str | None,
+        limit: int,
+        retention: int = settings.sync.retention,
+    ) -> dict[str, Any]:
+        """
+        Получение задач, созданных или измененных после токена синхронизации,
+        и ID удаленных задач.
+
+        Изменения выбираются по номеру транзакции (updated_seq у задач,
+        deleted_seq у отметок об удалении) в диапазоне от номера из токена
+        до номера самой ранней незавершенной транзакции: изменения
+        незавершенных транзакций попадут в следующую синхронизацию, поэтому
+        ни одно изменение не пропускается. Оба набора читаются одним
+        UNION ALL по индексам (номер, id) с keyset-пагинацией, так что
+        стоимость пропорциональна количеству изменений, а не размеру таблицы.
+
+        :param token: токен из предыдущего ответа или None для первой
+            синхронизации (все задачи)
+        :param limit: максимальное количество изменений в ответе
+        :param retention: срок действия токена (секунды), совпадает со сроком
+            хранения отметок об удалении (prune_tombstones)
+        :return: словарь с измененными задачами, ID удаленных задач,
+            токеном следующего запроса и признаком неполного ответа
+        :raises ValueError: если токен поврежден
+        :raises SyncTokenExpired: если токен старше срока хранения отметок
+        """
+        position = decode_changes_token(token)
+        since, until, after = position.since, position.until, position.after
+        if since > 0 and position.issued < time.time() - retention:
+            raise SyncTokenExpired("Sync token expired, full resync required")
+
+        async with self.db as session:
+            if until is None:
+                # Время выдачи берется до чтения номера: все удаления
+                # после этого номера начаты не раньше него
+                until_issued = int(time.time())
+                # Токен не может уменьшиться, даже если реплика отстает
+                until = max(since, await session.scalar(select(settled_seq)))
+            else:
+                until_issued = position.until_issued
+
+            def seq_range(seq, key) -> list[ColumnElement[bool]]:
+                clauses = [seq >= since, seq < until]
+                if after is not None:
+                    clauses.append(tuple_(seq, key) > tuple_(*after))
+                return clauses
+
+            changed = select(
+                Task.updated_seq.label("seq"), false().label("deleted"), *task_columns
+            ).where(*seq_range(Task.updated_seq, Task.id))
+            if since > 0:
+                # При первой синхронизации удалять у клиента нечего
+                tombstone_columns = [
+                    TaskTombstone.id if column is Task.id else null()
+                    for column in task_columns
+                ]
+                deleted = select(
+                    TaskTombstone.deleted_seq, true(), *tombstone_columns
+                ).where(*seq_range(TaskTombstone.deleted_seq, TaskTombstone.id))
+                changes = union_all(changed, deleted).subquery("changes")
+            else:
+                changes = changed.subquery("changes")
+
+            result = await session.execute(
+                select(changes).order_by(changes.c.seq, changes.c.id).limit(limit + 1)
+            )
+            rows = result.all()
+
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+        if has_more:
+            last = rows[-1]
+            next_position = {
+                "seq": since,
+                "issued": position.issued,
+                "until": until,
+                "until_issued": until_issued,
+                "after": [last.seq, last.id],
+            }
+        else:
+            next_position = {"seq": until, "issued": until_issued}
+
+        return {
+            "items": [task_to_json(row) for row in rows if not row.deleted],
+            "deleted": [row.id for row in rows if row.deleted],
+            "next_token": encode_cursor(next_position),
+            "has_more": has_more,
+        }
+
+    async def get_by_query(self, query: str, limit: int) -> list[dict[str, Any]]:
         """
-        Получение всех записей на основе предоставленного запроса по одному из них:
+        Получение записей на основе предоставленного запроса по одному из них:
 
         - title
+        - description
         - priority
         - label
+
+        Поиск подстроки обслуживается GIN-индексами pg_trgm, результаты
+        упорядочены по релевантности (word_similarity).
         :param query: поисковый запрос
+        :param limit: максимальное количество найденных задач
         :return: последовательность найденных задач
         """
-        async with self.db as session:
-            stmt = select(Task).filter(
-                or_(
-                    Task.title.ilike(f"%{query}%"),
-                    Task.label == query,
-                    Task.priority == query,
-                )
+
+        async def load() -> list[dict[str, Any]]:
+            pattern = contains_pattern(query)
+            rank = func.greatest(
+                func.word_similarity(query, Task.title),
+                func.coalesce(func.word_similarity(query, Task.description), 0),
             )
-            result = await session.execute(stmt)
-            return result.scalars().all()
+
+            async with self.db as session:
+                stmt = (
+                    select(*task_columns)
+                    .filter(
+                        or_(
+                            Task.title.ilike(pattern),
+                            Task.description.ilike(pattern),
+                            Task.label == query,
+                            Task.priority == query,
+                        )
+                    )
+                    .order_by(rank.desc(), Task.id)
+                    .limit(limit)
+                )
+                result = await session.execute(stmt)
+                tasks = result.all()
+
+            return [task_to_json(task) for task in tasks]
+
+        return await self.cache.get_or_load(
+            "tasks", ("query", query, limit), load, synced_at=replica_synced_at(self.db)
+        )
 
     async def update(self, task_id: int, task: TaskRequest) -> dict[str, int | str]:
         """
-        Обновление задачи по ID.
+        Частичное обновление задачи по ID одним UPDATE ... RETURNING.
 
         :param task_id: ID задачи для обновления
-        :param task: новые данные для задачи
+        :param task: новые данные для задачи (учитываются только переданные поля)
         :return: словарь с результатом операции
         """
+        updated_data = task.model_dump(exclude_unset=True)
+        logger.debug(f"Updating task with data: {updated_data}")
+
+        values = {}
+        changes = task.model_dump(mode="json", exclude_unset=True)
+        for key, value in updated_data.items():
+            if hasattr(Task, key):
+                values[key] = value
+            else:
+                logger.error(f"Attribute {key} does not exist on Task model")
+
+        if values:
+            stmt = (
+                update(Task)
+                .where(Task.id == task_id)
+                .values(**values)
+                .returning(Task.id)
+                .execution_options(synchronize_session=False)
+            )
+        else:
+            stmt = select(Task.id).where(Task.id == task_id)
+
         async with self.db as session:
-            stmt = select(Task).filter(Task.id == task_id)
             result = await session.execute(stmt)
-            db_task = result.scalars().first()
+            updated_id = result.scalar_one_or_none()
 
-            if not db_task:
+            if updated_id is None:
+                await session.rollback()
                 return {
                     "status": 404,
                     "message": f"Updating failed, Task not found!",
                     "id": task_id,
                 }
 
-            updated_data = task.model_dump(exclude_unset=True)
-            logger.debug(f"Updating task with data: {updated_data}")
+            if values:
+                payload = {key: changes[key] for key in values}
+                await append_events(session, "task", "updated", [(task_id, payload)])
+            await session.commit()
 
-            for key, value in updated_data.items():
-                if hasattr(db_task, key):
-                    setattr(db_task, key, value)
-                    logger.debug(f"Set {key} to {value}")
-                else:
-                    logger.error(f"Attribute {key} does not exist on Task model")
+        await self.cache.invalidate("tasks", "employees")
+
+        return {"status": 200, "message": "Successfully Updated!", "id": task_id}
+
+    async def transition_status(
+        self, transition: TaskStatusTransition
+    ) -> dict[str, int | str | list]:
+        """
+        Массовый перевод задач в другой статус одним выражением:
+        UPDATE ... RETURNING в CTE и INSERT событий outbox из него.
+
+        Задачи, уже находящиеся в целевом статусе, не изменяются;
+        last_update обновляется на стороне сервера (onupdate=now()).
 
+        :param transition: выбор задач (ID или условия отбора) и целевой статус
+        :return: словарь с ID измененных задач, для списка ID — также с ID
+            пропущенных (не найденных или уже в целевом статусе) задач
+        """
+        if transition.ids is not None:
+            selection = [
+                Task.id
+                == any_(bindparam("ids", list(transition.ids), type_=ARRAY(Integer)))
+            ]
+        else:
+            selection = task_filter_clauses(transition.filter)
+
+        moved = (
+            update(Task)
+            .where(*selection, Task.status != transition.status.value)
+            .values(status=transition.status.value)
+            .returning(Task.id)
+            .cte("moved")
+        )
+        payload = literal({"status": transition.status.value}, JSONB)
+        events = events_from(moved, "task", "updated", payload).cte("events")
+        # События пишутся тем же выражением, что и изменение статуса
+        stmt = select(moved.c.id).order_by(moved.c.id).add_cte(events)
+
+        async with self.db as session:
+            result = await session.execute(stmt)
+            updated_ids = list(result.scalars().all())
             await session.commit()
-            await session.refresh(db_task)
 
-            return {"status": 200, "message": "Successfully Updated!", "id": task_id}
+        if updated_ids:
+            await self.cache.invalidate("tasks", "employees")
+
+        response: dict[str, int | str | list] = {
+            "status": 200,
+            "message": f"Moved {len(updated_ids)} tasks to {transition.status.value!r}",
+            "ids": updated_ids,
+        }
+        if transition.ids is not None:
+            updated = set(updated_ids)
+            response["skipped"] = [
+                task_id for task_id in transition.ids if task_id not in updated
+            ]
+        return response
 
     async def delete_by_id(self, task_id: int) -> dict[str, int | str]:
         """
-        Удаление задачи по ID.
+        Удаление задачи по ID одним DELETE ... RETURNING.
 
         :param task_id: ID задачи для удаления
         :return: словарь с результатом операции
         """
+        stmt = (
+            delete(Task)
+            .where(Task.id == task_id)
+            .returning(Task.id)
+            .execution_options(synchronize_session=False)
+        )
+
         async with self.db as session:
-            stmt = select(Task).filter(Task.id == task_id)
             result = await session.execute(stmt)
-            db_task = result.scalars().first()
 
-            if not db_task:
+            if result.scalar_one_or_none() is None:
+                await session.rollback()
                 return {
                     "status": 404,
                     "message": f"Deletion failed, Task not found!",
                     "id": task_id,
                 }
 
-            await session.delete(db_task)
+            await append_events(session, "task", "deleted", [(task_id, {})])
             await session.commit()
 
+        await self.cache.invalidate("tasks", "employees")
+
         return {"status": 200, "message": "Successfully Deleted!", "id": task_id}
 
-    async def delete_all_by_status(self, status: str) -> dict[str, int | str]:
+    async def delete_many(self, task_ids: Sequence[int]) -> dict[str, int | str | list]:
         """
-        Удаление всех задач с определенным статусом.
+        Удаление задач по списку ID одним DELETE ... WHERE id = ANY(:ids).
+
+        :param task_ids: ID задач для удаления
+        :return: словарь с ID удаленных и не найденных задач
+        """
+        stmt = (
+            delete(Task)
+            .where(
+                Task.id == any_(bindparam("ids", list(task_ids), type_=ARRAY(Integer)))
+            )
+            .returning(Task.id)
+            .execution_options(synchronize_session=False)
+        )
+
+        async with self.db as session:
+            result = await session.execute(stmt)
+            deleted_ids = list(result.scalars().all())
+            await append_events(
+                session, "task", "deleted", [(task_id, {}) for task_id in deleted_ids]
+            )
+            await session.commit()
+
+        await self.cache.invalidate("tasks", "employees")
+
+        deleted = set(deleted_ids)
+        return {
+            "status": 200,
+            "message": f"Deleted {len(deleted_ids)} of {len(task_ids)} tasks",
+            "ids": deleted_ids,
+            "not_found": [task_id for task_id in task_ids if task_id not in deleted],
+        }
+
+    async def delete_all_by_status(
+        self,
+        status: str,
+        chunk_size: int = 5000,
+        progress: Callable[[int, int | None], None] | None = None,
+    ) -> dict[str, int | str]:
+        """
+        Удаление всех задач с определенным статусом порциями:
+        DELETE ... WHERE id IN (SELECT id ... LIMIT chunk_size),
+        каждая порция — отдельная короткая транзакция.
 
         :param status: статус задач для удаления
+        :param chunk_size: количество задач в одной порции
+        :param progress: вызывается после каждой порции с количеством
+            удаленных и общим количеством задач; может прервать удаление
+            исключением (отмена фонового задания)
         :return: словарь с результатом операции
         """
         if status not in ["backlog", "todo", "in progress", "done"]:
             return {"status": 404, "message": "Invalid status value"}
 
+        chunk = select(Task.id).where(Task.status == status).limit(chunk_size)
+        deleted = (
+            delete(Task)
+            .where(Task.id.in_(chunk.scalar_subquery()))
+            .returning(Task.id)
+            .cte("deleted")
+        )
+        stmt = events_from(deleted, "task", "deleted")
+
         async with self.db as session:
-            async with session.begin():
-                stmt = delete(Task).filter(Task.status == status)
-                await session.execute(stmt)
+            total = await session.scalar(
+                select(func.count()).select_from(Task).where(Task.status == status)
+            )
+
+        removed = 0
+        if progress is not None:
+            progress(removed, total)
+        try:
+            while True:
+                async with self.db as session:
+                    result = await session.execute(stmt)
+                    await session.commit()
+
+                removed += result.rowcount
+                if progress is not None:
+                    progress(removed, total)
+                if result.rowcount < chunk_size:
+                    break
+        finally:
+            if removed:
+                await self.cache.invalidate("tasks", "employees")
+
+        return {
+            "status": 200,
+            "message": "Tasks Successfully Deleted!",
+            "deleted": removed,
+        }
+
+    async def prune_tombstones(
+        self,
+        retention: int = settings.sync.retention,
+        chunk_size: int = 5000,
+    ) -> dict[str, int | str]:
+        """
+        Удаление отметок об удалении, которые не нужны ни одному
+        действующему токену синхронизации (старше retention и запаса
+        TOMBSTONE_MARGIN), порциями — каждая порция в отдельной транзакции.
+
+        :param retention: срок действия токена синхронизации (секунды)
+        :param chunk_size: количество отметок в одной порции
+        :return: словарь с результатом операции
+        """
+        cutoff = func.now() - timedelta(seconds=retention) - TOMBSTONE_MARGIN
+        chunk = (
+            select(TaskTombstone.id)
+            .where(TaskTombstone.deleted_at < cutoff)
+            .limit(chunk_size)
+        )
+        stmt = delete(TaskTombstone).where(
+            TaskTombstone.id.in_(chunk.scalar_subquery())
+        )
+
+        removed = 0
+        while True:
+            async with self.db as session:
+                result = await session.execute(stmt)
                 await session.commit()
 
-        return {"status": 200, "message": "Tasks Successfully Deleted!"}
+            removed += result.rowcount
+            if result.rowcount < chunk_size:
+                break
+
+        if removed:
+            logger.info(f"Pruned {removed} task tombstones")
+        return {
+            "status": 200,
+            "message": "Task Tombstones Successfully Pruned!",
+            "deleted": removed,
+        }
 
 
 @dataclass(frozen=True)
@@ -0,0 +1,448 @@
+import codecs
+import csv
+import io
+import logging
+from typing import Any, AsyncIterator, Callable, Iterator, Literal
+from uuid import uuid4
+
+import orjson
+from pydantic import ValidationError
+from sqlalchemy import (
+    Column,
+    DateTime,
+    Integer,
+    MetaData,
+    String,
+    Table,
+    exists,
+    func,
+    or_,
+    select,
+    union_all,
+)
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from core.cache import ReadCache, read_cache
+from core.events import append_events
+from core.models import Employee, Task
+from core.schemas import TaskUpsert
+from crud.upsert import changed_columns, was_inserted
+
+logger = logging.getLogger(__name__)
+
+ImportFormat = Literal["csv", "ndjson"]
+
+# Поля задачи, загружаемые из файла, в порядке столбцов промежуточной таблицы
+import_fields = (
+    "title",
+    "description",
+    "label",
+    "priority",
+    "status",
+    "completed_at",
+    "attachment",
+    "external_id",
+)
+
+# Строка файла: (номер строки, данные) или (номер строки, текст ошибки)
+ParsedRow = tuple[int, dict[str, Any] | str]
+
+
+def parse_ndjson(
+    chunks: AsyncIterator[bytes], max_record_size: int = 1 << 20
+) -> AsyncIterator[list[ParsedRow]]:
+    """
+    Разбор NDJSON по мере поступления данных: по одному объекту в строке,
+    пустые строки пропускаются.
+
+    :param chunks: фрагменты файла произвольного размера
+    :param max_record_size: максимальная длина строки (байт)
+    :return: асинхронный итератор строк, разобранных из очередного фрагмента;
+        номер строки — номер строки файла
+    :raises ValueError: если строка длиннее max_record_size
+    """
+
+    async def rows() -> AsyncIterator[list[ParsedRow]]:
+        line_number = 0
+        tail = b""
+        async for chunk in chunks:
+            lines = (tail + chunk).split(b"\n")
+            tail = lines.pop()
+            parsed: list[ParsedRow] = []
+            for line in lines:
+                line_number += 1
+                parsed.extend(_parse_json_line(line_number, line))
+            yield parsed
+            if len(tail) > max_record_size:
+                raise ValueError(
+                    f"Line {line_number + 1} is longer than {max_record_size} bytes"
+                )
+
+        if tail.strip():
+            yield list(_parse_json_line(line_number + 1, tail))
+
+    return rows()
+
+
+def _parse_json_line(line_number: int, line: bytes) -> Iterator[ParsedRow]:
+    if not line.strip():
+        return
+    try:
+        value = orjson.loads(line)
+    except orjson.JSONDecodeError as exc:
+        yield line_number, f"Invalid JSON: {exc}"
+        return
+    if isinstance(value, dict):
+        yield line_number, value
+    else:
+        yield line_number, "Expected a JSON object"
+
+
+def parse_csv(
+    chunks: AsyncIterator[bytes], max_record_size: int = 1 << 20
+) -> AsyncIterator[list[ParsedRow]]:
+    """
+    Разбор CSV (UTF-8, первая строка — заголовок) по мере поступления данных.
+
+    Разбирается только часть текста, оканчивающаяся переводом строки вне
+    кавычек, поэтому значения в кавычках могут содержать переводы строк.
+    Кавычки подсчитываются один раз для каждого фрагмента, а неразобранный
+    остаток ограничен max_record_size: лишняя кавычка не накапливает
+    в памяти весь оставшийся файл.
+    Пустые значения не передаются: для них используются значения по умолчанию.
+
+    :param chunks: фрагменты файла произвольного размера
+    :param max_record_size: максимальная длина записи (символов)
+    :return: асинхронный итератор строк, разобранных из очередного фрагмента;
+        номер строки — номер записи без учета заголовка
+    :raises ValueError: если файл не в UTF-8, в нем нет заголовка или запись
+        длиннее max_record_size (например, из-за незакрытой кавычки)
+    """
+
+    async def rows() -> AsyncIterator[list[ParsedRow]]:
+        decoder = codecs.getincrementaldecoder("utf-8-sig")()
+        header: list[str] | None = None
+        row_number = 0
+        buffer = ""
+        # Нечетное число кавычек в buffer: перевод строки внутри значения
+        quoted = False
+
+        def parse(text: str) -> list[ParsedRow]:
+            nonlocal header, row_number
+            parsed: list[ParsedRow] = []
+            for values in csv.reader(io.StringIO(text, newline="")):
+                if header is None:
+                    header = [name.strip() for name in values]
+                    continue
+                if not values:
+                    continue
+                row_number += 1
+                if len(values) > len(header):
+                    parsed.append((row_number, "Too many values in row"))
+                    continue
+                parsed.append(
+                    (row_number, {k: v for k, v in zip(header, values) if v != ""})
+                )
+            return parsed
+
+        async for chunk in chunks:
+            start = len(buffer)
+            buffer += decoder.decode(chunk)
+            # Конец последней записи: перевод строки вне кавычек
+            end = 0
+            newline = buffer.find("\n", start)
+            while newline != -1:
+                quoted ^= buffer.count('"', start, newline) % 2 == 1
+                if not quoted:
+                    end = newline + 1
+                start = newline + 1
+                newline = buffer.find("\n", start)
+            quoted ^= buffer.count('"', start) % 2 == 1
+
+            if end:
+                text, buffer = buffer[:end], buffer[end:]
+                yield parse(text)
+            if len(buffer) > max_record_size:
+                record = "Header" if header is None else f"Row {row_number + 1}"
+                raise ValueError(
+                    f"{record} is longer than {max_record_size} characters"
+                    " (unbalanced quote?)"
+                )
+
+        buffer += decoder.decode(b"", final=True)
+        if buffer.strip():
+            yield parse(buffer)
+        if header is None:
+            raise ValueError("CSV header is missing")
+
+    return rows()
+
+
+def _enum_value(value: Any) -> Any:
+    return getattr(value, "value", value)
+
+
+class TaskImporter:
+    """
+    Импорт задач из CSV или NDJSON.
+
+    Строки проверяются схемой TaskUpsert пачками по batch_size
+    и загружаются COPY (asyncpg copy_records_to_table) в промежуточную
+    таблицу UNLOGGED, затем переносятся в tasks одним INSERT ... SELECT
+    с определением исполнителя по столбцу employee_email. Строки
+    с external_id обновляют уже импортированные задачи (ON CONFLICT DO
+    UPDATE), поэтому повторный импорт файла не создает дубликатов.
+    В памяти находится не больше одной пачки строк.
+
+    Каждая пачка фиксируется отдельной короткой транзакцией, а в tasks
+    строки переносятся одной транзакцией в конце импорта. Транзакция,
+    открытая на все время загрузки файла, удерживала бы pg_snapshot_xmin,
+    и /manager/tasks/changes и лента событий ждали бы конца импорта.
+    Промежуточная таблица обычная, а не временная: короткие транзакции
+    могут выполняться на разных соединениях пула (и pgbouncer).
+    """
+
+    def __init__(
+        self,
+        db: AsyncSession,
+        cache: ReadCache = read_cache,
+        batch_size: int = 10_000,
+        max_errors: int = 1000,
+        max_record_size: int = 1 << 20,
+    ):
+        """
+        :param db: асинхронная сессия базы данных
+        :param cache: кэш чтения задач
+        :param batch_size: количество строк в одной пачке
+        :param max_errors: максимальное количество ошибок в отчете
+        :param max_record_size: максимальная длина одной записи файла
+        """
+        self.db = db
+        self.cache = cache
+        self.batch_size = batch_size
+        self.max_errors = max_errors
+        self.max_record_size = max_record_size
+
+    @staticmethod
+    def _staging_table() -> Table:
+        return Table(
+            f"task_import_{uuid4().hex[:12]}",
+            MetaData(),
+            Column("row_number", Integer),
+            Column("title", String),
+            Column("description", String),
+            Column("label", String),
+            Column("priority", String),
+            Column("status", String),
+            Column("completed_at", DateTime(timezone=True)),
+            Column("attachment", String),
+            Column("external_id", String),
+            Column("employee_email", String),
+            prefixes=["UNLOGGED"],
+        )
+
+    def _validate(
+        self, rows: list[ParsedRow], errors: list[dict[str, Any]]
+    ) -> tuple[list[tuple], int]:
+        """
+        Проверка пачки строк: корректные преобразуются в записи для COPY,
+        ошибки добавляются в отчет.
+
+        :return: записи для COPY и количество строк с ошибками
+        """
+        records: list[tuple] = []
+        failed = 0
+        for row_number, data in rows:
+            if isinstance(data, str):
+                problems: Any = data
+            else:
+                try:
+                    task = TaskUpsert.model_validate(data)
+                except ValidationError as exc:
+                    problems = exc.errors(include_url=False, include_context=False)
+                else:
+                    email = data.get("employee_email")
+                    records.append(
+                        (
+                            row_number,
+                            task.title,
+                            task.description,
+                            task.label,
+                            _enum_value(task.priority),
+                            _enum_value(task.status),
+                            task.completed_at,
+                            task.attachment,
+                            task.external_id,
+                            str(email) if email is not None else None,
+                        )
+                    )
+                    continue
+
+            failed += 1
+            if len(errors) < self.max_errors:
+                errors.append({"row": row_number, "errors": problems})
+        return records, failed
+
+    async def _execute_ddl(
+        self, session: AsyncSession, ddl: Callable[..., None]
+    ) -> None:
+        connection = await session.connection()
+        await connection.run_sync(ddl)
+        await session.commit()
+
+    async def _copy(
+        self, session: AsyncSession, staging: Table, records: list[tuple]
+    ) -> None:
+        """
+        Загрузка пачки записей в промежуточную таблицу отдельной транзакцией.
+        """
+        connection = await session.connection()
+        raw_connection = await connection.get_raw_connection()
+        await raw_connection.driver_connection.copy_records_to_table(
+            staging.name,
+            records=records,
+            columns=[column.name for column in staging.columns],
+        )
+        await session.commit()
+
+    async def _merge(
+        self, session: AsyncSession, staging: Table, errors: list[dict[str, Any]]
+    ) -> tuple[int, int, int]:
+        """
+        Перенос строк промежуточной таблицы в tasks одной транзакцией.
+
+        :return: количество созданных и обновленных задач и строк
+            с неизвестным сотрудником
+        """
+        unknown_employee = staging.c.employee_email.is_not(None) & ~exists().where(
+            Employee.email == staging.c.employee_email
+        )
+        result = await session.execute(
+            select(staging.c.row_number, staging.c.employee_email)
+            .where(unknown_employee)
+            .order_by(staging.c.row_number)
+            .limit(max(self.max_errors - len(errors), 0))
+        )
+        for row_number, email in result.all():
+            errors.append(
+                {"row": row_number, "errors": f"Employee {email!r} not found"}
+            )
+        failed = await session.scalar(
+            select(func.count()).select_from(staging).where(unknown_employee)
+        )
+
+        rows = select(
+            staging.c.row_number,
+            *(staging.c[field] for field in import_fields),
+            Employee.id.label("employee_id"),
+        ).select_from(
+            staging.outerjoin(Employee, Employee.email == staging.c.employee_email)
+        )
+        valid = or_(staging.c.employee_email.is_(None), Employee.id.is_not(None))
+        # Из строк с одинаковым external_id применяется последняя:
+        # ON CONFLICT DO UPDATE не может изменить одну строку дважды
+        keyed = (
+            rows.where(valid, staging.c.external_id.is_not(None))
+            .distinct(staging.c.external_id)
+            .order_by(staging.c.external_id, staging.c.row_number.desc())
+        )
+        source = union_all(
+            rows.where(valid, staging.c.external_id.is_(None)), keyed
+        ).subquery("source")
+
+        stmt = insert(Task).from_select(
+            [*import_fields, "employee_id"],
+            select(
+                *(source.c[field] for field in import_fields),
+                source.c.employee_id,
+            ).order_by(source.c.row_number),
+        )
+        updated_fields = [
+            field for field in (*import_fields, "employee_id") if field != "external_id"
+        ]
+        stmt = stmt.on_conflict_do_update(
+            index_elements=["external_id"],
+            set_={
+                **{field: stmt.excluded[field] for field in updated_fields},
+                "last_update": func.now(),
+            },
+            where=changed_columns(Task.__table__, stmt.excluded, updated_fields),
+        )
+        upserted = stmt.returning(was_inserted).cte("upserted")
+        created, updated = (
+            await session.execute(
+                select(
+                    func.count().filter(upserted.c.inserted),
+                    func.count().filter(~upserted.c.inserted),
+                )
+            )
+        ).one()
+        if created or updated:
+            # Одно событие на импорт: изменения клиенты получают
+            # через синхронизацию (/manager/tasks/changes)
+            await append_events(
+                session,
+                "task",
+                "imported",
+                [(None, {"created": created, "updated": updated})],
+            )
+        await session.commit()
+        return created, updated, failed
+
+    async def run(
+        self, chunks: AsyncIterator[bytes], file_format: ImportFormat
+    ) -> dict[str, Any]:
+        """
+        Импорт задач из потока данных файла.
+
+        :param chunks: фрагменты файла
+        :param file_format: формат файла: "csv" или "ndjson"
+        :return: словарь с количеством созданных и обновленных задач, строк
+            с ошибками и списком ошибок (не больше max_errors) с номерами строк
+        :raises ValueError: если файл не удалось разобрать
+        """
+        parse = parse_csv if file_format == "csv" else parse_ndjson
+        staging = self._staging_table()
+        errors: list[dict[str, Any]] = []
+        total = failed = 0
+
+        async with self.db as session:
+            await self._execute_ddl(session, staging.create)
+            try:
+
+                async def load(batch: list[ParsedRow]) -> None:
+                    nonlocal failed
+                    records, batch_failed = self._validate(batch, errors)
+                    failed += batch_failed
+                    if records:
+                        await self._copy(session, staging, records)
+
+                batch: list[ParsedRow] = []
+                async for rows in parse(chunks, max_record_size=self.max_record_size):
+                    total += len(rows)
+                    batch.extend(rows)
+                    if len(batch) >= self.batch_size:
+                        await load(batch)
+                        batch = []
+                if batch:
+                    await load(batch)
+
+                created, updated, unknown = await self._merge(session, staging, errors)
+                failed += unknown
+            finally:
+                await session.rollback()
+                await self._execute_ddl(session, staging.drop)
+
+        if created or updated:
+            await self.cache.invalidate("tasks", "employees")
+
+        errors.sort(key=lambda error: error["row"])
+        return {
+            "status": 200,
+            "message": f"Imported {created + updated} of {total} rows",
+            "created": created,
+            "updated": updated,
+            "failed": failed,
+            "errors": errors,
+        }
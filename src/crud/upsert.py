@@ -0,0 +1,62 @@
+from typing import Any
+
+from sqlalchemy import Boolean, ColumnElement, Table, literal_column, or_
+from sqlalchemy.exc import IntegrityError
+
+# В RETURNING после INSERT ... ON CONFLICT DO UPDATE: xmax новой строки
+# равен 0, у обновленной — ID обновившей ее транзакции
+was_inserted = literal_column("(xmax = 0)", Boolean).label("inserted")
+
+UNIQUE_VIOLATION = "23505"
+NOT_NULL_VIOLATION = "23502"
+
+
+def changed_columns(table: Table, values: Any, names: list[str]) -> ColumnElement[bool]:
+    """
+    Условие ON CONFLICT DO UPDATE ... WHERE (или UPDATE ... WHERE): хотя бы
+    одно значение отличается от сохраненного, иначе строка не перезаписывается
+    (повтор запроса не создает новую версию строки и событие).
+
+    :param table: таблица, в которую выполняется вставка
+    :param values: новые значения по именам столбцов: stmt.excluded
+        для INSERT или словарь для UPDATE
+    :param names: имена обновляемых столбцов
+    """
+    return or_(*(table.c[name].is_distinct_from(values[name]) for name in names))
+
+
+def required_columns(table: Table) -> list[str]:
+    """
+    Столбцы NOT NULL без значения по умолчанию: без них строку нельзя вставить.
+
+    :param table: таблица
+    :return: имена столбцов
+    """
+    return [
+        column.name
+        for column in table.columns
+        if not column.nullable
+        and not column.primary_key
+        and column.default is None
+        and column.server_default is None
+    ]
+
+
+def integrity_error_response(exc: IntegrityError, entity: str) -> dict[str, Any]:
+    """
+    Ответ на нарушение ограничения при вставке или обновлении.
+
+    :param exc: исключение SQLAlchemy
+    :param entity: название записи для сообщения, например "Employee"
+    :return: словарь со статусом 409 (другая запись с тем же уникальным
+        значением) или 422 (не заполнено обязательное поле)
+    :raises IntegrityError: для прочих нарушений
+    """
+    code = getattr(exc.orig, "pgcode", None)
+    detail = getattr(exc.orig.__cause__, "detail", None) or str(exc.orig)
+    if code == UNIQUE_VIOLATION:
+        return {"status": 409, "message": f"{entity} conflict: {detail}"}
+    if code == NOT_NULL_VIOLATION:
+        column = getattr(exc.orig.__cause__, "column_name", None)
+        return {"status": 422, "message": f"{entity} field is required: {column}"}
+    raise exc
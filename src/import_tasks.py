@@ -0,0 +1,69 @@
+"""
+Импорт задач из CSV или NDJSON (см. POST /manager/tasks/import).
+
+Запуск (из каталога src):
+
+    python import_tasks.py tasks.csv
+    python import_tasks.py dump.ndjson --batch-size 50000
+
+Формат определяется по расширению файла (.csv — CSV, иначе NDJSON)
+или задается параметром --format. Отчет выводится в stdout в формате JSON.
+"""
+
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+from typing import AsyncIterator
+
+import orjson
+
+from core.config import settings
+from core.models import db_helper
+from crud.task_import import TaskImporter
+
+
+async def read_file(path: Path, read_size: int) -> AsyncIterator[bytes]:
+    with path.open("rb") as file:
+        while chunk := file.read(read_size):
+            yield chunk
+
+
+async def run(args: argparse.Namespace) -> dict:
+    file_format = args.format or ("csv" if args.path.suffix == ".csv" else "ndjson")
+    try:
+        async with db_helper.session_factory() as session:
+            importer = TaskImporter(
+                db=session,
+                batch_size=args.batch_size,
+                max_errors=args.max_errors,
+                max_record_size=settings.imports.max_record_size,
+            )
+            return await importer.run(
+                read_file(args.path, settings.imports.read_size),
+                file_format=file_format,
+            )
+    finally:
+        await db_helper.dispose()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Import tasks from CSV or NDJSON")
+    parser.add_argument("path", type=Path)
+    parser.add_argument("--format", choices=("csv", "ndjson"))
+    parser.add_argument("--batch-size", type=int, default=settings.imports.batch_size)
+    parser.add_argument("--max-errors", type=int, default=settings.imports.max_errors)
+    args = parser.parse_args()
+
+    try:
+        report = asyncio.run(run(args))
+    except ValueError as exc:
+        print(f"invalid import file: {exc}", file=sys.stderr)
+        return 1
+
+    sys.stdout.buffer.write(orjson.dumps(report, option=orjson.OPT_INDENT_2) + b"\n")
+    return 0 if not report["failed"] else 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,28 +2,77 @@ from contextlib import asynccontextmanager
 
 import uvicorn
 from fastapi import FastAPI
-from fastapi.responses import ORJSONResponse
 from core.config import settings
 from api import router as api_router
+from api.metrics import router as metrics_router
+from core.events import outbox_dispatcher
+from core.jobs import Job, job_runner
 from core.models import db_helper
+from core.monitoring import (
+    QueryGuardMiddleware,
+    RequestMetricsMiddleware,
+    TimedORJSONResponse,
+)
+from crud.task import get_task_manager
+
+
+async def prune_task_tombstones(job: Job) -> dict[str, int | str]:
+    async with db_helper.session_factory() as db:
+        manager = await get_task_manager(db=db)
+        return await manager.crud.prune_tombstones(
+            retention=settings.sync.retention,
+            chunk_size=settings.jobs.chunk_size,
+        )
+
+
+job_runner.every(
+    settings.sync.prune_interval, "prune_task_tombstones", prune_task_tombstones
+)
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     # startup
+    await db_helper.start()
+    if settings.events.enabled:
+        await outbox_dispatcher.start()
+    await job_runner.start()
     yield
     # shutdown
+    await job_runner.stop()
+    await outbox_dispatcher.stop()
     await db_helper.dispose()
 
 
 main_app = FastAPI(
-    default_response_class=ORJSONResponse,
+    default_response_class=TimedORJSONResponse,
     lifespan=lifespan,
 )
 
 main_app.include_router(
     api_router,
 )
+main_app.include_router(
+    metrics_router,
+)
+
+# Лимит SQL-запросов не зависит от сбора показателей: при включенном
+# мониторинге его middleware внешнее и делит с ним показатели запроса
+if settings.query_guard.max_statements is not None:
+    main_app.add_middleware(
+        QueryGuardMiddleware,
+        max_statements=settings.query_guard.max_statements,
+        mode=settings.query_guard.mode,
+        max_logged_statements=settings.monitoring.max_logged_statements,
+    )
+
+if settings.monitoring.enabled:
+    main_app.add_middleware(
+        RequestMetricsMiddleware,
+        server_timing=settings.monitoring.server_timing,
+        slow_request_threshold=settings.monitoring.slow_request_threshold,
+        max_logged_statements=settings.monitoring.max_logged_statements,
+    )
 
 
 if __name__ == "__main__":
@@ -0,0 +1,126 @@
+from datetime import timedelta
+
+import pytest
+from fastapi import Request
+
+from api.api_v1.conditional import etag_headers, is_not_modified, make_etag
+from core.cache import MemoryCacheBackend, ReadCache, RedisCacheBackend
+from core.models.db_helper import SYNCED_AT_KEY
+from crud.employees import workload_as_of
+
+pytestmark = pytest.mark.anyio
+
+
+def make_request(query: str = "limit=10", if_none_match: str | None = None):
+    headers = (
+        [] if if_none_match is None else [(b"if-none-match", if_none_match.encode())]
+    )
+    return Request(
+        {
+            "type": "http",
+            "method": "GET",
+            "path": "/api/v1/tasks/manager/tasks/all",
+            "query_string": query.encode(),
+            "headers": headers,
+        }
+    )
+
+
+class SnapshotSession:
+    """
+    Сессия, возвращающая заданный снимок транзакций (pg_current_snapshot).
+    """
+
+    def __init__(self, snapshot: str, synced_at: float | None = None) -> None:
+        self.snapshot = snapshot
+        self.info = {} if synced_at is None else {SYNCED_AT_KEY: synced_at}
+
+    async def scalar(self, stmt) -> str:
+        return self.snapshot
+
+
+async def test_no_etag_without_shared_backend_or_session():
+    cache = ReadCache(backend=MemoryCacheBackend())
+
+    etag = await make_etag(make_request(), "tasks", cache=cache)
+
+    assert etag is None
+    assert etag_headers(etag) == {}
+    assert not is_not_modified(make_request(if_none_match="*"), etag)
+
+
+async def test_memory_backend_etag_follows_database_snapshot():
+    cache = ReadCache(backend=MemoryCacheBackend())
+
+    etag = await make_etag(
+        make_request(), "tasks", db=SnapshotSession("100:104:101"), cache=cache
+    )
+    same = await make_etag(
+        make_request(), "tasks", db=SnapshotSession("100:104:101"), cache=cache
+    )
+    # Транзакция 101 завершилась (в том числе в другом процессе)
+    current = await make_etag(
+        make_request(), "tasks", db=SnapshotSession("102:104:"), cache=cache
+    )
+
+    assert etag == same
+    assert is_not_modified(make_request(if_none_match=etag), same)
+    assert current != etag
+
+
+async def test_lagging_replica_etag_follows_its_snapshot(redis_client):
+    cache = ReadCache(backend=RedisCacheBackend(client=redis_client))
+    await cache.invalidate("tasks")
+    written_at = await cache.backend.get_written_at("tasks")
+
+    fresh = await make_etag(
+        make_request(), "tasks", db=SnapshotSession("1:2:", written_at), cache=cache
+    )
+    lagging = await make_etag(
+        make_request(),
+        "tasks",
+        db=SnapshotSession("1:2:", written_at - 1),
+        cache=cache,
+    )
+
+    assert fresh.startswith('W/"1-')
+    assert lagging.startswith('W/"s')
+
+
+async def test_etag_depends_on_query(redis_client):
+    cache = ReadCache(backend=RedisCacheBackend(client=redis_client))
+
+    first = await make_etag(make_request("limit=10"), "tasks", cache=cache)
+    second = await make_etag(make_request("limit=20"), "tasks", cache=cache)
+
+    assert first.startswith('W/"')
+    assert first != second
+
+
+async def test_write_through_other_instance_changes_etag(redis_client):
+    # Два экземпляра приложения с общим сервером Redis
+    instance = ReadCache(backend=RedisCacheBackend(client=redis_client))
+    other_instance = ReadCache(backend=RedisCacheBackend(client=redis_client))
+
+    etag = await make_etag(make_request(), "tasks", cache=instance)
+    assert is_not_modified(make_request(if_none_match=etag), etag)
+
+    await other_instance.invalidate("tasks")
+
+    current = await make_etag(make_request(), "tasks", cache=instance)
+    assert current != etag
+    assert not is_not_modified(make_request(if_none_match=etag), current)
+
+
+async def test_workload_etag_changes_with_interval(redis_client):
+    cache = ReadCache(backend=RedisCacheBackend(client=redis_client))
+    as_of = workload_as_of(interval=60)
+    later = as_of + timedelta(seconds=60)
+
+    etag = await make_etag(make_request(), "employees", cache=cache, extra=str(as_of))
+    current = await make_etag(
+        make_request(), "employees", cache=cache, extra=str(later)
+    )
+
+    assert as_of.timestamp() % 60 == 0
+    assert current != etag
@@ -0,0 +1,119 @@
+import pytest
+from sqlalchemy import text
+
+from core.cache import MemoryCacheBackend, ReadCache
+from core.models.db_helper import DatabaseHelper, parse_lsn, replica_synced_at
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def helper(tmp_path):
+    # Реплики — отдельные файлы SQLite; последняя недоступна (нет каталога)
+    helper = DatabaseHelper(
+        url=f"sqlite+aiosqlite:///{tmp_path / 'primary.db'}",
+        replica_urls=[
+            f"sqlite+aiosqlite:///{tmp_path / 'replica_1.db'}",
+            f"sqlite+aiosqlite:///{tmp_path / 'replica_2.db'}",
+            f"sqlite+aiosqlite:///{tmp_path / 'down' / 'replica_3.db'}",
+        ],
+        replica_retry_interval=60.0,
+    )
+    yield helper
+    await helper.dispose()
+
+
+async def read_database(helper: DatabaseHelper) -> str:
+    async with helper.read_session() as session:
+        return session.bind.url.database.rsplit("/", 1)[-1]
+
+
+async def write(helper: DatabaseHelper) -> None:
+    async with helper.session_factory() as session:
+        await session.execute(text("CREATE TABLE IF NOT EXISTS t (id INTEGER)"))
+        await session.commit()
+
+
+def test_parse_lsn():
+    assert parse_lsn("0/16B3748") == 0x16B3748
+    assert parse_lsn("16/B374D848") == (0x16 << 32) | 0xB374D848
+
+
+async def test_reads_rotate_between_available_replicas(helper):
+    await helper.probe_replicas()
+    databases = [await read_database(helper) for _ in range(4)]
+
+    assert set(databases) == {"replica_1.db", "replica_2.db"}
+    assert not helper.replicas[2].is_available
+
+
+async def test_sessions_take_connection_on_first_query(helper):
+    async with helper.session_factory() as session:
+        assert helper.pool_metrics.checkouts == 0
+        await session.execute(text("SELECT 1"))
+
+    assert helper.pool_metrics.checkouts == 1
+    assert helper.pool_metrics.checkout_wait_count == 1
+    assert helper.pool_metrics.in_use == 0
+
+
+async def test_unavailable_replicas_fail_over_to_primary(helper):
+    for replica in helper.replicas:
+        replica.unavailable_until = float("inf")
+
+    assert await read_database(helper) == "primary.db"
+
+
+async def test_probe_marks_replica_availability(helper, tmp_path):
+    await helper.probe_replicas()
+    assert [replica.is_available for replica in helper.replicas] == [
+        True,
+        True,
+        False,
+    ]
+
+    (tmp_path / "down").mkdir()
+    await helper.probe_replicas()
+    assert all(replica.is_available for replica in helper.replicas)
+
+
+async def test_reads_after_write_use_primary_until_replicas_sync(helper):
+    await helper.probe_replicas()
+    await write(helper)
+
+    assert await read_database(helper) == "primary.db"
+
+    await helper.probe_replicas()
+    assert await read_database(helper) in {"replica_1.db", "replica_2.db"}
+
+
+async def test_read_session_reports_replica_freshness(helper):
+    await helper.probe_replicas()
+
+    async with helper.read_session() as session:
+        assert replica_synced_at(session) == helper.replicas[0].synced_at
+
+    for replica in helper.replicas:
+        replica.unavailable_until = float("inf")
+    async with helper.read_session() as session:
+        assert replica_synced_at(session) is None
+
+
+async def test_lagging_replica_reads_are_not_cached():
+    cache = ReadCache(backend=MemoryCacheBackend(), ttl=60)
+    calls = []
+
+    async def load() -> list[int]:
+        calls.append(1)
+        return calls
+
+    await cache.invalidate("tasks")
+    written_at = await cache.backend.get_written_at("tasks")
+
+    await cache.get_or_load("tasks", ("all",), load, synced_at=written_at - 1)
+    await cache.get_or_load("tasks", ("all",), load, synced_at=written_at - 1)
+    assert len(calls) == 2
+
+    await cache.get_or_load("tasks", ("all",), load, synced_at=written_at)
+    await cache.get_or_load("tasks", ("all",), load, synced_at=written_at)
+    assert len(calls) == 3
@@ -0,0 +1,75 @@
+import pytest
+from sqlalchemy import insert, select
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from sqlalchemy.ext.compiler import compiles
+
+from core.cache import MemoryCacheBackend, ReadCache
+from core.models import Employee, OutboxEvent
+from core.schemas import EmployeeRequest
+from crud.employees import EmployeeCRUD
+
+pytestmark = pytest.mark.anyio
+
+
+@compiles(JSONB, "sqlite")
+def compile_jsonb(type_, compiler, **kw) -> str:
+    return "JSON"
+
+
+@pytest.fixture
+async def session_factory(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'db.sqlite'}")
+    async with engine.begin() as connection:
+        # В SQLite автоинкрементным бывает только INTEGER PRIMARY KEY
+        await connection.exec_driver_sql(
+            "CREATE TABLE outbox_events (id INTEGER PRIMARY KEY, seq INTEGER DEFAULT 0,"
+            " aggregate TEXT,"
+            " aggregate_id INTEGER, event_type TEXT, payload JSON, created_at TEXT)"
+        )
+        await connection.run_sync(Employee.__table__.create)
+        await connection.execute(
+            insert(Employee).values(
+                fullname="Ivan Petrov",
+                position="developer",
+                age=30,
+                email="ivan@example.com",
+                hashed_password="secret",
+            )
+        )
+    yield async_sessionmaker(engine, expire_on_commit=False)
+    await engine.dispose()
+
+
+async def upsert(session_factory, **fields) -> dict:
+    crud = EmployeeCRUD(
+        db=session_factory(), cache=ReadCache(backend=MemoryCacheBackend())
+    )
+    return await crud.upsert(EmployeeRequest(**fields))
+
+
+async def test_partial_upsert_updates_existing_employee(session_factory):
+    result = await upsert(session_factory, email="ivan@example.com", position="lead")
+
+    assert result["status"] == 200 and not result["created"]
+    async with session_factory() as session:
+        employee = await session.scalar(select(Employee))
+        event = await session.scalar(select(OutboxEvent))
+    assert (employee.fullname, employee.position, employee.age) == (
+        "Ivan Petrov",
+        "lead",
+        30,
+    )
+    assert (event.event_type, event.payload) == ("updated", {"position": "lead"})
+
+
+async def test_partial_upsert_without_changes_is_up_to_date(session_factory):
+    result = await upsert(session_factory, email="ivan@example.com", age=30)
+
+    assert result["message"] == "Employee Is Up To Date"
+
+
+async def test_partial_upsert_of_new_employee_requires_fields(session_factory):
+    result = await upsert(session_factory, email="anna@example.com", position="qa")
+
+    assert result == {"status": 422, "message": "Employee field is required: fullname"}
@@ -0,0 +1,166 @@
+import asyncio
+from datetime import datetime, timezone
+
+import orjson
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from core.events import ChangeEvent, EventBroker, OutboxDispatcher, Subscription
+
+pytestmark = pytest.mark.anyio
+
+CREATED_AT = datetime(2026, 10, 17, tzinfo=timezone.utc)
+
+
+def row(event_id: int, seq: int) -> tuple:
+    return event_id, seq, "task", event_id * 10, "updated", {}, CREATED_AT
+
+
+def change(event_id: int, seq: int) -> ChangeEvent:
+    return ChangeEvent.from_row(row(event_id, seq))
+
+
+class StubResult:
+    def __init__(self, rows: list) -> None:
+        self.rows = rows
+
+    def all(self) -> list:
+        return self.rows
+
+    def one_or_none(self):
+        return self.rows[0] if self.rows else None
+
+
+class StubSession:
+    def __init__(self, db: "StubDatabase") -> None:
+        self.db = db
+
+    async def __aenter__(self) -> "StubSession":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        pass
+
+    async def execute(self, stmt) -> StubResult:
+        self.db.statements.append(stmt)
+        return StubResult(self.db.results.pop(0))
+
+    async def scalar(self, stmt):
+        self.db.statements.append(stmt)
+        return self.db.results.pop(0)
+
+
+class StubDatabase:
+    """
+    Замена DatabaseHelper: сессии возвращают заранее заданные результаты
+    запросов по порядку.
+    """
+
+    def __init__(self, *results) -> None:
+        self.results = list(results)
+        self.statements: list = []
+
+    def session_factory(self) -> StubSession:
+        return StubSession(self)
+
+
+def make_dispatcher(db: StubDatabase, broker: EventBroker) -> OutboxDispatcher:
+    return OutboxDispatcher(db=db, broker=broker, batch_size=100)
+
+
+async def test_broker_publishes_to_subscribers():
+    broker = EventBroker()
+
+    with broker.subscribe() as subscription:
+        broker.publish([change(1, 7), change(2, 7)])
+        events = await subscription.get(timeout=0.1)
+
+    assert [event.id for event in events] == [1, 2]
+    assert broker.position == (7, 2)
+    assert broker.stats == {"position": 2, "subscribers": 0}
+
+
+async def test_subscription_overflow_requests_reload():
+    subscription = Subscription(queue_size=1)
+
+    subscription.put([change(1, 7)])
+    subscription.put([change(2, 7)])
+
+    assert await subscription.get(timeout=0.1) is None
+    assert await subscription.get(timeout=0.01) == []
+
+
+async def test_dispatch_does_not_wait_for_rolled_back_ids():
+    # Событие 2 не появится: его транзакция откатилась
+    db = StubDatabase([row(1, 7), row(3, 8)])
+    broker = EventBroker()
+    dispatcher = make_dispatcher(db, broker)
+
+    assert await dispatcher.dispatch() == 2
+    assert broker.position == (8, 3)
+
+    sql = str(db.statements[0].compile(dialect=postgresql.asyncpg.dialect()))
+    assert "(outbox_events.seq, outbox_events.id) > ($1::INTEGER, $2::INTEGER)" in sql
+    assert "outbox_events.seq < CAST(CAST(pg_snapshot_xmin(" in sql
+    assert "ORDER BY outbox_events.seq, outbox_events.id" in sql
+
+
+async def test_dispatch_without_settled_events_keeps_position():
+    broker = EventBroker()
+    broker.position = (8, 3)
+
+    assert await make_dispatcher(StubDatabase([]), broker).dispatch() == 0
+    assert broker.position == (8, 3)
+
+
+async def test_follow_resumes_after_last_received_event():
+    # Позиция события 5 и дочитывание событий до позиции рассылки
+    db = StubDatabase(10, [row(6, 10), row(8, 12)])
+    broker = EventBroker()
+    broker.position = (12, 8)
+    feed = make_dispatcher(db, broker).follow(after=5, heartbeat_interval=0.01)
+
+    assert [event.id for event in await anext(feed)] == [6, 8]
+
+    pending = asyncio.ensure_future(anext(feed))
+    await asyncio.sleep(0)
+    broker.publish([change(7, 12), change(9, 12)])
+    assert [event.id for event in await pending] == [9]
+
+    broker.close()
+    with pytest.raises(StopAsyncIteration):
+        while True:
+            await anext(feed)
+
+
+async def test_follow_resets_when_events_are_pruned():
+    db = StubDatabase(None)
+    broker = EventBroker()
+    broker.position = (12, 8)
+    feed = make_dispatcher(db, broker).follow(after=5, heartbeat_interval=0.01)
+
+    (reset,) = await anext(feed)
+
+    assert reset.name == "reset"
+    assert orjson.loads(reset.data) == {"position": 8}
+    await feed.aclose()
+
+
+async def test_follow_from_start_after_pruning_resets():
+    db = StubDatabase(3)
+    broker = EventBroker()
+    feed = make_dispatcher(db, broker).follow(after=0, heartbeat_interval=0.01)
+
+    assert [event.name for event in await anext(feed)] == ["reset"]
+    await feed.aclose()
+
+
+async def test_follow_without_position_waits_for_new_events():
+    broker = EventBroker()
+    broker.position = (12, 8)
+    feed = make_dispatcher(StubDatabase(), broker).follow(
+        after=None, heartbeat_interval=0.01
+    )
+
+    assert await anext(feed) == []
+    await feed.aclose()
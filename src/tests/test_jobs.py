@@ -0,0 +1,156 @@
+import asyncio
+
+import pytest
+
+from core.jobs import Job, JobCancelled, JobQueueFull, JobRunner, JobStatus
+
+pytestmark = pytest.mark.anyio
+
+
+async def wait_finished(job: Job) -> None:
+    for _ in range(100):
+        if job.finished:
+            return
+        await asyncio.sleep(0.01)
+    raise AssertionError(f"Job {job.kind} did not finish")
+
+
+@pytest.fixture
+async def runner():
+    runner = JobRunner(workers=1, queue_size=2, max_finished=2)
+    await runner.start()
+    yield runner
+    await runner.stop()
+
+
+async def test_job_reports_progress_and_result(runner):
+    async def work(job: Job) -> dict:
+        for processed in (5, 10):
+            job.report(processed, total=10)
+        return {"deleted": 10}
+
+    job = runner.submit("delete_tasks_by_status", work)
+    await wait_finished(job)
+
+    assert job.status is JobStatus.SUCCEEDED
+    assert (job.processed, job.total, job.result) == (10, 10, {"deleted": 10})
+    assert job.as_dict()["finished_at"] is not None
+
+
+async def test_failed_job_keeps_error(runner):
+    async def work(job: Job) -> None:
+        raise RuntimeError("boom")
+
+    job = runner.submit("failing", work)
+    await wait_finished(job)
+
+    assert job.status is JobStatus.FAILED
+    assert job.error == "boom"
+
+
+async def test_running_job_stops_at_next_report(runner):
+    started, proceed = asyncio.Event(), asyncio.Event()
+
+    async def work(job: Job) -> None:
+        job.report(1)
+        started.set()
+        await proceed.wait()
+        job.report(2)
+        raise AssertionError("job was not cancelled")
+
+    job = runner.submit("long", work)
+    await started.wait()
+    runner.cancel(job.id)
+    assert job.status is JobStatus.RUNNING
+
+    proceed.set()
+    await wait_finished(job)
+    assert job.status is JobStatus.CANCELLED
+    assert job.processed == 2
+
+
+async def test_pending_job_is_cancelled_immediately(runner):
+    proceed = asyncio.Event()
+    calls = []
+
+    async def block(job: Job) -> None:
+        await proceed.wait()
+
+    async def work(job: Job) -> None:
+        calls.append(job.id)
+
+    blocking = runner.submit("block", block)
+    pending = runner.submit("pending", work)
+    await asyncio.sleep(0)
+
+    assert runner.cancel(pending.id).status is JobStatus.CANCELLED
+    proceed.set()
+    await wait_finished(blocking)
+    await asyncio.sleep(0.01)
+    assert calls == []
+    assert runner.cancel("missing") is None
+
+
+def test_report_raises_when_cancel_requested():
+    job = Job(kind="delete_tasks_by_status")
+    job.cancel_requested = True
+
+    with pytest.raises(JobCancelled):
+        job.report(3)
+    assert job.processed == 3
+
+
+async def test_full_queue_rejects_job():
+    runner = JobRunner(workers=1, queue_size=1)
+
+    async def work(job: Job) -> None:
+        pass
+
+    runner.submit("first", work)
+    with pytest.raises(JobQueueFull):
+        runner.submit("second", work)
+    assert len(runner.jobs) == 1
+
+
+async def test_stop_cancels_pending_jobs():
+    runner = JobRunner(workers=1, queue_size=10)
+
+    async def work(job: Job) -> None:
+        pass
+
+    job = runner.submit("pending", work)
+    await runner.stop()
+
+    assert job.status is JobStatus.CANCELLED
+    assert job.error == "Application stopped"
+
+
+async def test_only_max_finished_jobs_are_kept(runner):
+    async def work(job: Job) -> None:
+        pass
+
+    jobs = []
+    for number in range(4):
+        jobs.append(runner.submit(f"job-{number}", work))
+        await wait_finished(jobs[-1])
+    runner.submit("last", work)
+
+    assert jobs[0].id not in runner.jobs and jobs[1].id not in runner.jobs
+    assert runner.get(jobs[3].id) is jobs[3]
+
+
+async def test_periodic_job_is_submitted():
+    runner = JobRunner(workers=1)
+    calls = []
+
+    async def prune(job: Job) -> int:
+        calls.append(job.kind)
+        return len(calls)
+
+    runner.every(0.01, "prune_task_tombstones", prune)
+    await runner.start()
+    await asyncio.sleep(0.1)
+    await runner.stop()
+
+    assert calls and set(calls) == {"prune_task_tombstones"}
+    assert any(job.status is JobStatus.SUCCEEDED for job in runner.jobs.values())
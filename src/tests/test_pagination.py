@@ -0,0 +1,38 @@
+import pytest
+
+from utils import build_page, decode_cursor, decode_id_cursor, encode_cursor
+
+
+def test_cursor_round_trip():
+    payload = {"sort": "created_at", "key": "2026-10-17T12:00:00+00:00", "id": 7}
+
+    cursor = encode_cursor(payload)
+
+    assert "=" not in cursor
+    assert decode_cursor(cursor) == payload
+    assert decode_id_cursor(encode_cursor({"id": 42})) == 42
+    assert decode_id_cursor(None) is None
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "not a cursor!",
+        encode_cursor({"id": True}),
+        encode_cursor({"id": "42"}),
+        encode_cursor({"id": 4.2}),
+        encode_cursor({}),
+        "WzFd",  # [1]: не объект
+    ],
+)
+def test_invalid_id_cursor_is_rejected(cursor):
+    with pytest.raises(ValueError):
+        decode_id_cursor(cursor)
+
+
+def test_build_page_returns_cursor_of_last_item():
+    page = build_page([1, 2, 3], 2, lambda item: {"id": item})
+
+    assert page["items"] == [1, 2]
+    assert decode_id_cursor(page["next_cursor"]) == 2
+    assert build_page([1, 2], 2, lambda item: {"id": item})["next_cursor"] is None
@@ -0,0 +1,132 @@
+import logging
+
+import pytest
+from sqlalchemy import ForeignKey, select, text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
+from sqlalchemy.orm import selectinload
+
+from core.monitoring import (
+    QueryGuardMiddleware,
+    RequestMetrics,
+    RequestMetricsMiddleware,
+    StatementLimitExceeded,
+    current_request,
+    instrument_engine,
+    instrument_sessions,
+)
+
+pytestmark = pytest.mark.anyio
+
+
+class Base(DeclarativeBase):
+    pass
+
+
+class Parent(Base):
+    __tablename__ = "parents"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    children: Mapped[list["Child"]] = relationship()
+
+
+class Child(Base):
+    __tablename__ = "children"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    parent_id: Mapped[int] = mapped_column(ForeignKey("parents.id"))
+
+
+@pytest.fixture
+async def engine(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'guard.db'}")
+    instrument_engine(engine)
+    instrument_sessions()
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with AsyncSession(engine) as session:
+        session.add_all(
+            [Parent(id=1, children=[Child(id=1)]), Parent(id=2, children=[])]
+        )
+        await session.commit()
+    yield engine
+    await engine.dispose()
+
+
+def make_app(engine, statements: int):
+    async def app(scope, receive, send) -> None:
+        async with engine.connect() as conn:
+            for _ in range(statements):
+                await conn.execute(text("SELECT 1"))
+        await send({"type": "http.response.start", "status": 200, "headers": []})
+        await send({"type": "http.response.body", "body": b""})
+
+    return app
+
+
+async def call(app) -> list[dict]:
+    messages = []
+
+    async def receive() -> dict:
+        return {"type": "http.request", "body": b""}
+
+    async def send(message: dict) -> None:
+        messages.append(message)
+
+    scope = {"type": "http", "method": "GET", "path": "/tasks", "headers": []}
+    await app(scope, receive, send)
+    return messages
+
+
+async def test_eager_loads_are_not_counted_as_lazy(engine):
+    metrics = RequestMetrics()
+    token = current_request.set(metrics)
+    try:
+        async with AsyncSession(engine) as session:
+            await session.scalars(select(Parent).options(selectinload(Parent.children)))
+            assert metrics.lazy_load_count == 0
+
+            parent = await session.get(Parent, 2, populate_existing=True)
+            await session.run_sync(lambda _: parent.children)
+    finally:
+        current_request.reset(token)
+
+    assert metrics.lazy_load_count == 1
+
+
+async def test_guard_warns_without_monitoring(engine, caplog):
+    app = QueryGuardMiddleware(make_app(engine, statements=3), max_statements=2)
+
+    with caplog.at_level(logging.WARNING):
+        messages = await call(app)
+
+    assert messages[0]["status"] == 200
+    assert "Too many SQL statements in request GET /tasks" in caplog.text
+    assert "3 statements (limit 2)" in caplog.text
+    assert current_request.get() is None
+
+
+async def test_guard_raises_before_statement_over_limit(engine, caplog):
+    app = QueryGuardMiddleware(
+        make_app(engine, statements=3), max_statements=2, mode="raise"
+    )
+
+    with caplog.at_level(logging.WARNING):
+        with pytest.raises(StatementLimitExceeded):
+            await call(app)
+
+    assert "2 statements (limit 2)" in caplog.text
+
+
+async def test_guard_shares_request_metrics(engine, caplog):
+    app = RequestMetricsMiddleware(
+        QueryGuardMiddleware(make_app(engine, statements=2), max_statements=2),
+        server_timing=True,
+    )
+
+    with caplog.at_level(logging.WARNING):
+        messages = await call(app)
+
+    headers = dict(messages[0]["headers"])
+    assert b'desc="2 queries"' in headers[b"server-timing"]
+    assert "Too many SQL statements" not in caplog.text
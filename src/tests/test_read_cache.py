@@ -0,0 +1,90 @@
+import pytest
+
+from core.cache import ReadCache, RedisCacheBackend
+
+pytestmark = pytest.mark.anyio
+
+
+class Loader:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def __call__(self) -> dict:
+        self.calls += 1
+        return {"items": [self.calls]}
+
+
+def make_cache(client, **kwargs) -> ReadCache:
+    return ReadCache(backend=RedisCacheBackend(client=client), ttl=60, **kwargs)
+
+
+async def test_get_or_load_caches_value(redis_client):
+    cache = make_cache(redis_client)
+    loader = Loader()
+
+    first = await cache.get_or_load("tasks", ("all", 10, None), loader)
+    second = await cache.get_or_load("tasks", ("all", 10, None), loader)
+
+    assert first == second == {"items": [1]}
+    assert loader.calls == 1
+    assert cache.stats["hits"] == 1
+    assert cache.stats["misses"] == 1
+
+
+async def test_key_includes_query_parameters(redis_client):
+    cache = make_cache(redis_client)
+    loader = Loader()
+
+    await cache.get_or_load("tasks", ("all", 10, None), loader)
+    await cache.get_or_load("tasks", ("all", 20, None), loader)
+
+    assert loader.calls == 2
+
+
+async def test_invalidate_bumps_version(redis_client):
+    cache = make_cache(redis_client)
+    loader = Loader()
+
+    await cache.get_or_load("tasks", ("all",), loader)
+    assert await cache.version("tasks") == 0
+
+    await cache.invalidate("tasks")
+
+    assert await cache.version("tasks") == 1
+    assert await redis_client.get("task_tracker:version:tasks") == b"1"
+    assert await cache.get_or_load("tasks", ("all",), loader) == {"items": [2]}
+    assert cache.stats["invalidations"] == 1
+
+
+async def test_invalidate_keeps_other_namespaces(redis_client):
+    cache = make_cache(redis_client)
+    loader = Loader()
+
+    await cache.get_or_load("employees", ("all",), loader)
+    await cache.invalidate("tasks")
+    await cache.get_or_load("employees", ("all",), loader)
+
+    assert loader.calls == 1
+
+
+async def test_invalidation_is_shared_between_workers(redis_client):
+    # Два процесса с общим сервером Redis
+    worker, other_worker = make_cache(redis_client), make_cache(redis_client)
+    loader = Loader()
+
+    await worker.get_or_load("tasks", ("all",), loader)
+    await other_worker.invalidate("tasks")
+    await worker.get_or_load("tasks", ("all",), loader)
+
+    assert loader.calls == 2
+
+
+async def test_disabled_cache_always_loads(redis_client):
+    cache = make_cache(redis_client, enabled=False)
+    loader = Loader()
+
+    await cache.get_or_load("tasks", ("all",), loader)
+    await cache.get_or_load("tasks", ("all",), loader)
+
+    assert loader.calls == 2
+    assert redis_client._data == {}
@@ -0,0 +1,48 @@
+from sqlalchemy.dialects import postgresql
+
+from core.schemas import TaskReassignment
+from crud.employees import EmployeeCRUD, least_loaded_quotas
+
+
+def test_least_loaded_fills_least_loaded_employees_first():
+    loads = {1: 7, 2: 0, 3: 3}
+
+    quotas = least_loaded_quotas(loads, 6)
+
+    assert quotas == {1: 0, 2: 5, 3: 1}
+    assert {
+        employee_id: loads[employee_id] + quotas[employee_id] for employee_id in loads
+    } == {1: 7, 2: 5, 3: 4}
+
+
+def test_least_loaded_balances_uneven_loads():
+    loads = {10: 5, 11: 0, 12: 2, 13: 40}
+
+    quotas = least_loaded_quotas(loads, 1001)
+
+    final = [loads[employee_id] + quotas[employee_id] for employee_id in loads]
+    assert sum(quotas.values()) == 1001
+    assert max(final) - min(final) <= 1
+
+
+def test_least_loaded_breaks_ties_by_employee_id():
+    assert least_loaded_quotas({3: 1, 2: 1}, 1) == {3: 0, 2: 1}
+    assert least_loaded_quotas({1: 0, 2: 0}, 0) == {1: 0, 2: 0}
+
+
+def test_least_loaded_assignment_uses_contiguous_ranges():
+    reassignment = TaskReassignment(
+        from_employee_id=1, to_employee_ids=[2, 3, 4], strategy="least_loaded"
+    )
+    quotas = least_loaded_quotas({2: 5, 3: 0, 4: 2}, 6)
+
+    sql = str(
+        EmployeeCRUD._assignment(reassignment, quotas=quotas).element.compile(
+            dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+        )
+    )
+
+    assert quotas == {2: 0, 3: 4, 4: 2}
+    assert "unnest(ARRAY[3, 4])" in sql
+    assert "width_bucket(moved.position, ARRAY[1, 5])" in sql
+    assert "generate_series" not in sql
@@ -0,0 +1,47 @@
+import time
+
+import pytest
+
+from crud.task import (
+    SyncPosition,
+    SyncTokenExpired,
+    TaskCRUD,
+    decode_changes_token,
+)
+from utils import encode_cursor
+
+pytestmark = pytest.mark.anyio
+
+
+def test_decode_continuation_token():
+    token = encode_cursor(
+        {
+            "seq": 10,
+            "issued": 1000,
+            "until": 20,
+            "until_issued": 2000,
+            "after": [15, 3],
+        }
+    )
+
+    assert decode_changes_token(token) == SyncPosition(
+        since=10, issued=1000, until=20, until_issued=2000, after=(15, 3)
+    )
+
+
+def test_decode_rejects_broken_token():
+    with pytest.raises(ValueError):
+        decode_changes_token(encode_cursor({"seq": 10, "issued": "yesterday"}))
+
+
+async def test_expired_token_is_rejected():
+    # Срок проверяется до обращения к базе данных
+    crud = TaskCRUD(db=None)
+    issued = int(time.time()) - 3600
+
+    with pytest.raises(SyncTokenExpired):
+        await crud.get_changes(
+            encode_cursor({"seq": 10, "issued": issued}), limit=10, retention=60
+        )
+    with pytest.raises(SyncTokenExpired):
+        await crud.get_changes(encode_cursor({"seq": 10}), limit=10, retention=60)
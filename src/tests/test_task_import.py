@@ -0,0 +1,121 @@
+import pytest
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import CreateTable
+
+from crud.task_import import TaskImporter, parse_csv, parse_ndjson
+
+pytestmark = pytest.mark.anyio
+
+
+async def stream(*chunks: bytes):
+    for chunk in chunks:
+        yield chunk
+
+
+async def parse_all(rows) -> list:
+    return [row async for batch in rows for row in batch]
+
+
+async def test_csv_value_with_newline_across_chunks():
+    rows = parse_csv(stream(b'title,description\nfirst,"line 1\n', b'line 2"\n'))
+
+    assert await parse_all(rows) == [
+        (1, {"title": "first", "description": "line 1\nline 2"})
+    ]
+
+
+async def test_csv_unbalanced_quote_is_rejected_with_row_number():
+    rows = parse_csv(
+        stream(b"title\nfirst\nsecond\n", b'"third\n', *[b"more\n"] * 10),
+        max_record_size=20,
+    )
+
+    with pytest.raises(ValueError, match="Row 3"):
+        await parse_all(rows)
+
+
+async def test_ndjson_long_line_is_rejected():
+    rows = parse_ndjson(stream(b'{"title": "a"}\n', b"x" * 30), max_record_size=20)
+
+    with pytest.raises(ValueError, match="Line 2"):
+        await parse_all(rows)
+
+
+class StubConnection:
+    def __init__(self, calls: list) -> None:
+        self.calls = calls
+        self.driver_connection = self
+
+    async def run_sync(self, ddl) -> None:
+        self.calls.append(ddl.__name__)
+
+    async def get_raw_connection(self) -> "StubConnection":
+        return self
+
+    async def copy_records_to_table(self, table_name, records, columns) -> None:
+        self.calls.append(("copy", len(records)))
+
+
+class StubSession:
+    def __init__(self) -> None:
+        self.calls: list = []
+
+    async def __aenter__(self) -> "StubSession":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        pass
+
+    async def connection(self) -> StubConnection:
+        return StubConnection(self.calls)
+
+    async def commit(self) -> None:
+        self.calls.append("commit")
+
+    async def rollback(self) -> None:
+        self.calls.append("rollback")
+
+
+async def test_import_commits_each_batch_before_merge():
+    session = StubSession()
+    importer = TaskImporter(db=session, batch_size=2)
+
+    async def merge(session, staging, errors) -> tuple[int, int, int]:
+        session.calls.append("merge")
+        return 3, 0, 0
+
+    importer._merge = merge
+    report = await importer.run(
+        stream(b'{"title": "a"}\n{"title": "b"}\n', b'{"title": "c"}\n'), "ndjson"
+    )
+
+    assert report["created"] == 3
+    assert session.calls == [
+        "create",
+        "commit",
+        ("copy", 2),
+        "commit",
+        ("copy", 1),
+        "commit",
+        "merge",
+        "rollback",
+        "drop",
+        "commit",
+    ]
+
+
+async def test_staging_table_is_dropped_when_parsing_fails():
+    session = StubSession()
+    importer = TaskImporter(db=session, max_record_size=4)
+
+    with pytest.raises(ValueError):
+        await importer.run(stream(b'{"title": "too long"'), "ndjson")
+
+    assert session.calls == ["create", "commit", "rollback", "drop", "commit"]
+
+
+def test_staging_table_is_unlogged():
+    table = TaskImporter._staging_table()
+    ddl = str(CreateTable(table).compile(dialect=postgresql.asyncpg.dialect()))
+
+    assert ddl.lstrip().startswith(f"CREATE UNLOGGED TABLE {table.name}")
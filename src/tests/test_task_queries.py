@@ -0,0 +1,210 @@
+from collections import namedtuple
+from datetime import datetime, timezone
+
+import pytest
+from sqlalchemy.dialects import postgresql
+
+from core.cache import MemoryCacheBackend, ReadCache
+from core.schemas import (
+    Status,
+    TaskFilter,
+    TaskResponse,
+    TaskSortField,
+    TaskStatusTransition,
+)
+from crud.task import TaskCRUD, decode_sort_cursor, task_to_json
+from utils import decode_cursor, encode_cursor
+
+pytestmark = pytest.mark.anyio
+
+CREATED_AT = datetime(2026, 10, 17, 12, tzinfo=timezone.utc)
+DUE_AT = datetime(2026, 10, 20, 18, tzinfo=timezone.utc)
+
+TaskRow = namedtuple(
+    "TaskRow",
+    "title description label priority status completed_at attachment id "
+    "created_at last_update",
+)
+
+
+def task_row(task_id: int, created_at: datetime = CREATED_AT) -> TaskRow:
+    return TaskRow(
+        "Task",
+        None,
+        "ops",
+        "medium",
+        "backlog",
+        DUE_AT,
+        None,
+        task_id,
+        created_at,
+        created_at,
+    )
+
+
+class StubResult:
+    def __init__(self, rows: list) -> None:
+        self.rows = rows
+
+    def all(self) -> list:
+        return self.rows
+
+    def scalars(self) -> "StubResult":
+        return self
+
+
+class StubSession:
+    """
+    Сессия, возвращающая заданные строки и запоминающая выполненные запросы.
+    """
+
+    def __init__(self, *results: list) -> None:
+        self.results = list(results)
+        self.statements: list = []
+        self.info: dict = {}
+
+    async def __aenter__(self) -> "StubSession":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        pass
+
+    async def execute(self, stmt) -> StubResult:
+        self.statements.append(stmt)
+        return StubResult(self.results.pop(0))
+
+    async def commit(self) -> None:
+        pass
+
+
+def compile_sql(stmt) -> str:
+    return str(
+        stmt.compile(
+            dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+        )
+    )
+
+
+def make_crud(session: StubSession) -> TaskCRUD:
+    return TaskCRUD(db=session, cache=ReadCache(backend=MemoryCacheBackend()))
+
+
+def test_task_to_json_matches_response_schema():
+    row = task_row(3)
+
+    assert task_to_json(row) == TaskResponse.model_validate(row).model_dump(mode="json")
+
+
+def test_task_to_json_takes_trailing_task_columns():
+    # Строка (employee_id, *task_columns), как в событиях создания задач
+    row = (11, *task_row(3))
+
+    assert task_to_json(row) == task_to_json(task_row(3))
+
+
+def test_sort_cursor_round_trip():
+    cursor = encode_cursor(
+        {"sort": "created_at", "key": CREATED_AT.isoformat(), "id": 7}
+    )
+
+    assert decode_sort_cursor(cursor, TaskSortField.CREATED_AT) == (CREATED_AT, 7)
+    assert decode_sort_cursor(
+        encode_cursor({"sort": "id", "id": 7}), TaskSortField.ID
+    ) == (7,)
+
+
+@pytest.mark.parametrize(
+    "payload",
+    [
+        {"sort": "created_at", "key": "2026-10-17T12:00:00+00:00", "id": True},
+        {"sort": "created_at", "id": 7},
+        {"sort": "created_at", "key": 1, "id": 7},
+        {"sort": "created_at", "key": "yesterday", "id": 7},
+        {"sort": "completed_at", "key": "2026-10-17T12:00:00+00:00", "id": 7},
+    ],
+)
+def test_invalid_sort_cursor_is_rejected(payload):
+    with pytest.raises(ValueError):
+        decode_sort_cursor(encode_cursor(payload), TaskSortField.CREATED_AT)
+
+
+async def test_filtered_page_continues_after_cursor():
+    session = StubSession([task_row(3), task_row(5)], [])
+    crud = make_crud(session)
+    filters = TaskFilter(status=[Status.BACKLOG])
+
+    page = await crud.get_filtered(
+        filters, TaskSortField.CREATED_AT, descending=True, limit=1
+    )
+    assert [task["id"] for task in page["items"]] == [3]
+    assert decode_cursor(page["next_cursor"]) == {
+        "sort": "created_at",
+        "id": 3,
+        "key": CREATED_AT.isoformat(),
+    }
+
+    await crud.get_filtered(
+        filters,
+        TaskSortField.CREATED_AT,
+        descending=True,
+        limit=1,
+        cursor=page["next_cursor"],
+    )
+
+    first, second = (compile_sql(stmt) for stmt in session.statements)
+    assert "tasks.status IN ('backlog')" in first
+    assert "ORDER BY tasks.created_at DESC, tasks.id DESC" in first
+    assert "(tasks.created_at, tasks.id) <" not in first
+    # Диапазон по самому полю позволяет использовать его индекс
+    assert "(tasks.created_at, tasks.id) < ('2026-10-17 12:00:00+00:00', 3)" in second
+    assert "tasks.created_at <= '2026-10-17 12:00:00+00:00'" in second
+    assert "LIMIT 2" in second
+
+
+async def test_filtered_by_id_compares_id_only():
+    session = StubSession([])
+    crud = make_crud(session)
+
+    await crud.get_filtered(
+        TaskFilter(),
+        TaskSortField.ID,
+        descending=False,
+        limit=10,
+        cursor=encode_cursor({"sort": "id", "id": 7}),
+    )
+
+    sql = compile_sql(session.statements[0])
+    assert "(tasks.id) > (7)" in sql
+    assert "ORDER BY tasks.id" in sql
+
+
+async def test_transition_by_ids_reports_skipped_tasks():
+    session = StubSession([3])
+    crud = make_crud(session)
+
+    result = await crud.transition_status(
+        TaskStatusTransition(ids=[3, 4], status=Status.DONE)
+    )
+
+    assert result["ids"] == [3]
+    assert result["skipped"] == [4]
+    sql = str(session.statements[0].compile(dialect=postgresql.dialect()))
+    assert sql.startswith("WITH moved AS \n(UPDATE tasks SET status=")
+    assert "WHERE tasks.id = ANY (%(ids)s::INTEGER[]) AND tasks.status !=" in sql
+    assert "RETURNING tasks.id" in sql
+    # События пишутся тем же выражением
+    assert "events AS \n(INSERT INTO outbox_events" in sql
+    assert "FROM moved ORDER BY moved.id" in sql
+
+
+async def test_transition_by_filter_uses_filter_clauses():
+    session = StubSession([])
+    crud = make_crud(session)
+
+    result = await crud.transition_status(
+        TaskStatusTransition(filter=TaskFilter(label="ops"), status=Status.DONE)
+    )
+
+    assert result["ids"] == [] and "skipped" not in result
+    sql = str(session.statements[0].compile(dialect=postgresql.dialect()))
+    assert "WHERE tasks.label = %(label_1)s AND tasks.status !=" in sql
@@ -1,3 +1,17 @@
-__all__ = ("camel_case_to_snake_case",)
+__all__ = (
+    "camel_case_to_snake_case",
+    "encode_cursor",
+    "decode_cursor",
+    "decode_id_cursor",
+    "build_page",
+    "contains_pattern",
+)
 
 from .case_converter import camel_case_to_snake_case
+from .pagination import (
+    encode_cursor,
+    decode_cursor,
+    decode_id_cursor,
+    build_page,
+)
+from .search import contains_pattern
@@ -0,0 +1,79 @@
+import base64
+import binascii
+import json
+from typing import Any, Callable, Sequence, TypeVar
+
+T = TypeVar("T")
+
+
+def encode_cursor(payload: dict[str, Any]) -> str:
+    """
+    Кодирование позиции keyset-пагинации в непрозрачный курсор.
+
+    >>> encode_cursor({"id": 42})
+    'eyJpZCI6NDJ9'
+    """
+    raw = json.dumps(payload, separators=(",", ":"), default=str).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str) -> dict[str, Any]:
+    """
+    Декодирование курсора, полученного от клиента.
+
+    >>> decode_cursor("eyJpZCI6NDJ9")
+    {'id': 42}
+
+    :raises ValueError: если курсор поврежден
+    """
+    padded = cursor + "=" * (-len(cursor) % 4)
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+    except (binascii.Error, UnicodeDecodeError, json.JSONDecodeError) as exc:
+        raise ValueError("Invalid cursor") from exc
+
+    if not isinstance(payload, dict):
+        raise ValueError("Invalid cursor")
+    return payload
+
+
+def decode_id_cursor(cursor: str | None) -> int | None:
+    """
+    Получение идентификатора последней записи предыдущей страницы.
+
+    :param cursor: курсор или None для первой страницы
+    :return: идентификатор, после которого начинается страница
+    :raises ValueError: если курсор поврежден
+    """
+    if cursor is None:
+        return None
+
+    last_id = decode_cursor(cursor).get("id")
+    # bool — подкласс int: {"id": true} не должен стать id = 1
+    if not isinstance(last_id, int) or isinstance(last_id, bool):
+        raise ValueError("Invalid cursor")
+    return last_id
+
+
+def build_page(
+    rows: Sequence[T],
+    limit: int,
+    cursor_of: Callable[[T], dict[str, Any]],
+) -> dict[str, Any]:
+    """
+    Формирование страницы из limit + 1 выбранных записей.
+
+    Лишняя запись лишь сигнализирует о наличии следующей страницы
+    и в ответ не попадает.
+
+    :param rows: записи, выбранные с ограничением limit + 1
+    :param limit: размер страницы
+    :param cursor_of: функция, возвращающая позицию записи для курсора
+    :return: словарь с ключами items и next_cursor
+    """
+    items = list(rows[:limit])
+    next_cursor = None
+    if len(rows) > limit and items:
+        next_cursor = encode_cursor(cursor_of(items[-1]))
+
+    return {"items": items, "next_cursor": next_cursor}
@@ -0,0 +1,12 @@
+def contains_pattern(query: str) -> str:
+    """
+    Построение шаблона (I)LIKE для поиска подстроки с экранированием
+    спецсимволов, чтобы «%» и «_» в запросе искались буквально.
+
+    >>> contains_pattern("design")
+    '%design%'
+    >>> contains_pattern("50%_off")
+    '%50\\\\%\\\\_off%'
+    """
+    escaped = query.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"